@@ -9,6 +9,7 @@ from jaclang.compiler.constant import Constants
 from jaclang.compiler.passes.main.schedules import py_code_gen_typed
 from jaclang.compiler.passes.tool.schedules import format_pass
 from jaclang.compiler.transpiler import jac_file_to_pass
+from jaclang.core import importer
 from jaclang.plugin.feature import JacFeature as Jac
 from jaclang.utils.lang_tools import AstTool
 
@@ -39,13 +40,16 @@ def format(filename: str, outfile: str = "") -> None:
 
 
 @cmd_registry.register
-def run(filename: str, main: bool = True) -> None:
+def run(filename: str, main: bool = True, optimize: int = 0) -> None:
     """Run the specified .jac file.
 
     :param filename: The path to the .jac file.
     :param main: If True, use '__main__' as the module name, else use the actual module name.
+    :param optimize: If set, lower default-only Jac features to inline Python.
     """
     if filename.endswith(".jac"):
+        if optimize:
+            importer.optimize = optimize
         base, mod = os.path.split(filename)
         base = base if base else "./"
         mod = mod[:-4]
@@ -19,6 +19,7 @@ class CodeGenTarget:
     jac: str = ""
     py_ast: Optional[ast3.AST | list[ast3.AST]] = None
     mypy_ast: list[MypyNode] = field(default_factory=lambda: [])
+    opt_level: int = 0
 
 
 class CodeLocInfo:
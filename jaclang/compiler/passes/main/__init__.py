@@ -7,11 +7,13 @@ from .def_use_pass import DefUsePass  # noqa: I100
 from .pyout_pass import PyOutPass  # noqa: I100
 from .pyast_load_pass import PyastBuildPass  # noqa: I100
 from .pyast_gen_pass import PyastGenPass  # noqa: I100
-from .schedules import py_code_gen  # noqa: I100
+from .intrinsic_pass import JacIntrinsicPass  # noqa: I100
+from .schedules import py_code_gen, py_code_gen_opt  # noqa: I100
 from .type_check_pass import JacTypeCheckPass  # noqa: I100
 
 
 pass_schedule = py_code_gen
+opt_pass_schedule = py_code_gen_opt
 
 __all__ = [
     "SubNodeTabPass",
@@ -23,4 +25,5 @@ __all__ = [
     "PyastBuildPass",
     "PyastGenPass",
     "JacTypeCheckPass",
+    "JacIntrinsicPass",
 ]
@@ -0,0 +1,248 @@
+"""Lower Jac feature calls to inline Python.
+
+This pass rewrites the Python AST produced by PyastGenPass. Calls of Jac
+features whose only registered implementation is the default one are
+replaced by the Python the default implementation would run: elvis becomes
+a walrus conditional, edge refs call edges_to_nodes on the node anchor, and
+assign comprehension statements become attribute assignment loops. Plugins
+registered after compilation do not see lowered calls, so this pass only
+runs in the optimizing schedule.
+"""
+import ast as ast3
+import hashlib
+import keyword
+import types
+from typing import Optional
+
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.constant import Constants as Con
+from jaclang.compiler.passes import Pass
+
+
+def default_only(feature: str) -> bool:
+    """Check if the default implementation is the only one of a feature."""
+    from jaclang.plugin.default import JacFeatureDefaults
+    from jaclang.plugin.feature import JacFeature
+
+    impls = getattr(JacFeature.pm.hook, feature).get_hookimpls()
+    return len(impls) == 1 and impls[0].plugin is JacFeatureDefaults
+
+
+def plugin_name(plugin: object) -> str:
+    """Get a name of a plugin that is the same across processes."""
+    if isinstance(plugin, types.ModuleType):
+        return plugin.__name__
+    cls = plugin if isinstance(plugin, type) else type(plugin)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def opt_tag(level: int) -> str:
+    """Get the file name suffix of output compiled at an optimization level.
+
+    Which calls are lowered depends on the plugins registered, so the suffix
+    holds a hash of them and output compiled under other plugins is not
+    reused.
+    """
+    if not level:
+        return ""
+    from jaclang.plugin.feature import JacFeature
+
+    names = sorted(plugin_name(i) for i in JacFeature.pm.get_plugins())
+    digest = hashlib.sha1("\n".join(names).encode()).hexdigest()[:10]
+    return f".opt-{level}-{digest}"
+
+
+class FeatureLowering(ast3.NodeTransformer):
+    """Rewrite feature calls of one module.
+
+    Walrus targets and temporaries are only introduced in module and function
+    scopes, never in class bodies or comprehensions where binding them would
+    change the namespace or be rejected by Python.
+    """
+
+    def __init__(self, features: set[str]) -> None:
+        """Create lowering of features."""
+        self.features = features
+        self.binds = True
+        self.temps = 0
+
+    def feature_call(self, node: ast3.AST) -> Optional[str]:
+        """Get the feature a node calls, if it is a plain positional call."""
+        if (
+            isinstance(node, ast3.Call)
+            and isinstance(node.func, ast3.Attribute)
+            and isinstance(node.func.value, ast3.Name)
+            and node.func.value.id == Con.JAC_FEATURE.value
+            and not node.keywords
+            and not any(isinstance(i, ast3.Starred) for i in node.args)
+        ):
+            return node.func.attr
+        return None
+
+    def visit_FunctionDef(self, node: ast3.FunctionDef) -> ast3.AST:  # noqa: N802
+        """Lower inside a function body."""
+        return self.in_scope(node, True)
+
+    def visit_AsyncFunctionDef(  # noqa: N802
+        self, node: ast3.AsyncFunctionDef
+    ) -> ast3.AST:
+        """Lower inside an async function body."""
+        return self.in_scope(node, True)
+
+    def visit_ClassDef(self, node: ast3.ClassDef) -> ast3.AST:  # noqa: N802
+        """Do not introduce names in class bodies."""
+        return self.in_scope(node, False)
+
+    def visit_Lambda(self, node: ast3.Lambda) -> ast3.AST:  # noqa: N802
+        """Lower inside a lambda body."""
+        return self.in_scope(node, True)
+
+    def visit_ListComp(self, node: ast3.ListComp) -> ast3.AST:  # noqa: N802
+        """Do not introduce names in comprehension scopes."""
+        return self.in_scope(node, False)
+
+    visit_SetComp = visit_ListComp  # noqa: N815
+    visit_DictComp = visit_ListComp  # noqa: N815
+    visit_GeneratorExp = visit_ListComp  # noqa: N815
+
+    def in_scope(self, node: ast3.AST, binds: bool) -> ast3.AST:
+        """Visit node, introducing names in it only if binds."""
+        outer = self.binds
+        self.binds = binds
+        try:
+            return self.generic_visit(node)
+        finally:
+            self.binds = outer
+
+    def visit_Call(self, node: ast3.Call) -> ast3.AST:  # noqa: N802
+        """Lower elvis and edge ref calls."""
+        self.generic_visit(node)
+        feature = self.feature_call(node)
+        if feature not in self.features:
+            return node
+        if feature == "elvis" and self.binds and len(node.args) == 2:
+            tmp = "__jac_elvis"
+            lowered: ast3.AST = ast3.IfExp(
+                test=ast3.Compare(
+                    left=ast3.NamedExpr(
+                        target=ast3.Name(id=tmp, ctx=ast3.Store()), value=node.args[0]
+                    ),
+                    ops=[ast3.IsNot()],
+                    comparators=[ast3.Constant(value=None)],
+                ),
+                body=ast3.Name(id=tmp, ctx=ast3.Load()),
+                orelse=node.args[1],
+            )
+        elif feature == "edge_ref" and len(node.args) == 4:
+            lowered = ast3.Call(
+                func=ast3.Attribute(
+                    value=ast3.Attribute(
+                        value=node.args[0], attr="_jac_", ctx=ast3.Load()
+                    ),
+                    attr="edges_to_nodes",
+                    ctx=ast3.Load(),
+                ),
+                args=node.args[1:],
+                keywords=[],
+            )
+        else:
+            return node
+        return ast3.copy_location(lowered, node)
+
+    def visit_Expr(self, node: ast3.Expr) -> ast3.AST | list[ast3.stmt]:  # noqa: N802
+        """Lower assign comprehension statements to loops."""
+        self.generic_visit(node)
+        stmts = self.assign_loop(node.value)
+        return node if stmts is None else [ast3.copy_location(i, node) for i in stmts]
+
+    def visit_Assign(  # noqa: N802
+        self, node: ast3.Assign
+    ) -> ast3.AST | list[ast3.stmt]:
+        """Lower assignments of assign comprehensions to loops."""
+        self.generic_visit(node)
+        stmts = self.assign_loop(node.value)
+        if stmts is None:
+            return node
+        node.value = ast3.Name(id=self.target(), ctx=ast3.Load())
+        return [ast3.copy_location(i, node) for i in stmts] + [node]
+
+    def target(self) -> str:
+        """Get the name of the latest assign comprehension target."""
+        return f"__jac_target{self.temps}"
+
+    def assign_loop(self, call: ast3.expr) -> Optional[list[ast3.stmt]]:
+        """Get statements setting attributes as an assign comprehension does."""
+        if (
+            not self.binds
+            or "assign_compr" not in self.features
+            or self.feature_call(call) != "assign_compr"
+        ):
+            return None
+        assert isinstance(call, ast3.Call)
+        if len(call.args) != 2:
+            return None
+        attr_val = call.args[1]
+        if not (
+            isinstance(attr_val, ast3.Tuple)
+            and len(attr_val.elts) == 2
+            and all(isinstance(i, ast3.Tuple) for i in attr_val.elts)
+        ):
+            return None
+        keys, values = attr_val.elts  # type: ignore[union-attr]
+        names = [i.value for i in keys.elts if isinstance(i, ast3.Constant)]
+        if len(names) != len(keys.elts) or not all(
+            isinstance(i, str) and i.isidentifier() and not keyword.iskeyword(i)
+            for i in names
+        ):
+            return None
+        self.temps += 1
+        target = self.target()
+        obj = f"__jac_obj{self.temps}"
+        vals = [f"__jac_val{self.temps}_{i}" for i in range(len(names))]
+        # Target then values are evaluated once, as for the runtime call.
+        return [
+            ast3.Assign(
+                targets=[ast3.Name(id=target, ctx=ast3.Store())], value=call.args[0]
+            ),
+            *(
+                ast3.Assign(targets=[ast3.Name(id=name, ctx=ast3.Store())], value=val)
+                for name, val in zip(vals, values.elts)
+            ),
+            ast3.For(
+                target=ast3.Name(id=obj, ctx=ast3.Store()),
+                iter=ast3.Name(id=target, ctx=ast3.Load()),
+                body=[
+                    ast3.Assign(
+                        targets=[
+                            ast3.Attribute(
+                                value=ast3.Name(id=obj, ctx=ast3.Load()),
+                                attr=attr,
+                                ctx=ast3.Store(),
+                            )
+                        ],
+                        value=ast3.Name(id=name, ctx=ast3.Load()),
+                    )
+                    for attr, name in zip(names, vals)
+                ],
+                orelse=[],
+            ),
+        ]
+
+
+class JacIntrinsicPass(Pass):
+    """Lower default-only Jac feature calls to inline Python."""
+
+    lowered = ("elvis", "edge_ref", "assign_compr")
+    level = 1
+
+    def enter_module(self, node: ast.Module) -> None:
+        """Lower feature calls of a module and the modules it imports."""
+        features = {i for i in self.lowered if default_only(i)}
+        for mod in [node, *self.get_all_sub_nodes(node, ast.Module)]:
+            if isinstance(mod.gen.py_ast, ast3.Module):
+                mod.gen.py_ast = ast3.fix_missing_locations(
+                    FeatureLowering(features).visit(mod.gen.py_ast)
+                )
+                mod.gen.py = ast3.unparse(mod.gen.py_ast)
+            mod.gen.opt_level = self.level
+        self.terminate()
@@ -12,6 +12,31 @@ from jaclang.compiler.passes import Pass
 
 T = TypeVar("T", bound=ast3.AST)
 
+# Comparisons filter comprehensions pass to the filter_compr feature.
+COMPARE_SYMS: dict[type[ast3.cmpop], str] = {
+    ast3.Eq: "==",
+    ast3.NotEq: "!=",
+    ast3.Lt: "<",
+    ast3.LtE: "<=",
+    ast3.Gt: ">",
+    ast3.GtE: ">=",
+    ast3.Is: "is",
+    ast3.IsNot: "is not",
+    ast3.In: "in",
+    ast3.NotIn: "not in",
+}
+
+
+def plain_operand(node: ast3.expr) -> bool:
+    """Check if an operand is a name or literal, safe to evaluate up front."""
+    if isinstance(node, (ast3.Constant, ast3.Name)):
+        return True
+    if isinstance(node, ast3.UnaryOp) and isinstance(node.op, (ast3.USub, ast3.UAdd)):
+        return isinstance(node.operand, ast3.Constant)
+    if isinstance(node, (ast3.List, ast3.Tuple, ast3.Set)):
+        return all(plain_operand(i) for i in node.elts)
+    return False
+
 
 class PyastGenPass(Pass):
     """Jac blue transpilation to python pass."""
@@ -1452,7 +1477,7 @@ class PyastGenPass(Pass):
                     args=[
                         node.left.gen.py_ast,
                         node.right.gen.py_ast,
-                        node.op.gen.py_ast,
+                        *node.op.gen.py_ast,
                     ],
                     keywords=[],
                 )
@@ -2019,43 +2044,75 @@ class PyastGenPass(Pass):
                         ctx=ast3.Load(),
                     )
                 ),
-                args=[
-                    loc,
-                    self.sync(
+                args=[loc, *self.translate_edge_op_ref_args(node)],
+                keywords=[],
+            )
+        )
+        return ret
+
+    def translate_edge_op_ref_args(self, node: ast.EdgeOpRef) -> list[ast3.AST]:
+        """Generate ast for edge direction, filter type and filter args."""
+        return [
+            self.sync(
+                ast3.Attribute(
+                    value=self.sync(
                         ast3.Attribute(
                             value=self.sync(
-                                ast3.Attribute(
-                                    value=self.sync(
-                                        ast3.Name(
-                                            id=Con.JAC_FEATURE.value, ctx=ast3.Load()
-                                        )
-                                    ),
-                                    attr="EdgeDir",
-                                    ctx=ast3.Load(),
-                                )
+                                ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
                             ),
-                            attr=node.edge_dir.name,
+                            attr="EdgeDir",
                             ctx=ast3.Load(),
                         )
                     ),
-                    node.filter_type.gen.py_ast
-                    if node.filter_type
-                    else self.sync(ast3.Constant(value=None)),
-                    node.filter_cond.gen.py_ast
-                    if node.filter_cond
-                    else self.sync(ast3.Constant(value=None)),
-                ],
+                    attr=node.edge_dir.name,
+                    ctx=ast3.Load(),
+                )
+            ),
+            node.filter_type.gen.py_ast
+            if node.filter_type
+            else self.sync(ast3.Constant(value=None)),
+            self.translate_edge_filter(node.filter_cond)
+            if node.filter_cond
+            else self.sync(ast3.Constant(value=None)),
+        ]
+
+    def translate_edge_filter(self, node: ast.FilterCompr) -> ast3.AST:
+        """Generate ast for an edge ref filter.
+
+        Filters of plain comparisons go through the edge_filter feature,
+        which keeps the comparisons visible to edge indexes.
+        """
+        lam = node.gen.py_ast
+        body = lam.body if isinstance(lam, ast3.Lambda) else None
+        if not (
+            isinstance(body, ast3.Call)
+            and isinstance(body.func, ast3.Attribute)
+            and body.func.attr == "filter_compr"
+        ):
+            return lam
+        return self.sync(
+            ast3.Call(
+                func=self.sync(
+                    ast3.Attribute(
+                        value=self.sync(
+                            ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
+                        ),
+                        attr="edge_filter",
+                        ctx=ast3.Load(),
+                    )
+                ),
+                args=[body.args[1]],
                 keywords=[],
-            )
+            ),
+            jac_node=node,
         )
-        return ret
 
     def exit_disconnect_op(self, node: ast.DisconnectOp) -> None:
         """Sub objects.
 
         edge_spec: EdgeOpRef,
         """
-        node.gen.py_ast = node.edge_spec.gen.py_ast
+        node.gen.py_ast = self.translate_edge_op_ref_args(node.edge_spec)
 
     def exit_connect_op(self, node: ast.ConnectOp) -> None:
         """Sub objects.
@@ -2109,6 +2166,64 @@ class PyastGenPass(Pass):
 
         compares: SubNodeList[BinaryExpr],
         """
+        compares = [x.gen.py_ast for x in node.compares.items]
+        # filter_compr gets operands evaluated once, so operands that may have
+        # side effects stay in a comprehension evaluating them per element.
+        if all(
+            len(x.ops) == 1
+            and type(x.ops[0]) in COMPARE_SYMS
+            and plain_operand(x.comparators[0])
+            for x in compares
+        ):
+            self.needs_jac_feature()
+            body = self.sync(
+                ast3.Call(
+                    func=self.sync(
+                        ast3.Attribute(
+                            value=self.sync(
+                                ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
+                            ),
+                            attr="filter_compr",
+                            ctx=ast3.Load(),
+                        )
+                    ),
+                    args=[
+                        self.sync(ast3.Name(id="x", ctx=ast3.Load())),
+                        self.sync(
+                            ast3.Tuple(
+                                elts=[
+                                    self.sync(
+                                        ast3.Tuple(
+                                            elts=[
+                                                self.sync(
+                                                    ast3.Constant(value=x.left.id),
+                                                    jac_node=jx,
+                                                ),
+                                                self.sync(
+                                                    ast3.Constant(
+                                                        value=COMPARE_SYMS[
+                                                            type(x.ops[0])
+                                                        ]
+                                                    ),
+                                                    jac_node=jx,
+                                                ),
+                                                x.comparators[0],
+                                            ],
+                                            ctx=ast3.Load(),
+                                        ),
+                                        jac_node=jx,
+                                    )
+                                    for x, jx in zip(compares, node.compares.items)
+                                ],
+                                ctx=ast3.Load(),
+                            )
+                        ),
+                    ],
+                    keywords=[],
+                )
+            )
+        else:
+            body = self.filter_listcomp(node)
         node.gen.py_ast = self.sync(
             ast3.Lambda(
                 args=self.sync(
@@ -2120,45 +2235,45 @@ class PyastGenPass(Pass):
                         defaults=[],
                     )
                 ),
-                body=self.sync(
-                    ast3.ListComp(
-                        elt=self.sync(ast3.Name(id="i", ctx=ast3.Load())),
-                        generators=[
-                            self.sync(
-                                ast3.comprehension(
-                                    target=self.sync(
-                                        ast3.Name(id="i", ctx=ast3.Store())
-                                    ),
-                                    iter=self.sync(ast3.Name(id="x", ctx=ast3.Load())),
-                                    ifs=[
-                                        self.sync(
-                                            ast3.Compare(
-                                                left=self.sync(
-                                                    ast3.Attribute(
-                                                        value=self.sync(
-                                                            ast3.Name(
-                                                                id="i", ctx=ast3.Load()
-                                                            ),
-                                                            jac_node=x,
-                                                        ),
-                                                        attr=x.gen.py_ast.left.id,
-                                                        ctx=ast3.Load(),
-                                                    ),
+                body=body,
+            )
+        )
+
+    def filter_listcomp(self, node: ast.FilterCompr) -> ast3.ListComp:
+        """Filter x with a list comprehension, for chained comparisons."""
+        return self.sync(
+            ast3.ListComp(
+                elt=self.sync(ast3.Name(id="i", ctx=ast3.Load())),
+                generators=[
+                    self.sync(
+                        ast3.comprehension(
+                            target=self.sync(ast3.Name(id="i", ctx=ast3.Store())),
+                            iter=self.sync(ast3.Name(id="x", ctx=ast3.Load())),
+                            ifs=[
+                                self.sync(
+                                    ast3.Compare(
+                                        left=self.sync(
+                                            ast3.Attribute(
+                                                value=self.sync(
+                                                    ast3.Name(id="i", ctx=ast3.Load()),
                                                     jac_node=x,
                                                 ),
-                                                ops=x.gen.py_ast.ops,
-                                                comparators=x.gen.py_ast.comparators,
+                                                attr=x.gen.py_ast.left.id,
+                                                ctx=ast3.Load(),
                                             ),
                                             jac_node=x,
-                                        )
-                                        for x in node.compares.items
-                                    ],
-                                    is_async=0,
+                                        ),
+                                        ops=x.gen.py_ast.ops,
+                                        comparators=x.gen.py_ast.comparators,
+                                    ),
+                                    jac_node=x,
                                 )
-                            )
-                        ],
+                                for x in node.compares.items
+                            ],
+                            is_async=0,
+                        )
                     )
-                ),
+                ],
             )
         )
 
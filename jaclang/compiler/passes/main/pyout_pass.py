@@ -12,6 +12,7 @@ import os
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.constant import Constants as Con
 from jaclang.compiler.passes import Pass
+from jaclang.compiler.passes.main.intrinsic_pass import opt_tag
 
 
 class PyOutPass(Pass):
@@ -79,6 +80,7 @@ class PyOutPass(Pass):
         base_name, _ = os.path.splitext(file_name)
         out_dir = os.path.join(gen_path, mod_dir)
         os.makedirs(out_dir, exist_ok=True)
+        base_name += opt_tag(node.gen.opt_level)
         out_path_py = os.path.join(out_dir, f"{base_name}.py")
         out_path_pyc = os.path.join(out_dir, f"{base_name}.jbc")
         return node.loc.mod_path, out_path_py, out_path_pyc
@@ -13,6 +13,7 @@ from .def_use_pass import DefUsePass  # noqa: I100
 from .pyout_pass import PyOutPass  # noqa: I100
 from .pyast_gen_pass import PyastGenPass  # noqa: I100
 from .type_check_pass import JacTypeCheckPass  # noqa: I100
+from .intrinsic_pass import JacIntrinsicPass  # noqa: I100
 
 py_code_gen = [
     SubNodeTabPass,
@@ -28,6 +29,11 @@ py_code_gen_typed = [
     JacTypeCheckPass,
 ]
 
+py_code_gen_opt = [
+    *py_code_gen,
+    JacIntrinsicPass,
+]
+
 py_compiler = [
     *py_code_gen,
     PyOutPass,
@@ -0,0 +1,96 @@
+"""Test intrinsic lowering pass module."""
+import io
+import os
+import sys
+from unittest import mock
+
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.passes.main.intrinsic_pass import opt_tag
+from jaclang.compiler.passes.main.schedules import py_code_gen, py_code_gen_opt
+from jaclang.compiler.transpiler import jac_file_to_pass
+from jaclang.core.construct import root
+from jaclang.core.importer import env_optimize
+from jaclang.plugin.default import hookimpl
+from jaclang.plugin.feature import JacFeature
+from jaclang.utils.test import TestCase
+
+
+class ElvisPlugin:
+    """Plugin overriding elvis."""
+
+    @staticmethod
+    @hookimpl
+    def elvis(op1: object, op2: object) -> object:
+        """Treat falsy values as missing."""
+        return op1 or op2
+
+
+class JacIntrinsicPassTests(TestCase):
+    """Test pass module."""
+
+    def compile(self, schedule: list) -> ast.Module:
+        """Compile the intrinsics fixture."""
+        code_gen = jac_file_to_pass(
+            self.fixture_abs_path("intrinsics.jac"), schedule=schedule
+        )
+        self.assertFalse(code_gen.errors_had)
+        assert isinstance(code_gen.ir, ast.Module)
+        return code_gen.ir
+
+    def run_module(self, mod: ast.Module) -> str:
+        """Run a compiled module on an empty root and get its output."""
+        root._jac_.out_edges = None
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        try:
+            exec(compile(mod.gen.py_ast, mod.loc.mod_path, "exec"), {})
+        finally:
+            sys.stdout = sys.__stdout__
+            root._jac_.out_edges = None
+        return captured_output.getvalue()
+
+    def test_default_features_lowered(self) -> None:
+        """Default-only features are replaced by inline Python."""
+        mod = self.compile(py_code_gen_opt)
+        self.assertEqual(mod.gen.opt_level, 1)
+        self.assertNotIn("_Jac.edge_ref(", mod.gen.py)
+        self.assertNotIn("_Jac.assign_compr(", mod.gen.py)
+        self.assertIn("._jac_.edges_to_nodes(", mod.gen.py)
+        self.assertIn("(__jac_elvis := None) is not None", mod.gen.py)
+        # Comprehension scopes keep the feature call.
+        self.assertIn("[_Jac.elvis(i, -1) for i in", mod.gen.py)
+
+    def test_lowered_output_unchanged(self) -> None:
+        """Lowered code behaves as the feature calls it replaces."""
+        plain = self.run_module(self.compile(py_code_gen))
+        self.assertEqual(plain, self.run_module(self.compile(py_code_gen_opt)))
+        self.assertIn("[(0, 'kid'), (1, 'kid'), (9, 'heavy'), (9, 'heavy')]", plain)
+        self.assertIn("2 left [-1, 2]", plain)
+
+    def test_plugin_features_kept(self) -> None:
+        """Features with plugin implementations are not lowered."""
+        JacFeature.pm.register(ElvisPlugin)
+        try:
+            mod = self.compile(py_code_gen_opt)
+        finally:
+            JacFeature.pm.unregister(ElvisPlugin)
+        self.assertIn("_Jac.elvis(None, 'left')", mod.gen.py)
+        self.assertNotIn("_Jac.edge_ref(", mod.gen.py)
+
+    def test_output_keyed_by_plugins(self) -> None:
+        """Optimized output is cached apart per set of registered plugins."""
+        self.assertEqual(opt_tag(0), "")
+        tag = opt_tag(1)
+        self.assertTrue(tag.startswith(".opt-1-"))
+        JacFeature.pm.register(ElvisPlugin)
+        try:
+            self.assertNotEqual(opt_tag(1), tag)
+        finally:
+            JacFeature.pm.unregister(ElvisPlugin)
+        self.assertEqual(opt_tag(1), tag)
+
+    def test_env_optimize(self) -> None:
+        """JAC_OPTIMIZE values that are not integers are ignored."""
+        for value, level in (("", 0), ("1", 1), ("fast", 0)):
+            with mock.patch.dict(os.environ, {"JAC_OPTIMIZE": value}):
+                self.assertEqual(env_optimize(), level)
@@ -45,6 +45,26 @@ class PyastGenPassTests(TestCaseMicroSuite, AstSyncTestMixin):
         #     exec(compile(code_gen.ir.gen.py_ast, "<string>", "exec"))
         self.assertFalse(code_gen.errors_had)
 
+    def test_filter_compr_operands(self) -> None:
+        """Only filters on plain operands evaluate them up front."""
+        code_gen = jac_file_to_pass(
+            self.fixture_abs_path("filter_args.jac"), target=PyastGenPass
+        )
+        self.assertFalse(code_gen.errors_had)
+        py = ast3.unparse(code_gen.ir.gen.py_ast)
+        self.assertIn("filter_compr(x, (('x', '<', low), ('y', '>', -1),", py)
+        self.assertNotIn("limit(9)))", py)
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        try:
+            exec(compile(code_gen.ir.gen.py_ast, "<ast>", "exec"), {})
+        finally:
+            sys.stdout = sys.__stdout__
+        self.assertEqual(
+            captured_output.getvalue().splitlines(),
+            ["[(1, 1), (2, 2), (3, 0)]", "[]", "[]", "[9, 9, 9, 9, 9, 9]"],
+        )
+
     def test_circle_py_ast(self) -> None:
         """Basic test for pass."""
         code_gen = jac_file_to_pass(
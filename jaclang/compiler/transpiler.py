@@ -4,17 +4,25 @@ from typing import Optional, Type
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.parser import JacParser
 from jaclang.compiler.passes import Pass
-from jaclang.compiler.passes.main import PyOutPass, pass_schedule
+from jaclang.compiler.passes.main import (
+    PyOutPass,
+    opt_pass_schedule,
+    pass_schedule,
+)
 from jaclang.compiler.passes.tool import JacFormatPass
 from jaclang.compiler.passes.tool.schedules import format_pass
 from jaclang.compiler.passes.transform import Alert
 
 
-def transpile_jac(file_path: str) -> list[Alert]:
-    """Transpiler Jac file and return python code as string."""
+def transpile_jac(file_path: str, optimize: int = 0) -> list[Alert]:
+    """Transpiler Jac file and return python code as string.
+
+    With optimize set, feature calls are lowered to inline Python and the
+    output is cached apart from unoptimized output.
+    """
     code = jac_file_to_pass(
         file_path=file_path,
-        schedule=pass_schedule,
+        schedule=opt_pass_schedule if optimize else pass_schedule,
     )
     if isinstance(code.ir, ast.Module) and not code.errors_had:
         print_pass = PyOutPass(input_ir=code.ir, prior=code)
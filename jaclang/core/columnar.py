@@ -0,0 +1,301 @@
+"""Columnar field storage for Jac node architypes.
+
+Node types made with columnar=True keep their int, float and bool fields
+in one array.array column per field instead of on each node. Nodes hold
+their row in a ColumnAnchor and the fields become Column descriptors
+reading and writing that row, so node objects act as index proxies. Rows
+of collected nodes are reused.
+
+filter_compr compiles its comparisons into one list comprehension per
+shape, reading columns by row when the nodes share a columnar type. With
+NumPy installed, large sets of such nodes are instead filtered with one
+vectorised comparison per column, and only comparisons on other fields
+run per node. assign_compr writes columnar nodes column by column.
+"""
+from __future__ import annotations
+
+import operator
+from array import array
+from dataclasses import MISSING, dataclass, fields
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+from jaclang.core.construct import NodeAnchor, NodeArchitype
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Field annotation to array typecode. int columns hold 64 bit integers.
+TYPECODES = {"int": "q", "float": "d", "bool": "b"}
+
+COMPARE_OPS: dict[str, Callable[[Any, Any], Any]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "is": operator.is_,
+    "is not": operator.is_not,
+    "in": lambda a, b: a in b,
+    "not in": lambda a, b: a not in b,
+}
+
+# Column values are plain numbers, so identity tests go through objects.
+COLUMN_OPS = {"==", "!=", "<", "<=", ">", ">="}
+
+# Smallest number of columnar nodes filtered with NumPy, below which
+# building arrays costs more than comparing node by node.
+BATCH_MIN = 512
+
+
+@dataclass(eq=False, slots=True)
+class ColumnAnchor(NodeAnchor):
+    """Node anchor holding the column row of its node."""
+
+    row: int = -1
+
+    def __del__(self) -> None:
+        """Give the row back to the column store."""
+        store = getattr(type(self.obj), "_jac_columns_", None)
+        if store is not None and self.row >= 0:
+            store.free.append(self.row)
+
+
+class Column:
+    """Field descriptor reading and writing a column of a ColumnStore."""
+
+    __slots__ = ("name", "values", "store")
+
+    def __init__(self, name: str, values: array, store: ColumnStore) -> None:
+        """Create descriptor of column values."""
+        self.name = name
+        self.values = values
+        self.store = store
+
+    def __get__(self, obj: Any, owner: type) -> Any:  # noqa: ANN401
+        """Get the field value of obj."""
+        if obj is None:
+            return self
+        return self.values[obj._jac_.row]
+
+    def __set__(self, obj: Any, value: Any) -> None:  # noqa: ANN401
+        """Set the field value of obj."""
+        try:
+            row = obj._jac_.row
+        except AttributeError:
+            # Nodes restored without running __init__ get a row on first set.
+            row = self.store.adopt(obj).row
+        self.values[row] = value
+
+
+class BoolColumn(Column):
+    """Column of bool fields, stored as bytes."""
+
+    __slots__ = ()
+
+    def __get__(self, obj: Any, owner: type) -> Any:  # noqa: ANN401
+        """Get the field value of obj."""
+        if obj is None:
+            return self
+        return bool(self.values[obj._jac_.row])
+
+
+class ColumnStore:
+    """Columns of the scalar fields of one node architype."""
+
+    def __init__(self, typecodes: dict[str, str]) -> None:
+        """Create empty columns of the given typecodes."""
+        self.columns = {name: array(code) for name, code in typecodes.items()}
+        self.free: list[int] = []
+        self.rows = 0
+
+    def __len__(self) -> int:
+        """Get the number of live rows."""
+        return self.rows - len(self.free)
+
+    def alloc(self) -> int:
+        """Get a row for a new node."""
+        if self.free:
+            return self.free.pop()
+        for col in self.columns.values():
+            col.append(0)
+        self.rows += 1
+        return self.rows - 1
+
+    def anchor(self, obj: NodeArchitype) -> ColumnAnchor:
+        """Create the anchor of a new node."""
+        return ColumnAnchor(obj=obj, row=self.alloc())
+
+    def adopt(self, obj: NodeArchitype) -> ColumnAnchor:
+        """Give a node without a row one, keeping its edges."""
+        old = getattr(obj, "_jac_", None)
+        anchor = self.anchor(obj)
+        if old is not None:
+            anchor.in_edges, anchor.out_edges = old.in_edges, old.out_edges
+            anchor.jid, anchor.store = old.jid, old.store
+        obj._jac_ = anchor
+        return anchor
+
+
+def make_columnar(cls: type) -> ColumnStore:
+    """Move the int, float and bool fields of a node dataclass to columns.
+
+    Fields without a default, or with a default of their type, are moved.
+    The returned store is also kept as cls._jac_columns_.
+    """
+    typecodes: dict[str, str] = {}
+    for f in fields(cls):
+        name = f.type if isinstance(f.type, str) else getattr(f.type, "__name__", "")
+        code = TYPECODES.get(name)
+        if (
+            code
+            and f.default_factory is MISSING
+            and (f.default is MISSING or type(f.default).__name__ == name)
+        ):
+            typecodes[f.name] = code
+    store = ColumnStore(typecodes)
+    for name, values in store.columns.items():
+        col_cls = BoolColumn if values.typecode == "b" else Column
+        setattr(cls, name, col_cls(name, values, store))
+    cls._jac_columns_ = store
+    return store
+
+
+def column_store(items: Sequence[Any]) -> Optional[ColumnStore]:
+    """Get the column store of items if they are nodes of one columnar type."""
+    if not items:
+        return None
+    cls = items[0].__class__
+    store = cls.__dict__.get("_jac_columns_")
+    if store is None or operator.countOf(map(type, items), cls) != len(items):
+        return None
+    return store
+
+
+def compile_filter(
+    names: tuple[str, ...], ops: tuple[str, ...], columns: tuple[bool, ...]
+) -> Callable[..., list[Any]]:
+    """Compile a list comprehension testing each name against an argument.
+
+    Names flagged in columns are read from column arguments at the row of
+    the node, the rest as attributes. The result takes the items, then the
+    columns, then one value per name.
+    """
+    tests = [
+        f"{f'c{k}[r]' if col else f'i.{name}'} {op} v{k}"
+        for k, (name, op, col) in enumerate(zip(names, ops, columns))
+    ]
+    rows = " for r in (i._jac_.row,)" if any(columns) else ""
+    args = ["x"]
+    args += [f"c{k}" for k, col in enumerate(columns) if col]
+    args += [f"v{k}" for k in range(len(names))]
+    src = f"lambda {', '.join(args)}: [i for i in x{rows} if {' if '.join(tests)}]"
+    return eval(src)
+
+
+FILTERS: dict[tuple, Callable[..., list[Any]]] = {}
+
+
+def filter_compr(
+    items: Iterable[Any], conds: tuple[tuple[str, str, Any], ...]
+) -> list[Any]:
+    """Get items whose fields compare true with all of (field, op, value).
+
+    The comparisons are compiled once per shape of conds and item type, so
+    filtering runs as one list comprehension, or as column comparisons for
+    large sets of columnar nodes.
+    """
+    items = items if isinstance(items, list) else list(items)
+    if not conds:
+        return list(items)
+    names, ops, values = zip(*conds)
+    store = column_store(items)
+    if store is not None and numpy is not None and len(items) >= BATCH_MIN:
+        return batch_filter(items, store, names, ops, values)
+    return compiled_filter(items, store, names, ops, values)
+
+
+def compiled_filter(
+    items: list[Any],
+    store: Optional[ColumnStore],
+    names: tuple[str, ...],
+    ops: tuple[str, ...],
+    values: tuple[Any, ...],
+) -> list[Any]:
+    """Filter items with the comprehension compiled for their comparisons."""
+    cols = [
+        store.columns.get(name) if store is not None and op in COLUMN_OPS else None
+        for name, op in zip(names, ops)
+    ]
+    columns = tuple(col is not None for col in cols)
+    key = (names, ops, columns)
+    test = FILTERS.get(key)
+    if test is None:
+        if any(op not in COMPARE_OPS for op in ops) or not all(
+            name.isidentifier() for name in names
+        ):
+            raise ValueError(f"Cannot filter on {tuple(zip(names, ops, values))!r}")
+        test = FILTERS[key] = compile_filter(*key)
+    return test(items, *(col for col in cols if col is not None), *values)
+
+
+def batch_filter(
+    items: list[Any],
+    store: ColumnStore,
+    names: tuple[str, ...],
+    ops: tuple[str, ...],
+    values: tuple[Any, ...],
+) -> list[Any]:
+    """Filter columnar nodes with NumPy over the rows of their columns.
+
+    Column comparisons build one mask, the remaining comparisons then run
+    on the nodes it keeps.
+    """
+    rows = numpy.frombuffer(array("q", [i._jac_.row for i in items]), numpy.int64)
+    mask = None
+    rest = []
+    for name, op, value in zip(names, ops, values):
+        col = store.columns.get(name) if op in COLUMN_OPS else None
+        if col is None:
+            rest.append((name, op, value))
+            continue
+        # The view is dropped right away, the column must stay resizable.
+        vals = numpy.frombuffer(col, col.typecode)[rows]
+        hits = COMPARE_OPS[op](vals, value)
+        mask = hits if mask is None else mask & hits
+    if mask is not None:
+        items = [items[k] for k in numpy.flatnonzero(mask).tolist()]
+    if not rest or not items:
+        return items
+    names, ops, values = zip(*rest)
+    return compiled_filter(items, None, names, ops, values)
+
+
+def assign_compr(
+    items: Iterable[Any], names: Sequence[str], values: Sequence[Any]
+) -> None:
+    """Set fields of items, column by column for columnar nodes.
+
+    Types with their own __setattr__, such as while a mutation log is open,
+    and watched fields are always set through them.
+    """
+    items = items if isinstance(items, list) else list(items)
+    store = column_store(items)
+    cls = type(items[0]) if items else None
+    if store is not None and cls.__setattr__ is object.__setattr__:
+        rows = [i._jac_.row for i in items]
+        for name, value in zip(names, values):
+            col = store.columns.get(name)
+            # Watched fields are set through their watch.
+            if col is None or not isinstance(vars(cls).get(name), Column):
+                for obj in items:
+                    setattr(obj, name, value)
+            else:
+                for row in rows:
+                    col[row] = value
+        return
+    for obj in items:
+        for name, value in zip(names, values):
+            setattr(obj, name, value)
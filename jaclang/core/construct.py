@@ -1,24 +1,266 @@
 """Core constructs for Jac Language."""
 from __future__ import annotations
 
+import asyncio
+import heapq
+import inspect
+import io
+import time
 import types
 import unittest
-from dataclasses import dataclass, field
-from typing import Any, Callable, Optional, Union
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import Executor, wait
+from contextvars import ContextVar, copy_context
+from dataclasses import MISSING, dataclass, field, fields, is_dataclass
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Iterator, Optional, TYPE_CHECKING, Union
 
 
 from jaclang.compiler.constant import EdgeDir
-from jaclang.core.utils import collect_node_connections
+from jaclang.core.edgeindex import EdgeIndex, INDEX_OPS, build_index
+from jaclang.core.fanout import AbilityFanout
+from jaclang.core.profiling import TraversalProfiler
+from jaclang.core.report import ReportBuffer
 
+if TYPE_CHECKING:
+    from jaclang.core.storage import GraphStore
 
-@dataclass(eq=False)
+
+EDGE_ENDS: dict[EdgeDir, tuple[tuple[str, str], ...]] = {
+    EdgeDir.OUT: (("out_edges", "target"),),
+    EdgeDir.IN: (("in_edges", "source"),),
+    EdgeDir.ANY: (("out_edges", "target"), ("in_edges", "source")),
+}
+
+
+class EdgeList:
+    """Insertion ordered adjacency list with constant time removal.
+
+    Edges are kept as keys of a dict (edges hash by identity). Once the list
+    holds more than one edge type, edges are also bucketed by type so typed
+    edge refs only touch matching edges; until then kind is the only type.
+    Buckets map edges to their insertion sequence number, so edges of
+    several buckets can be merged back in insertion order.
+    Indexes of edge fields declared with index_edges are built on first
+    lookup and kept in indexes by edge type and field.
+    """
+
+    __slots__ = ("edges", "kind", "by_type", "seq", "order", "indexes")
+
+    def __init__(self, edges: Iterable[EdgeArchitype] = ()) -> None:
+        """Create edge list."""
+        self.edges: dict[EdgeArchitype, None] = {}
+        self.kind: Optional[type] = None
+        self.by_type: Optional[dict[type, dict[EdgeArchitype, int]]] = None
+        self.seq = 0
+        self.order: Optional[list[EdgeArchitype]] = None
+        self.indexes: Optional[dict[tuple[type, str], Optional[EdgeIndex]]] = None
+        for edg in edges:
+            self.append(edg)
+
+    def append(self, edg: EdgeArchitype) -> None:
+        """Add edge to the list and its type bucket."""
+        self.edges[edg] = None
+        self.order = None
+        if self.indexes:
+            self.index_add(edg)
+        if self.by_type is None:
+            if self.kind is None:
+                self.kind = edg.__class__
+            if self.kind is edg.__class__:
+                return
+            self.by_type = {}
+            for seq, e in enumerate(self.edges):
+                self.by_type.setdefault(e.__class__, {})[e] = seq
+            self.seq = len(self.edges)
+            return
+        bucket = self.by_type.get(edg.__class__)
+        if bucket is None:
+            self.by_type[edg.__class__] = {edg: self.seq}
+        else:
+            bucket[edg] = self.seq
+        self.seq += 1
+
+    def extend(self, edgs: list[EdgeArchitype], kind: Optional[type] = None) -> None:
+        """Add edges in order, growing the list once if they share a type.
+
+        kind, if given, is the type of every edge in edgs.
+        """
+        if not edgs:
+            return
+        if self.by_type is None:
+            if kind is None:
+                kind = edgs[0].__class__
+                if not all(e.__class__ is kind for e in edgs):
+                    kind = None
+            if kind is not None and (self.kind is None or self.kind is kind):
+                self.kind = kind
+                self.edges.update(dict.fromkeys(edgs))
+                self.order = None
+                if self.indexes:
+                    for edg in edgs:
+                        self.index_add(edg)
+                return
+        for edg in edgs:
+            self.append(edg)
+
+    def discard(self, edg: EdgeArchitype) -> bool:
+        """Remove edge if present, return whether it was."""
+        if edg not in self.edges:
+            return False
+        del self.edges[edg]
+        self.order = None
+        if self.indexes:
+            self.index_remove(edg)
+        if self.by_type is None:
+            if not self.edges:
+                self.kind = None
+            return True
+        bucket = self.by_type[edg.__class__]
+        del bucket[edg]
+        if not bucket:
+            del self.by_type[edg.__class__]
+        return True
+
+    def remove(self, edg: EdgeArchitype) -> None:
+        """Remove edge, raise ValueError if not present."""
+        if not self.discard(edg):
+            raise ValueError(f"{edg} not in edge list")
+
+    def clear(self) -> None:
+        """Remove all edges."""
+        self.edges.clear()
+        self.kind = None
+        self.by_type = None
+        self.seq = 0
+        self.order = None
+        self.indexes = None
+
+    def of_type(
+        self, filter_type: type | types.UnionType | tuple
+    ) -> Iterable[EdgeArchitype]:
+        """Get edges that are instances of filter_type, in insertion order."""
+        if self.by_type is None:
+            if self.kind and issubclass(self.kind, filter_type):
+                return self.edges
+            return ()
+        buckets = [
+            bucket
+            for typ, bucket in self.by_type.items()
+            if issubclass(typ, filter_type)
+        ]
+        if not buckets:
+            return ()
+        if len(buckets) == 1:
+            return buckets[0]
+        merged = heapq.merge(*(i.items() for i in buckets), key=itemgetter(1))
+        return [e for e, _ in merged]
+
+    def field_index(self, cls: type, name: str, kind: str) -> Optional[EdgeIndex]:
+        """Get the index of cls edges by field name, building it if needed.
+
+        None is returned if the field values cannot be indexed.
+        """
+        if self.indexes is None:
+            self.indexes = {}
+        key = (cls, name)
+        if key not in self.indexes:
+            self.indexes[key] = build_index(cls, name, kind, self.of_type(cls))
+        return self.indexes[key]
+
+    def index_add(self, edg: EdgeArchitype) -> None:
+        """Add edge to the indexes of its type, dropping ones it cannot join."""
+        for key, idx in self.indexes.items():
+            if idx and isinstance(edg, idx.cls):
+                try:
+                    idx.add(edg)
+                except TypeError:
+                    self.indexes[key] = None
+
+    def index_remove(self, edg: EdgeArchitype) -> None:
+        """Remove edge from the indexes of its type."""
+        for idx in self.indexes.values():
+            if idx and isinstance(edg, idx.cls):
+                idx.remove(edg, getattr(edg, idx.name))
+
+    def index_move(
+        self, edg: EdgeArchitype, name: str, old: Any  # noqa: ANN401
+    ) -> None:
+        """Move edge in the indexes of its name field, from under old."""
+        for key, idx in self.indexes.items():
+            if idx and idx.name == name and isinstance(edg, idx.cls):
+                seq = idx.remove(edg, old)
+                try:
+                    idx.add(edg, seq)
+                except TypeError:
+                    self.indexes[key] = None
+
+    def lookup(
+        self, filter_type: Optional[type], filter_func: Optional[Callable]
+    ) -> Optional[list[EdgeArchitype]]:
+        """Get candidate edges for an edge ref filter through an index.
+
+        Filters comparing an indexed field of filter_type to a value are
+        narrowed to the edges the index gives; the filter still has to be
+        applied to them. None is returned when no index applies.
+        """
+        conds = getattr(filter_func, "conds", None)
+        declared = getattr(filter_type, "_jac_indexes_", None)
+        if not conds or not declared or not isinstance(filter_type, type):
+            return None
+        for name, op, value in conds:
+            kind = declared.get(name)
+            if kind and op in INDEX_OPS[kind]:
+                idx = self.field_index(filter_type, name, kind)
+                if idx is not None:
+                    try:
+                        return idx.lookup(op, value)
+                    except TypeError:
+                        return None
+        return None
+
+    def __getitem__(self, idx: int | slice) -> Any:  # noqa: ANN401
+        """Get edge(s) by position."""
+        if self.order is None:
+            self.order = list(self.edges)
+        return self.order[idx]
+
+    def __iter__(self) -> Iterator[EdgeArchitype]:
+        """Iterate edges in insertion order."""
+        return iter(self.edges)
+
+    def __len__(self) -> int:
+        """Get number of edges."""
+        return len(self.edges)
+
+    def __contains__(self, edg: object) -> bool:
+        """Check if edge is in list."""
+        return edg in self.edges
+
+    def __repr__(self) -> str:
+        """Get string representation."""
+        return f"EdgeList({list(self.edges)})"
+
+
+def same_value(a: object, b: object) -> bool:
+    """Check if two field values are the same or equal plain values."""
+    if a is b:
+        return True
+    try:
+        return type(a) is type(b) and bool(a == b)  # noqa: SIM901
+    except Exception:
+        return False
+
+
+@dataclass(eq=False, slots=True)
 class ElementAnchor:
     """Element Anchor."""
 
     obj: Optional[Architype]
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class ObjectAnchor(ElementAnchor):
     """Object Anchor."""
 
@@ -26,21 +268,134 @@ class ObjectAnchor(ElementAnchor):
         """Invoke data spatial call."""
         walk._jac_.spawn_call(self.obj)
 
+    async def spawn_async(
+        self, walk: WalkerArchitype, concurrency: Optional[int] = None
+    ) -> None:
+        """Invoke data spatial call, awaiting async abilities."""
+        await walk._jac_.spawn_async(self.obj, concurrency)
 
-@dataclass(eq=False)
+
+class AdjacencyView(Mapping):
+    """Adjacency lists of a node by direction.
+
+    Lists are read through edge_list, so the list of a direction is only
+    allocated when read, and is kept on the node so changes to it hold.
+    """
+
+    __slots__ = ("anchor",)
+
+    def __init__(self, anchor: NodeAnchor) -> None:
+        """Create view of the lists of a node anchor."""
+        self.anchor = anchor
+
+    def __getitem__(self, dir: EdgeDir) -> EdgeList:
+        """Get the adjacency list of a direction."""
+        if dir not in (EdgeDir.IN, EdgeDir.OUT):
+            raise KeyError(dir)
+        return self.anchor.edge_list(dir)
+
+    def __iter__(self) -> Iterator[EdgeDir]:
+        """Iterate directions."""
+        return iter((EdgeDir.IN, EdgeDir.OUT))
+
+    def __len__(self) -> int:
+        """Get the number of directions."""
+        return 2
+
+
+@dataclass(eq=False, slots=True)
 class NodeAnchor(ObjectAnchor):
     """Node Anchor."""
 
     obj: NodeArchitype
-    edges: dict[EdgeDir, list[EdgeArchitype]] = field(
-        default_factory=lambda: {EdgeDir.IN: [], EdgeDir.OUT: []}
-    )
+    in_edges: Optional[EdgeList] = None
+    out_edges: Optional[EdgeList] = None
+    jid: Optional[int] = None
+    store: Optional[GraphStore] = None
+
+    def page_in(self) -> None:
+        """Load adjacency of a node paged out to a graph store."""
+        if self.store:
+            self.store.page_in(self.obj)
+
+    @property
+    def edges(self) -> AdjacencyView:
+        """Get adjacency lists by direction."""
+        return AdjacencyView(self)
+
+    def edge_list(self, dir: EdgeDir) -> EdgeList:
+        """Get adjacency list for a direction, allocating it on first use."""
+        if self.store:
+            self.page_in()
+        if dir == EdgeDir.OUT:
+            if self.out_edges is None:
+                self.out_edges = EdgeList()
+            return self.out_edges
+        if self.in_edges is None:
+            self.in_edges = EdgeList()
+        return self.in_edges
 
     def connect_node(self, nd: NodeArchitype, edg: EdgeArchitype) -> NodeArchitype:
         """Connect a node with given edge."""
         edg._jac_.attach(self.obj, nd)
         return self.obj
 
+    def disconnect_node(
+        self,
+        nd: NodeArchitype,
+        dir: EdgeDir,
+        filter_type: Optional[type] = None,
+        filter_func: Optional[Callable] = None,
+    ) -> bool:
+        """Remove edges in the given direction that lead to nd."""
+        if self.store:
+            self.page_in()
+        edge_list: list[EdgeArchitype] = []
+        for attr, end in EDGE_ENDS[dir]:
+            edges = getattr(self, attr)
+            if not edges:
+                continue
+            candidates = edges.of_type(filter_type) if filter_type else edges
+            found = [e for e in candidates if getattr(e._jac_, end, None) is nd]
+            edge_list.extend(filter_func(found) if filter_func else found)
+        for e in edge_list:
+            e._jac_.detach()
+        return bool(edge_list)
+
+    def neighbors(
+        self,
+        dir: EdgeDir,
+        filter_type: Optional[type] = None,
+        filter_func: Optional[Callable] = None,
+        unique: bool = False,
+    ) -> Iterator[NodeArchitype]:
+        """Lazily yield nodes connected to this node.
+
+        Out edges are yielded before in edges for EdgeDir.ANY. With unique,
+        nodes reached through several edges are only yielded once. The graph
+        should not be mutated while the iterator is live.
+        """
+        if self.store:
+            self.page_in()
+        seen: set[int] = set()
+        for attr, end in EDGE_ENDS[dir]:
+            edges = getattr(self, attr)
+            if not edges:
+                continue
+            candidates = edges.of_type(filter_type) if filter_type else edges
+            if filter_func:
+                found = edges.lookup(filter_type, filter_func)
+                candidates = filter_func(candidates if found is None else found)
+            for e in candidates:
+                nd = getattr(e._jac_, end, None)
+                if not nd:
+                    continue
+                if unique:
+                    if id(nd) in seen:
+                        continue
+                    seen.add(id(nd))
+                yield nd
+
     # def edges_to_nodes(
     #     self, dir: EdgeDir, filter_type: Optional[type], filter_func: Optional[Callable]
     # ) -> list[NodeArchitype]:
@@ -69,43 +424,49 @@ class NodeAnchor(ObjectAnchor):
         self, dir: EdgeDir, filter_type: Optional[type], filter_func: Optional[Callable]
     ) -> list[NodeArchitype]:
         """Get set of nodes connected to this node."""
+        if self.store:
+            self.page_in()
+        if dir == EdgeDir.ANY:
+            if TraversalProfiler.enabled:
+                TraversalProfiler.scanned(
+                    sum(len(getattr(self, attr) or ()) for attr, _ in EDGE_ENDS[dir])
+                )
+            return list(self.neighbors(dir, filter_type, filter_func))
+        edges = self.out_edges if dir == EdgeDir.OUT else self.in_edges
+        if not edges:
+            return []
+        end = "target" if dir == EdgeDir.OUT else "source"
+        found = edges.lookup(filter_type, filter_func) if filter_func else None
+        if found is not None:
+            if TraversalProfiler.enabled:
+                TraversalProfiler.scanned(len(found))
+            return [
+                getattr(e._jac_, end)
+                for e in filter_func(found)  # type: ignore[misc]
+                if getattr(e._jac_, end, None)
+            ]
         filter_func = filter_func or (lambda x: x)
-        edge_list = [
-            e
-            for e in self.edges[dir]
-            if getattr(e._jac_, "target" if dir == EdgeDir.OUT else "source", None)
-            and (not filter_type or isinstance(e, filter_type))
-        ]
-        return [
-            getattr(e._jac_, "target" if dir == EdgeDir.OUT else "source")
-            for e in filter_func(edge_list)
-        ]
+        candidates = edges.of_type(filter_type) if filter_type else edges
+        if TraversalProfiler.enabled:
+            TraversalProfiler.scanned(len(candidates))
+        edge_list = [e for e in candidates if getattr(e._jac_, end, None)]
+        return [getattr(e._jac_, end) for e in filter_func(edge_list)]
 
     def gen_dot(self, dot_file: Optional[str] = None) -> str:
         """Generate Dot file for visualizing nodes and edges."""
-        visited_nodes = set()
-        connections = set()
-        unique_node_id_dict = {}
-
-        collect_node_connections(self, visited_nodes, connections)
-        dot_content = 'digraph {\nnode [style="filled", shape="ellipse", fillcolor="invis", fontcolor="black"];\n'
-        for idx, i in enumerate([nodes_.obj for nodes_ in visited_nodes]):
-            unique_node_id_dict[i] = (i.__class__.__name__, str(idx))
-            dot_content += f'{idx} [label="{i}"];\n'
-        dot_content += 'edge [color="gray", style="solid"];\n'
-
-        for pair in list(set(connections)):
-            dot_content += (
-                f"{unique_node_id_dict.get(pair[0])[1]} -> {unique_node_id_dict.get(pair[1])[1]}"
-                f' [label="{pair[2]}"];\n'
-            )
+        from jaclang.core.export import export_graph
+
         if dot_file:
             with open(dot_file, "w") as f:
-                f.write(dot_content + "}")
-        return dot_content + "}"
+                export_graph(self.obj, f, "dot")
+            with open(dot_file) as f:
+                return f.read()
+        out = io.StringIO()
+        export_graph(self.obj, out, "dot")
+        return out.getvalue()
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class EdgeAnchor(ObjectAnchor):
     """Edge Anchor."""
 
@@ -113,6 +474,7 @@ class EdgeAnchor(ObjectAnchor):
     source: Optional[NodeArchitype] = None
     target: Optional[NodeArchitype] = None
     dir: Optional[EdgeDir] = None
+    jid: Optional[int] = None
 
     def apply_dir(self, dir: EdgeDir) -> EdgeAnchor:
         """Apply direction to edge."""
@@ -124,30 +486,147 @@ class EdgeAnchor(ObjectAnchor):
         if self.dir == EdgeDir.IN:
             self.source = trg
             self.target = src
-            self.source._jac_.edges[EdgeDir.IN].append(self.obj)
-            self.target._jac_.edges[EdgeDir.OUT].append(self.obj)
+            self.source._jac_.edge_list(EdgeDir.IN).append(self.obj)
+            self.target._jac_.edge_list(EdgeDir.OUT).append(self.obj)
         else:
             self.source = src
             self.target = trg
-            self.source._jac_.edges[EdgeDir.OUT].append(self.obj)
-            self.target._jac_.edges[EdgeDir.IN].append(self.obj)
+            self.source._jac_.edge_list(EdgeDir.OUT).append(self.obj)
+            self.target._jac_.edge_list(EdgeDir.IN).append(self.obj)
+        return self
+
+    def replicate(self, count: int) -> list[EdgeArchitype]:
+        """Create count new edges like this one, to connect many node pairs.
+
+        The copies have the type and direction of this edge. Fields holding
+        a value a new edge would not (those set by conn_assign) are shared,
+        the others get their own defaults.
+        """
+        cls = self.obj.__class__
+        edges = [cls() for _ in range(count)]
+        if not edges:
+            return edges
+        names = (
+            [f.name for f in fields(cls)]
+            if is_dataclass(cls)
+            else list(getattr(self.obj, "__dict__", ()))
+        )
+        fresh = edges[0]
+        assigned = [
+            (name, value)
+            for name in names
+            if not same_value(
+                value := getattr(self.obj, name), getattr(fresh, name, MISSING)
+            )
+        ]
+        for edg in edges:
+            for name, value in assigned:
+                setattr(edg, name, value)
+            edg._jac_.dir = self.dir
+        return edges
+
+    def detach(self) -> EdgeAnchor:
+        """Detach edge from its nodes."""
+        for nd in (self.source, self.target):
+            if nd:
+                nd._jac_.page_in()
+                for edges in (nd._jac_.out_edges, nd._jac_.in_edges):
+                    if edges:
+                        edges.discard(self.obj)
+        self.source = None
+        self.target = None
         return self
 
     def spawn_call(self, walk: WalkerArchitype) -> None:
         """Invoke data spatial call."""
         if self.target:
+            self.target._jac_.page_in()
             walk._jac_.spawn_call(self.target)
 
+    async def spawn_async(
+        self, walk: WalkerArchitype, concurrency: Optional[int] = None
+    ) -> None:
+        """Invoke data spatial call, awaiting async abilities."""
+        if self.target:
+            self.target._jac_.page_in()
+            await walk._jac_.spawn_async(self.target, concurrency)
+
 
-@dataclass(eq=False)
+class Frontier(deque):
+    """Queue of a walker visiting the nodes of a frontier concurrently.
+
+    Each frontier node is visited with Visits of its own in VISITS, set by
+    the task or thread running it, which record the nodes it visits. They
+    are queued in frontier order, whatever order frontier nodes finish in.
+    """
+
+    def append(self, nd: Architype) -> None:
+        """Record a node visited by the running frontier node."""
+        VISITS.get().steps.append((nd, False))
+
+    def __len__(self) -> int:
+        """Get the number of visits and ignores of the running frontier node."""
+        return len(VISITS.get().steps)
+
+
+class FrontierIgnores(dict):
+    """Ignores of a walker visiting the nodes of a frontier concurrently.
+
+    Nodes ignored before the frontier are in base, shared by all frontier
+    nodes. Nodes a frontier node ignores are recorded in its Visits, and
+    only apply to the other frontier nodes once they are queued.
+    """
+
+    __slots__ = ("base",)
+
+    def __init__(self, base: dict[int, Architype]) -> None:
+        """Create ignores on top of the ones made before the frontier."""
+        super().__init__()
+        self.base = base
+
+    def __contains__(self, key: object) -> bool:
+        """Check if a node id is ignored for the running frontier node."""
+        return key in self.base or key in VISITS.get().ignored
+
+    def __setitem__(self, key: int, nd: Architype) -> None:
+        """Record a node ignored by the running frontier node."""
+        visits = VISITS.get()
+        visits.ignored.add(key)
+        visits.steps.append((nd, True))
+
+    def __len__(self) -> int:
+        """Get the number of nodes ignored for the running frontier node."""
+        return len(self.base) + len(VISITS.get().ignored)
+
+
+class Visits:
+    """Nodes visited and ignored by one frontier node, in the order made."""
+
+    __slots__ = ("steps", "ignored")
+
+    def __init__(self) -> None:
+        """Create empty visits."""
+        self.steps: list[tuple[Architype, bool]] = []
+        self.ignored: set[int] = set()
+
+
+# Visits of the frontier node running in this task or thread.
+VISITS: ContextVar[Visits] = ContextVar("VISITS")
+
+# Anchor of the walker whose spawn is running in this task or thread.
+REPORTER: ContextVar[WalkerAnchor] = ContextVar("REPORTER")
+
+
+@dataclass(eq=False, slots=True)
 class WalkerAnchor(ObjectAnchor):
     """Walker Anchor."""
 
     obj: WalkerArchitype
     path: list[Architype] = field(default_factory=lambda: [])
-    next: list[Architype] = field(default_factory=lambda: [])
-    ignores: list[Architype] = field(default_factory=lambda: [])
+    next: deque[Architype] = field(default_factory=lambda: deque())
+    ignores: dict[int, Architype] = field(default_factory=lambda: {})
     disengaged: bool = False
+    reports: Optional[ReportBuffer] = None
 
     def visit_node(
         self,
@@ -161,7 +640,7 @@ class WalkerAnchor(ObjectAnchor):
             nd_list = list(nds)
         before_len = len(self.next)
         for i in nd_list:
-            if i not in self.ignores:
+            if id(i) not in self.ignores:
                 if isinstance(i, NodeArchitype):
                     self.next.append(i)
                 elif isinstance(i, EdgeArchitype):
@@ -183,12 +662,12 @@ class WalkerAnchor(ObjectAnchor):
             nd_list = list(nds)
         before_len = len(self.ignores)
         for i in nd_list:
-            if i not in self.ignores:
+            if id(i) not in self.ignores:
                 if isinstance(i, NodeArchitype):
-                    self.ignores.append(i)
+                    self.ignores[id(i)] = i
                 elif isinstance(i, EdgeArchitype):
                     if i._jac_.target:
-                        self.ignores.append(i._jac_.target)
+                        self.ignores[id(i._jac_.target)] = i._jac_.target
                     else:
                         raise ValueError("Edge has no target.")
         return len(self.ignores) > before_len
@@ -197,50 +676,285 @@ class WalkerAnchor(ObjectAnchor):
         """Disengage walker from traversal."""
         self.disengaged = True
 
+    def report(self, value: Any) -> None:  # noqa: ANN401
+        """Add a value to the report buffer of the spawn."""
+        if self.reports is None or self.reports.closed:
+            self.reports = ReportBuffer(
+                ReportBuffer.default_limit, ReportBuffer.default_spill
+            )
+        self.reports.append(value)
+
     def spawn_call(self, nd: Architype) -> None:
         """Invoke data spatial call."""
+        token = REPORTER.set(self)
+        try:
+            if TraversalProfiler.enabled:
+                self.profiled_spawn_call(nd)
+            elif AbilityFanout.enabled:
+                self.fanout_spawn_call(nd)
+            else:
+                self.traverse(nd)
+        finally:
+            REPORTER.reset(token)
+            if self.reports is not None:
+                self.reports.close()
+
+    def traverse(self, nd: Architype) -> None:
+        """Visit nodes from nd until the queue is empty or disengaged."""
         self.path = []
-        self.next = [nd]
+        self.next = deque([nd])
+        walker_cls = self.obj.__class__
         while len(self.next):
-            nd = self.next.pop(0)
-            for i in nd._jac_entry_funcs_:
-                if not i.trigger or isinstance(self.obj, i.trigger):
-                    if i.func:
-                        i.func(nd, self.obj)
-                    else:
-                        raise ValueError(f"No function {i.name} to call.")
+            nd = self.next.popleft()
+            for func, walker_first in AbilityDispatch.resolve(walker_cls, nd.__class__):
+                if walker_first:
+                    func(self.obj, nd)
+                else:
+                    func(nd, self.obj)
                 if self.disengaged:
                     return
-            for i in self.obj._jac_entry_funcs_:
-                if not i.trigger or isinstance(nd, i.trigger):
-                    if i.func:
-                        i.func(self.obj, nd)
+        self.ignores = {}
+
+    def resume(self, owns: Callable[[Architype], bool]) -> Optional[Architype]:
+        """Continue a traversal until it ends or reaches a node not owned.
+
+        The node not owned is left at the head of the queue and returned, so
+        the traversal can be resumed where that node is.
+        """
+        token = REPORTER.set(self)
+        try:
+            walker_cls = self.obj.__class__
+            while len(self.next):
+                nd = self.next[0]
+                if not owns(nd):
+                    return nd
+                self.next.popleft()
+                for func, walker_first in AbilityDispatch.resolve(
+                    walker_cls, nd.__class__
+                ):
+                    if walker_first:
+                        func(self.obj, nd)
                     else:
-                        raise ValueError(f"No function {i.name} to call.")
+                        func(nd, self.obj)
+                    if self.disengaged:
+                        return None
+            self.ignores = {}
+            return None
+        finally:
+            REPORTER.reset(token)
+
+    def fanout_spawn_call(self, nd: Architype) -> None:
+        """Invoke data spatial call, fanning out parallel safe visits."""
+        self.path = []
+        self.next = deque([nd])
+        walker_cls = self.obj.__class__
+        safe = AbilityFanout.safe
+        while len(self.next):
+            nd = self.next.popleft()
+            table = AbilityDispatch.resolve(walker_cls, nd.__class__)
+            if self.next and safe(table):
+                batch = [(nd, table)]
+                while self.next and len(batch) < AbilityFanout.batch:
+                    table = AbilityDispatch.resolve(walker_cls, self.next[0].__class__)
+                    if not safe(table):
+                        break
+                    batch.append((self.next.popleft(), table))
+                if len(batch) > 1:
+                    self.visit_batch(batch)
+                    if self.disengaged:
+                        return
+                    continue
+                nd, table = batch[0]
+            for func, walker_first in table:
+                if walker_first:
+                    func(self.obj, nd)
+                else:
+                    func(nd, self.obj)
                 if self.disengaged:
                     return
-            for i in self.obj._jac_exit_funcs_:
-                if not i.trigger or isinstance(nd, i.trigger):
-                    if i.func:
-                        i.func(self.obj, nd)
-                    else:
-                        raise ValueError(f"No function {i.name} to call.")
+        self.ignores = {}
+
+    def visit_batch(self, batch: list[tuple[Architype, list]]) -> None:
+        """Visit a batch of nodes on the fan-out thread pool."""
+
+        def visit(nd: Architype, table: list, visits: Visits) -> None:
+            if self.disengaged:
+                return
+            VISITS.set(visits)
+            for func, walker_first in table:
+                if walker_first:
+                    func(self.obj, nd)
+                else:
+                    func(nd, self.obj)
                 if self.disengaged:
                     return
-            for i in nd._jac_exit_funcs_:
-                if not i.trigger or isinstance(self.obj, i.trigger):
-                    if i.func:
-                        i.func(nd, self.obj)
+
+        rest, ignores = self.next, self.ignores
+        self.next = Frontier()
+        self.ignores = FrontierIgnores(ignores)
+        visits = [Visits() for _ in batch]
+        pool: Executor = AbilityFanout.pool  # type: ignore[assignment]
+        try:
+            jobs = [
+                pool.submit(copy_context().run, visit, *i, j)
+                for i, j in zip(batch, visits)
+            ]
+            wait(jobs)
+            for job in jobs:
+                job.result()
+        finally:
+            self.next, self.ignores = rest, ignores
+        self.queue_visits(visits)
+
+    def queue_visits(self, visits: list[Visits]) -> None:
+        """Queue the nodes frontier nodes visited, in frontier order.
+
+        The visits and ignores of each frontier node are applied after those
+        of the nodes before it, in the order it made them, so nodes ignored
+        earlier in the frontier are not queued, as in a serial traversal.
+        """
+        for frontier_node in visits:
+            for nd, ignored in frontier_node.steps:
+                if ignored:
+                    self.ignores[id(nd)] = nd
+                elif id(nd) not in self.ignores:
+                    self.next.append(nd)
+
+    async def spawn_async(
+        self, nd: Architype, concurrency: Optional[int] = None
+    ) -> None:
+        """Invoke data spatial call, awaiting async abilities.
+
+        With concurrency above one, the nodes queued at each step of the
+        traversal are visited concurrently, up to concurrency at a time.
+        Nodes they visit are queued in the order a plain spawn would.
+        """
+        token = REPORTER.set(self)
+        try:
+            self.path = []
+            self.next = deque([nd])
+            if concurrency is None or concurrency <= 1:
+                while len(self.next):
+                    await self.visit_async(self.next.popleft())
+                    if self.disengaged:
+                        return
+            else:
+                limit = asyncio.Semaphore(concurrency)
+                while len(self.next):
+                    await self.visit_frontier(list(self.next), limit)
+                    if self.disengaged:
+                        return
+            self.ignores = {}
+        finally:
+            REPORTER.reset(token)
+            if self.reports is not None:
+                self.reports.close()
+
+    async def visit_frontier(
+        self, frontier: list[Architype], limit: asyncio.Semaphore
+    ) -> None:
+        """Visit frontier nodes concurrently and queue the nodes they visit."""
+
+        async def visit(nd: Architype, visits: Visits) -> None:
+            VISITS.set(visits)
+            async with limit:
+                if not self.disengaged:
+                    await self.visit_async(nd)
+
+        ignores = self.ignores
+        self.next = Frontier()
+        self.ignores = FrontierIgnores(ignores)
+        visits = [Visits() for _ in frontier]
+        tasks = [asyncio.ensure_future(visit(*i)) for i in zip(frontier, visits)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        finally:
+            self.next = deque()
+            self.ignores = ignores
+        self.queue_visits(visits)
+
+    async def visit_async(self, nd: Architype) -> None:
+        """Fire the abilities of a visit to a node, awaiting async ones."""
+        for func, walker_first in AbilityDispatch.resolve(
+            self.obj.__class__, nd.__class__
+        ):
+            ret = func(self.obj, nd) if walker_first else func(nd, self.obj)
+            if inspect.isawaitable(ret):
+                await ret
+            if self.disengaged:
+                return
+
+    def profiled_spawn_call(self, nd: Architype) -> None:
+        """Invoke data spatial call, recording traversal statistics."""
+        stats = TraversalProfiler.begin(self.obj, nd)
+        clock = time.perf_counter
+        started = clock()
+        try:
+            self.path = []
+            self.next = deque([nd])
+            walker_cls = self.obj.__class__
+            while len(self.next):
+                stats.frontier_peak = max(stats.frontier_peak, len(self.next))
+                nd = self.next.popleft()
+                stats.nodes_visited += 1
+                for func, walker_first in AbilityDispatch.resolve(
+                    walker_cls, nd.__class__
+                ):
+                    called = clock()
+                    if walker_first:
+                        func(self.obj, nd)
                     else:
-                        raise ValueError(f"No function {i.name} to call.")
-                if self.disengaged:
-                    return
-        self.ignores = []
+                        func(nd, self.obj)
+                    stats.record(func.__qualname__, clock() - called)
+                    if self.disengaged:
+                        stats.disengaged = True
+                        return
+            stats.ignored = len(self.ignores)
+            self.ignores = {}
+        finally:
+            stats.ignored = stats.ignored or len(self.ignores)
+            stats.wall_time = clock() - started
+            TraversalProfiler.end(stats)
+
+
+def invalidating(method: Callable) -> Callable:
+    """Wrap a list method to drop cached dispatch tables after it runs."""
+
+    def mutate(self: list, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        ret = method(self, *args, **kwargs)
+        AbilityDispatch.invalidate()
+        return ret
+
+    return mutate
+
+
+class AbilityList(list):
+    """Abilities of an architype, dropping cached dispatch tables on change."""
+
+    __slots__ = ()
+
+    append = invalidating(list.append)
+    extend = invalidating(list.extend)
+    insert = invalidating(list.insert)
+    pop = invalidating(list.pop)
+    remove = invalidating(list.remove)
+    clear = invalidating(list.clear)
+    sort = invalidating(list.sort)
+    reverse = invalidating(list.reverse)
+    __setitem__ = invalidating(list.__setitem__)
+    __delitem__ = invalidating(list.__delitem__)
+    __iadd__ = invalidating(list.__iadd__)
+    __imul__ = invalidating(list.__imul__)
 
 
 class Architype:
     """Architype Protocol."""
 
+    __slots__ = ("_jac_", "__weakref__")
     _jac_entry_funcs_: list[DSFunc]
     _jac_exit_funcs_: list[DSFunc]
 
@@ -252,6 +966,8 @@ class Architype:
 class NodeArchitype(Architype):
     """Node Architype Protocol."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Create node architype."""
         self._jac_ = NodeAnchor(obj=self)
@@ -260,6 +976,8 @@ class NodeArchitype(Architype):
 class EdgeArchitype(Architype):
     """Edge Architype Protocol."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Create edge architype."""
         self._jac_ = EdgeAnchor(obj=self)
@@ -268,6 +986,8 @@ class EdgeArchitype(Architype):
 class WalkerArchitype(Architype):
     """Walker Architype Protocol."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Create walker architype."""
         self._jac_ = WalkerAnchor(obj=self)
@@ -276,15 +996,82 @@ class WalkerArchitype(Architype):
 class Root(NodeArchitype):
     """Generic Root Node."""
 
-    _jac_entry_funcs_ = []
-    _jac_exit_funcs_ = []
+    __slots__ = ()
+    _jac_entry_funcs_ = AbilityList()
+    _jac_exit_funcs_ = AbilityList()
 
 
 class GenericEdge(EdgeArchitype):
     """Generic Root Node."""
 
-    _jac_entry_funcs_ = []
-    _jac_exit_funcs_ = []
+    __slots__ = ()
+    _jac_entry_funcs_ = AbilityList()
+    _jac_exit_funcs_ = AbilityList()
+
+
+class AbilityDispatch:
+    """Ability dispatch tables per (walker type, node type) pair.
+
+    A table is the ordered list of abilities that fire when a walker of one
+    type visits a node of another, each paired with whether the walker is
+    the first argument. Tables are cached on the walker class and are
+    dropped whenever abilities are added, or the AbilityList of a class
+    is changed.
+    """
+
+    version: int = 0
+
+    @staticmethod
+    def invalidate() -> None:
+        """Drop all cached dispatch tables."""
+        AbilityDispatch.version += 1
+
+    @staticmethod
+    def add_ability(cls: type, ability: DSFunc, on_entry: bool = True) -> None:
+        """Add an ability to an architype class."""
+        ability.resolve(cls)
+        if on_entry:
+            cls._jac_entry_funcs_.append(ability)
+        else:
+            cls._jac_exit_funcs_.append(ability)
+        AbilityDispatch.invalidate()
+
+    @staticmethod
+    def tables(walker_cls: type) -> dict[type, list[tuple[Callable, bool]]]:
+        """Get the dispatch tables cached on a walker class."""
+        cached = walker_cls.__dict__.get("_jac_dispatch_")
+        if cached is None or cached[0] != AbilityDispatch.version:
+            cached = (AbilityDispatch.version, {})
+            walker_cls._jac_dispatch_ = cached
+        return cached[1]
+
+    @staticmethod
+    def resolve(walker_cls: type, node_cls: type) -> list[tuple[Callable, bool]]:
+        """Get the abilities that fire when walker_cls visits node_cls."""
+        tables = AbilityDispatch.tables(walker_cls)
+        table = tables.get(node_cls)
+        if table is None:
+            table = tables[node_cls] = [
+                (i.func or AbilityDispatch.missing(i.name), walker_first)
+                for funcs, other, walker_first in (
+                    (node_cls._jac_entry_funcs_, walker_cls, False),
+                    (walker_cls._jac_entry_funcs_, node_cls, True),
+                    (walker_cls._jac_exit_funcs_, node_cls, True),
+                    (node_cls._jac_exit_funcs_, walker_cls, False),
+                )
+                for i in funcs
+                if not i.trigger or issubclass(other, i.trigger)
+            ]
+        return table
+
+    @staticmethod
+    def missing(name: str) -> Callable[[Any, Any], Any]:
+        """Get a stand in for an unresolved ability."""
+
+        def raise_missing(*_: object) -> None:
+            raise ValueError(f"No function {name} to call.")
+
+        return raise_missing
 
 
 @dataclass(eq=False)
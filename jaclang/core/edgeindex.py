@@ -0,0 +1,318 @@
+"""Secondary indexes on edge fields for Jac.
+
+index_edges declares a hash or sorted index on a field of an edge
+architype. Adjacency lists build an index over their edges of that type
+the first time an edge ref filters on the field, and keep it up to date
+as edges are added and removed. Equality and range filters in edge refs
+then look edges up instead of testing every edge. Setting the indexed
+field of an edge moves it within the indexes of its lists.
+
+Sorted indexes also give the edges of a node in field order, see ordered
+and top_k, without sorting the adjacency list on each call.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Iterable, Optional, TYPE_CHECKING
+
+from jaclang.compiler.constant import EdgeDir
+from jaclang.core.fieldwatch import watch_field
+from jaclang.core.utils import gc_paused
+
+if TYPE_CHECKING:
+    from jaclang.core.construct import (
+        EdgeAnchor,
+        EdgeArchitype,
+        EdgeList,
+        NodeArchitype,
+    )
+
+HASH = "hash"
+SORTED = "sorted"
+
+# Filter comparisons each kind of index answers.
+INDEX_OPS = {HASH: {"==", "in"}, SORTED: {"==", "<", "<=", ">", ">="}}
+
+# Sorted index lookups matching more than 1 / SELECTIVE of the edges scan.
+SELECTIVE = 8
+
+
+class EdgeFilter:
+    """Filter comprehension of an edge ref, exposing its comparisons.
+
+    Calls func with the edges and the (field, op, value) comparisons. Edge
+    lists look at the comparisons to pick an index.
+    """
+
+    __slots__ = ("conds", "func")
+
+    def __init__(
+        self,
+        conds: tuple[tuple[str, str, Any], ...],
+        func: Callable[[list, tuple], list],
+    ) -> None:
+        """Create filter of conds, applied with func."""
+        self.conds = conds
+        self.func = func
+
+    def __call__(self, edges: Iterable[EdgeArchitype]) -> list[EdgeArchitype]:
+        """Get the edges passing all comparisons."""
+        return self.func(edges, self.conds)
+
+
+class EdgeIndex(ABC):
+    """Index of the edges of one type in an adjacency list, by one field.
+
+    Edges are numbered as they are added, so lookups can give them back in
+    adjacency list order.
+    """
+
+    __slots__ = ("cls", "name", "seq")
+
+    kind = ""
+
+    def __init__(self, cls: type, name: str) -> None:
+        """Create empty index of the name field of cls edges."""
+        self.cls = cls
+        self.name = name
+        self.seq = 0
+
+    @abstractmethod
+    def add(self, edg: EdgeArchitype, seq: Optional[int] = None) -> None:
+        """Add an edge under its current field value, numbered seq if given."""
+
+    @abstractmethod
+    def remove(self, edg: EdgeArchitype, key: Any) -> int:  # noqa: ANN401
+        """Remove an edge indexed under key, return its number."""
+
+    def build(self, edges: Iterable[EdgeArchitype]) -> None:
+        """Add edges in list order."""
+        for edg in edges:
+            self.add(edg)
+
+    @abstractmethod
+    def lookup(
+        self, op: str, value: Any  # noqa: ANN401
+    ) -> Optional[list[EdgeArchitype]]:
+        """Get edges whose field compares true with value, in list order.
+
+        None is returned if too many edges match for the index to help.
+        """
+
+
+class HashIndex(EdgeIndex):
+    """Edge index answering equality and membership tests."""
+
+    __slots__ = ("buckets",)
+
+    kind = HASH
+
+    def __init__(self, cls: type, name: str) -> None:
+        """Create empty index of the name field of cls edges."""
+        super().__init__(cls, name)
+        self.buckets: dict[Any, dict[EdgeArchitype, int]] = {}
+
+    def add(self, edg: EdgeArchitype, seq: Optional[int] = None) -> None:
+        """Add an edge under its current field value, numbered seq if given."""
+        key = getattr(edg, self.name)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = {}
+        if seq is None:
+            seq, self.seq = self.seq, self.seq + 1
+        bucket[edg] = seq
+
+    def remove(self, edg: EdgeArchitype, key: Any) -> int:  # noqa: ANN401
+        """Remove an edge indexed under key, return its number."""
+        bucket = self.buckets[key]
+        seq = bucket.pop(edg)
+        if not bucket:
+            del self.buckets[key]
+        return seq
+
+    def lookup(
+        self, op: str, value: Any  # noqa: ANN401
+    ) -> Optional[list[EdgeArchitype]]:
+        """Get edges whose field compares true with value, in list order.
+
+        Membership in strings and bytes tests substrings, which the index
+        cannot answer, so None is returned for them.
+        """
+        if op == "==":
+            found = [self.buckets[value]] if value in self.buckets else []
+        elif isinstance(value, (str, bytes, bytearray)):
+            return None
+        else:
+            found = [self.buckets[v] for v in set(value) if v in self.buckets]
+        # Buckets keep their edges in the order they were added, which is not
+        # list order once an edge moved between buckets.
+        pairs = sorted(((s, e) for b in found for e, s in b.items()), key=seq_of)
+        return [e for _, e in pairs]
+
+
+class SortedIndex(EdgeIndex):
+    """Edge index answering equality and range tests, kept in field order."""
+
+    __slots__ = ("keys", "entries")
+
+    kind = SORTED
+
+    def __init__(self, cls: type, name: str) -> None:
+        """Create empty index of the name field of cls edges."""
+        super().__init__(cls, name)
+        self.keys: list[Any] = []
+        self.entries: list[tuple[int, EdgeArchitype]] = []
+
+    def add(self, edg: EdgeArchitype, seq: Optional[int] = None) -> None:
+        """Add an edge under its current field value, numbered seq if given."""
+        key = getattr(edg, self.name)
+        pos = bisect_right(self.keys, key)
+        if seq is None:
+            seq, self.seq = self.seq, self.seq + 1
+        self.keys.insert(pos, key)
+        self.entries.insert(pos, (seq, edg))
+
+    def remove(self, edg: EdgeArchitype, key: Any) -> int:  # noqa: ANN401
+        """Remove an edge indexed under key, return its number."""
+        pos = bisect_left(self.keys, key)
+        while self.entries[pos][1] is not edg:
+            pos += 1
+        del self.keys[pos]
+        return self.entries.pop(pos)[0]
+
+    def span(self, op: str, value: Any) -> tuple[int, int]:  # noqa: ANN401
+        """Get the range of entries whose keys compare true with value."""
+        if op == "==":
+            return bisect_left(self.keys, value), bisect_right(self.keys, value)
+        if op == "<":
+            return 0, bisect_left(self.keys, value)
+        if op == "<=":
+            return 0, bisect_right(self.keys, value)
+        if op == ">":
+            return bisect_right(self.keys, value), len(self.keys)
+        return bisect_left(self.keys, value), len(self.keys)
+
+    def build(self, edges: Iterable[EdgeArchitype]) -> None:
+        """Add edges in list order, sorting them once."""
+        name = self.name
+        rows = sorted(
+            ((getattr(e, name), seq, e) for seq, e in enumerate(edges, self.seq)),
+            key=key_of,
+        )
+        self.seq += len(rows)
+        self.keys = [key for key, _, _ in rows]
+        self.entries = [(seq, e) for _, seq, e in rows]
+
+    def lookup(
+        self, op: str, value: Any  # noqa: ANN401
+    ) -> Optional[list[EdgeArchitype]]:
+        """Get edges whose field compares true with value, in list order.
+
+        Matches are put back in list order, which costs more than scanning
+        once a large part of the edges match.
+        """
+        lo, hi = self.span(op, value)
+        if (hi - lo) * SELECTIVE > len(self.keys):
+            return None
+        return [e for _, e in sorted(self.entries[lo:hi], key=seq_of)]
+
+    def ordered(self, reverse: bool = False) -> list[EdgeArchitype]:
+        """Get all edges in field order, equal keys in list order."""
+        if reverse:
+            return [e for _, e in reversed(self.entries)]
+        return [e for _, e in self.entries]
+
+
+def seq_of(entry: tuple[int, Any]) -> int:
+    """Get the number of an index entry."""
+    return entry[0]
+
+
+def key_of(row: tuple[Any, int, Any]) -> Any:  # noqa: ANN401
+    """Get the field value of an edge row."""
+    return row[0]
+
+
+INDEX_KINDS: dict[str, type[EdgeIndex]] = {HASH: HashIndex, SORTED: SortedIndex}
+
+
+def reindex(edg: EdgeArchitype, name: str, old: Any) -> None:  # noqa: ANN401
+    """Move an edge within the indexes of its lists after name was set."""
+    anchor = getattr(edg, "_jac_", None)
+    if anchor and anchor.source:
+        for edges in indexed_lists(anchor):
+            edges.index_move(edg, name, old)
+
+
+def indexed_lists(anchor: EdgeAnchor) -> list[EdgeList]:
+    """Get the adjacency lists holding an edge that have indexes built."""
+    edg = anchor.obj
+    lists = []
+    for nd in (anchor.source, anchor.target):
+        if nd is None:
+            continue
+        for edges in (nd._jac_.in_edges, nd._jac_.out_edges):
+            if edges is not None and edges.indexes and edg in edges:
+                lists.append(edges)
+    return lists
+
+
+def index_edges(cls: type, name: str, kind: str = SORTED) -> None:
+    """Declare an index of kind hash or sorted on the name field of cls.
+
+    Hash indexes answer == and in, sorted ones ==, <, <=, > and >=, and need
+    field values that are ordered against each other.
+    """
+    if kind not in INDEX_KINDS:
+        raise ValueError(f"Unknown index kind {kind!r}")
+    if name not in getattr(cls, "__dataclass_fields__", ()):
+        raise ValueError(f"{cls.__name__} has no field {name!r}")
+    if "_jac_indexes_" not in vars(cls):
+        cls._jac_indexes_ = dict(getattr(cls, "_jac_indexes_", {}))
+    cls._jac_indexes_[name] = kind
+    watch_field(cls, name, reindex)
+
+
+def build_index(
+    cls: type, name: str, kind: str, edges: Iterable[EdgeArchitype]
+) -> Optional[EdgeIndex]:
+    """Index edges, or get None if their field values cannot be indexed."""
+    idx = INDEX_KINDS[kind](cls, name)
+    try:
+        with gc_paused():
+            idx.build(edges)
+    except TypeError:
+        return None
+    return idx
+
+
+def sorted_index(
+    node: NodeArchitype, cls: type, name: str, dir: EdgeDir
+) -> SortedIndex:
+    """Get the sorted index of the cls edges of node by their name field."""
+    if getattr(cls, "_jac_indexes_", {}).get(name) != SORTED:
+        raise ValueError(f"No sorted index on {cls.__name__}.{name}")
+    idx = node._jac_.edge_list(dir).field_index(cls, name, SORTED)
+    if not isinstance(idx, SortedIndex):
+        raise TypeError(f"Values of {cls.__name__}.{name} cannot be ordered")
+    return idx
+
+
+def ordered(
+    node: NodeArchitype,
+    cls: type,
+    name: str,
+    dir: EdgeDir = EdgeDir.OUT,
+    reverse: bool = False,
+) -> list[EdgeArchitype]:
+    """Get the cls edges of node in order of their name field."""
+    return sorted_index(node, cls, name, dir).ordered(reverse)
+
+
+def top_k(
+    node: NodeArchitype, cls: type, name: str, k: int, dir: EdgeDir = EdgeDir.OUT
+) -> list[EdgeArchitype]:
+    """Get the k cls edges of node with the largest name field, largest first."""
+    entries = sorted_index(node, cls, name, dir).entries
+    return [e for _, e in reversed(entries[-k:])] if k > 0 else []
@@ -0,0 +1,216 @@
+"""Streaming graph export for Jac.
+
+export_graph walks a graph breadth first from a start node, following
+edges in both directions, and streams each node and edge to a file handle
+as soon as it is reached. Only the frontier and a node index are held in
+memory, so export cost does not depend on graph depth and output is never
+built up as a whole.
+"""
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Optional, TYPE_CHECKING, TextIO
+from xml.sax.saxutils import escape
+
+from jaclang.core.storage import arch_state
+
+if TYPE_CHECKING:
+    from jaclang.core.construct import EdgeArchitype, NodeArchitype
+
+
+class GraphWriter(ABC):
+    """Graph export format base."""
+
+    def __init__(self, out: TextIO) -> None:
+        """Create writer streaming to out."""
+        self.out = out
+
+    def begin(self) -> None:  # noqa: B027
+        """Write the document head."""
+
+    @abstractmethod
+    def node(self, idx: int, nd: NodeArchitype) -> None:
+        """Write a node."""
+
+    @abstractmethod
+    def edge(self, src: int, trg: int, edg: EdgeArchitype) -> None:
+        """Write an edge between two written nodes."""
+
+    def end(self) -> None:  # noqa: B027
+        """Write the document tail."""
+
+
+class DotWriter(GraphWriter):
+    """Graphviz DOT writer."""
+
+    def begin(self) -> None:
+        """Write the document head."""
+        self.out.write(
+            "digraph {\n"
+            'node [style="filled", shape="ellipse", fillcolor="invis", '
+            'fontcolor="black"];\n'
+            'edge [color="gray", style="solid"];\n'
+        )
+
+    def node(self, idx: int, nd: NodeArchitype) -> None:
+        """Write a node labelled with its repr."""
+        self.out.write(f"{idx} [label={self.quote(str(nd))}];\n")
+
+    def edge(self, src: int, trg: int, edg: EdgeArchitype) -> None:
+        """Write an edge labelled with its type."""
+        self.out.write(
+            f"{src} -> {trg} [label={self.quote(edg.__class__.__name__)}];\n"
+        )
+
+    def end(self) -> None:
+        """Write the document tail."""
+        self.out.write("}")
+
+    @staticmethod
+    def quote(text: str) -> str:
+        """Quote a DOT string."""
+        return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+class JsonLinesWriter(GraphWriter):
+    """JSON lines writer, one object per node and edge."""
+
+    encoder = json.JSONEncoder(default=repr)
+
+    def node(self, idx: int, nd: NodeArchitype) -> None:
+        """Write a node with its fields."""
+        self.write({"node": idx, "type": nd.__class__.__name__, **self.data(nd)})
+
+    def edge(self, src: int, trg: int, edg: EdgeArchitype) -> None:
+        """Write an edge with its fields."""
+        self.write(
+            {
+                "source": src,
+                "target": trg,
+                "type": edg.__class__.__name__,
+                **self.data(edg),
+            }
+        )
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Write a record, with values JSON cannot hold as their repr."""
+        self.out.write(self.encoder.encode(record) + "\n")
+
+    @staticmethod
+    def data(obj: Any) -> dict[str, Any]:  # noqa: ANN401
+        """Get fields of an architype, keyed under data if any."""
+        state = arch_state(obj)
+        return {"data": state} if state else {}
+
+
+class GraphMLWriter(GraphWriter):
+    """GraphML writer keeping type and repr of nodes and edges."""
+
+    def begin(self) -> None:
+        """Write the document head."""
+        self.out.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+            '<key id="type" for="all" attr.name="type" attr.type="string"/>\n'
+            '<key id="label" for="all" attr.name="label" attr.type="string"/>\n'
+            '<graph edgedefault="directed">\n'
+        )
+
+    def node(self, idx: int, nd: NodeArchitype) -> None:
+        """Write a node."""
+        self.out.write(f'<node id="n{idx}">{self.data(nd)}</node>\n')
+
+    def edge(self, src: int, trg: int, edg: EdgeArchitype) -> None:
+        """Write an edge."""
+        self.out.write(
+            f'<edge source="n{src}" target="n{trg}">{self.data(edg)}</edge>\n'
+        )
+
+    def end(self) -> None:
+        """Write the document tail."""
+        self.out.write("</graph>\n</graphml>\n")
+
+    @staticmethod
+    def data(obj: Any) -> str:  # noqa: ANN401
+        """Get data elements of an architype."""
+        return (
+            f'<data key="type">{escape(obj.__class__.__name__)}</data>'
+            f'<data key="label">{escape(str(obj))}</data>'
+        )
+
+
+FORMATS: dict[str, type[GraphWriter]] = {
+    "dot": DotWriter,
+    "jsonl": JsonLinesWriter,
+    "graphml": GraphMLWriter,
+}
+
+
+def export_graph(
+    start: NodeArchitype,
+    out: TextIO,
+    format: str = "dot",
+    depth: Optional[int] = None,
+    max_nodes: Optional[int] = None,
+    node_types: Optional[tuple[type, ...]] = None,
+    edge_types: Optional[tuple[type, ...]] = None,
+) -> int:
+    """Stream the graph around start to out, return the number of nodes written.
+
+    Nodes further than depth hops from start, past the first max_nodes, or
+    not of node_types, and edges not of edge_types, are neither written
+    nor followed. Each edge is written once, after both of its nodes.
+    """
+    if format not in FORMATS:
+        raise ValueError(
+            f"Unknown graph format {format!r}, use one of {list(FORMATS)}."
+        )
+    writer = FORMATS[format](out)
+    # Stored nodes may be paged out and back in as new objects, so they are
+    # indexed by (negated) store id rather than object id.
+    index: dict[int, int] = {node_key(start): 0}
+    frontier: deque[tuple[NodeArchitype, int]] = deque([(start, 0)])
+    writer.begin()
+    count = 0
+    while frontier:
+        nd, hops = frontier.popleft()
+        writer.node(count, nd)
+        here = count
+        count += 1
+        anchor = nd._jac_
+        anchor.page_in()
+        for edges in (anchor.out_edges, anchor.in_edges):
+            for edg in edges or ():
+                if edge_types and not isinstance(edg, edge_types):
+                    continue
+                src, trg = edg._jac_.source, edg._jac_.target
+                if src is None or trg is None:
+                    continue
+                other = trg if src is nd else src
+                if other is nd:
+                    if edges is anchor.out_edges:
+                        writer.edge(here, here, edg)
+                    continue
+                seen = index.get(node_key(other))
+                if seen is not None:
+                    # Edges are written from whichever end is reached last.
+                    if seen < here:
+                        ends = (seen, here) if src is other else (here, seen)
+                        writer.edge(*ends, edg)
+                elif (
+                    (depth is None or hops < depth)
+                    and (max_nodes is None or len(index) < max_nodes)
+                    and (not node_types or isinstance(other, node_types))
+                ):
+                    index[node_key(other)] = len(index)
+                    frontier.append((other, hops + 1))
+    writer.end()
+    return count
+
+
+def node_key(nd: NodeArchitype) -> int:
+    """Get the key a node is indexed under during export."""
+    jid = nd._jac_.jid
+    return -jid if jid is not None else id(nd)
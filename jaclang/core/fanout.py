@@ -0,0 +1,58 @@
+"""Thread pool fan-out of parallel safe walker abilities.
+
+Abilities decorated with parallel_safe promise to only read node state and
+not to depend on the order other visits happen in. AbilityFanout is off by
+default. While enabled, when the nodes at the head of a walker's queue
+only fire parallel safe abilities, spawns run that batch of visits on a
+thread pool. Nodes visited and ignored by each of them are applied in
+queue order, so the traversal visits nodes in the order it would one by
+one. Once a visit disengages, batch nodes not yet started are skipped;
+ones already running on other threads finish their visit.
+
+Threads only speed up abilities that release the GIL, such as NumPy,
+hashing or regular expressions over large inputs, or blocking I/O. Spawns
+profiled with TraversalProfiler do not fan out.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+
+def parallel_safe(func: F) -> F:
+    """Mark an ability as safe to run on a thread pool."""
+    func._jac_parallel_safe_ = True  # type: ignore[attr-defined]
+    return func
+
+
+class AbilityFanout:
+    """Opt-in thread pool for batches of parallel safe visits."""
+
+    enabled: bool = False
+    pool: Optional[ThreadPoolExecutor] = None
+    batch: int = 256
+
+    @staticmethod
+    def enable(max_workers: Optional[int] = None, batch: int = 256) -> None:
+        """Start fanning out up to batch visits at a time on max_workers threads."""
+        AbilityFanout.disable()
+        AbilityFanout.pool = ThreadPoolExecutor(
+            max_workers, thread_name_prefix="jac-fanout"
+        )
+        AbilityFanout.batch = batch
+        AbilityFanout.enabled = True
+
+    @staticmethod
+    def disable() -> None:
+        """Stop fanning out visits and shut the thread pool down."""
+        AbilityFanout.enabled = False
+        if AbilityFanout.pool is not None:
+            AbilityFanout.pool.shutdown()
+            AbilityFanout.pool = None
+
+    @staticmethod
+    def safe(table: list[tuple[Callable, bool]]) -> bool:
+        """Check if a dispatch table only holds parallel safe abilities."""
+        return all(getattr(func, "_jac_parallel_safe_", False) for func, _ in table)
@@ -0,0 +1,84 @@
+"""Field set hooks for Jac architypes.
+
+watch_field makes setting a field of an architype class call hooks with
+the object, the field name and the value it had before, which is MISSING
+if the field was unset. Indexes over field values use it to stay current.
+
+Reads of a watched field are not slowed down for plain classes, as the
+watch only defines __set__ and values stay in the instance dict. Fields
+already backed by a descriptor, such as slots or columns, are replaced by
+a property reading through that descriptor.
+"""
+from __future__ import annotations
+
+import inspect
+import types
+from dataclasses import MISSING
+from functools import partial
+from typing import Any, Callable, Optional
+
+Hook = Callable[[Any, str, Any], None]
+
+
+class FieldWatch:
+    """Setter of a watched field, calling its hooks after each set."""
+
+    __slots__ = ("name", "get", "put", "hooks")
+
+    def __init__(self, name: str, attr: Any, owner: type) -> None:  # noqa: ANN401
+        """Watch the name field, stored through descriptor attr if any."""
+        self.name = name
+        self.hooks: list[Hook] = []
+        self.get: Optional[Callable[[Any], Any]] = None
+        self.put: Optional[Callable[[Any, Any], None]] = None
+        if isinstance(attr, property):
+            self.get, self.put = attr.fget, attr.__set__
+        elif isinstance(attr, types.MemberDescriptorType):
+            self.get, self.put = attr.__get__, attr.__set__
+        elif hasattr(attr, "__set__"):
+            self.get, self.put = partial(read, attr, owner), attr.__set__
+
+    def __set__(self, obj: Any, value: Any) -> None:  # noqa: ANN401
+        """Set the field of obj and call the hooks."""
+        if self.get is None:
+            old = obj.__dict__.get(self.name, MISSING)
+            obj.__dict__[self.name] = value
+        else:
+            try:
+                old = self.get(obj)
+            except AttributeError:
+                old = MISSING
+            self.put(obj, value)  # type: ignore[misc]
+        for hook in self.hooks:
+            hook(obj, self.name, old)
+
+
+def read(attr: Any, owner: type, obj: Any) -> Any:  # noqa: ANN401
+    """Read obj through descriptor attr of owner."""
+    return attr.__get__(obj, owner)
+
+
+def field_watch(cls: type, name: str) -> Optional[FieldWatch]:
+    """Get the watch of the name field of cls, if it has one."""
+    attr = inspect.getattr_static(cls, name, None)
+    if isinstance(attr, property):
+        attr = getattr(attr.fset, "__self__", None)
+    return attr if isinstance(attr, FieldWatch) else None
+
+
+def watch_field(cls: type, name: str, hook: Hook) -> None:
+    """Call hook after each set of the name field on cls objects.
+
+    Watches are shared with subclasses, so hooks must check the objects
+    they are given.
+    """
+    watch = field_watch(cls, name)
+    if watch is None:
+        attr = inspect.getattr_static(cls, name, None)
+        watch = FieldWatch(name, attr, cls)
+        if watch.get is None:
+            setattr(cls, name, watch)
+        else:
+            setattr(cls, name, property(watch.get, watch.__set__))
+    if hook not in watch.hooks:
+        watch.hooks.append(hook)
@@ -0,0 +1,546 @@
+"""Frozen CSR graphs for Jac.
+
+freeze writes the graph around a start node to a file in compressed
+sparse row form: for each direction, per node offsets into flat arrays of
+neighbour and edge ids, in adjacency list order, plus one column per field
+of each node and edge type. open_frozen memory maps such a file, so every
+process opening it shares the same pages and starts without rebuilding
+the graph as objects.
+
+Nodes and edges of a FrozenGraph are proxies, made the first time they
+are reached: objects of their architype created without __init__, with
+fields read from the columns. Nodes get a FrozenAnchor answering edge refs
+from the arrays, so walkers spawned on them traverse the frozen graph as
+they would the live one. Frozen graphs are read-only: connecting or
+disconnecting proxies raises TypeError and field sets only change the
+proxy. Proxies are cached weakly, so only those in use are kept.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import pickle
+import struct
+import sys
+import weakref
+from array import array
+from itertools import accumulate
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from jaclang.compiler.constant import EdgeDir
+from jaclang.core.columnar import ColumnAnchor, ColumnStore
+from jaclang.core.construct import (
+    EDGE_ENDS,
+    EdgeAnchor,
+    EdgeArchitype,
+    NodeArchitype,
+)
+from jaclang.core.export import node_key
+from jaclang.core.profiling import TraversalProfiler
+from jaclang.core.storage import arch_class, arch_fields, arch_name, arch_state
+
+MAGIC = b"JACCSR01"
+
+# Header is the magic and the length of the JSON metadata after it.
+HEADER = struct.Struct("<8sq")
+
+# Name of the column holding whole field states of non-dataclass types.
+STATE = "*"
+
+DIRS = {EdgeDir.OUT: ("out",), EdgeDir.IN: ("in",), EdgeDir.ANY: ("out", "in")}
+
+
+def align(size: int) -> int:
+    """Round size up to a multiple of 8."""
+    return (size + 7) & ~7
+
+
+class Sections:
+    """Arrays laid out one after the other, 8 byte aligned."""
+
+    def __init__(self) -> None:
+        """Create empty layout."""
+        self.chunks: list[bytes] = []
+        self.size = 0
+
+    def add(self, data: array | bytes) -> list:
+        """Lay out data, return its offset, typecode and item count."""
+        code = data.typecode if isinstance(data, array) else "B"
+        raw = bytes(data)
+        section = [self.size, code, len(data)]
+        padded = align(len(raw))
+        self.chunks.append(raw + bytes(padded - len(raw)))
+        self.size += padded
+        return section
+
+    def column(self, name: str, values: list) -> dict[str, Any]:
+        """Lay out a column of field values in the tightest kind that fits."""
+        kinds = set(map(type, values))
+        if kinds <= {bool}:
+            return {"name": name, "kind": "b", "values": self.add(array("b", values))}
+        if kinds <= {int} and -(2**63) <= min(values) and max(values) < 2**63:
+            return {"name": name, "kind": "q", "values": self.add(array("q", values))}
+        if kinds <= {float}:
+            return {"name": name, "kind": "d", "values": self.add(array("d", values))}
+        if kinds <= {str}:
+            kind, data = "s", [v.encode() for v in values]
+        else:
+            kind, data = "p", [pickle.dumps(v) for v in values]
+        offsets = array("q", [0])
+        offsets.extend(accumulate(map(len, data)))
+        return {
+            "name": name,
+            "kind": kind,
+            "offsets": self.add(offsets),
+            "values": self.add(b"".join(data)),
+        }
+
+    def types(self, groups: dict[type, list]) -> list[dict[str, Any]]:
+        """Lay out the field columns of objects grouped by type."""
+        found = []
+        for cls, objs in groups.items():
+            names = arch_fields(cls)
+            if names is None:
+                columns = [self.column(STATE, [arch_state(o) for o in objs])]
+            else:
+                columns = [
+                    self.column(name, [getattr(o, name) for o in objs])
+                    for name in names
+                ]
+            found.append({"name": arch_name(cls), "columns": columns})
+        return found
+
+
+def encode_graph(start: NodeArchitype) -> list[bytes]:
+    """Encode the graph around start as the chunks of a frozen graph.
+
+    Every node linked to start through edges, in either direction, is
+    included; start is node 0.
+    """
+    index: dict[int, int] = {}
+    nodes: list[NodeArchitype] = []
+    edge_index: dict[int, int] = {}
+    edges: list[EdgeArchitype] = []
+
+    def node_id(nd: NodeArchitype) -> int:
+        key = node_key(nd)
+        idx = index.get(key)
+        if idx is None:
+            idx = index[key] = len(nodes)
+            nodes.append(nd)
+        return idx
+
+    def edge_id(edg: EdgeArchitype) -> int:
+        eid = edge_index.get(id(edg))
+        if eid is None:
+            eid = edge_index[id(edg)] = len(edges)
+            edges.append(edg)
+            for nd in (edg._jac_.source, edg._jac_.target):
+                if nd is not None:
+                    node_id(nd)
+        return eid
+
+    node_id(start)
+    adjacency: dict[str, tuple[array, array, array]] = {
+        d: (array("q", [0]), array("q"), array("q")) for d in ("out", "in")
+    }
+    done = 0
+    while done < len(nodes):
+        anchor = nodes[done]._jac_
+        anchor.page_in()
+        for attr, end in EDGE_ENDS[EdgeDir.ANY]:
+            offsets, nbrs, eids = adjacency[attr[:-6]]
+            for edg in getattr(anchor, attr) or ():
+                other = getattr(edg._jac_, end, None)
+                if other:
+                    nbrs.append(node_id(other))
+                    eids.append(edge_id(edg))
+            offsets.append(len(nbrs))
+        done += 1
+
+    layout = Sections()
+    node_groups, node_kinds, node_rows = group_by_type(nodes)
+    edge_groups, edge_kinds, edge_rows = group_by_type(edges)
+    ends = array("q")
+    dirs = array("b")
+    for edg in edges:
+        anchor = edg._jac_
+        for nd in (anchor.source, anchor.target):
+            ends.append(-1 if nd is None else index[node_key(nd)])
+        dirs.append(anchor.dir.value if anchor.dir else 0)
+    meta = {
+        "byteorder": sys.byteorder,
+        "nodes": len(nodes),
+        "edges": len(edges),
+        "node_kinds": layout.add(node_kinds),
+        "node_rows": layout.add(node_rows),
+        "edge_kinds": layout.add(edge_kinds),
+        "edge_rows": layout.add(edge_rows),
+        "edge_ends": layout.add(ends),
+        "edge_dirs": layout.add(dirs),
+        "adjacency": {
+            d: [layout.add(arr) for arr in arrays] for d, arrays in adjacency.items()
+        },
+        "node_types": layout.types(node_groups),
+        "edge_types": layout.types(edge_groups),
+    }
+    head = json.dumps(meta).encode()
+    header = HEADER.pack(MAGIC, len(head)) + head
+    return [header + bytes(align(len(header)) - len(header)), *layout.chunks]
+
+
+def group_by_type(objs: list) -> tuple[dict[type, list], array, array]:
+    """Group objects by type, with the type id and row of each in its group."""
+    groups: dict[type, list] = {}
+    ids: dict[type, int] = {}
+    kinds = array("i")
+    rows = array("q")
+    for obj in objs:
+        cls = obj.__class__
+        kind = ids.get(cls)
+        if kind is None:
+            kind = ids[cls] = len(groups)
+            groups[cls] = []
+        group = groups[cls]
+        kinds.append(kind)
+        rows.append(len(group))
+        group.append(obj)
+    return groups, kinds, rows
+
+
+def freeze(start: NodeArchitype, path: str | os.PathLike) -> int:
+    """Write the graph around start to path, return the number of nodes."""
+    chunks = encode_graph(start)
+    with open(path, "wb") as f:
+        f.writelines(chunks)
+    return FrozenGraph.probe(chunks[0])["nodes"]
+
+
+def open_frozen(path: str | os.PathLike, types: Iterable[type] = ()) -> FrozenGraph:
+    """Memory map the frozen graph at path.
+
+    Architype classes are found by module and name; types overrides that
+    lookup for the classes given.
+    """
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return FrozenGraph(mapped, types)
+
+
+class ProxyRef(weakref.ref):
+    """Weak reference to a proxy, leaving its cache when the proxy is freed."""
+
+    __slots__ = ("cache", "key")
+
+    def __new__(cls, obj: Any, cache: dict, key: int) -> ProxyRef:  # noqa: ANN401
+        """Create reference to obj, cached under key."""
+        ref = super().__new__(cls, obj, forget)
+        ref.cache, ref.key = cache, key
+        return ref
+
+    def __init__(self, obj: Any, cache: dict, key: int) -> None:  # noqa: ANN401
+        """Create reference to obj, cached under key."""
+        super().__init__(obj, forget)
+
+
+def forget(ref: ProxyRef) -> None:
+    """Drop the cache entry of a freed proxy."""
+    if ref.cache.get(ref.key) is ref:
+        del ref.cache[ref.key]
+
+
+class FrozenType:
+    """An architype class of a frozen graph, with a loader of its fields."""
+
+    def __init__(self, cls: type, load: Callable[[Any, int], None]) -> None:
+        """Create type setting fields of its objects with load(obj, row)."""
+        self.cls = cls
+        self.load = load
+        self.store = getattr(cls, "_jac_columns_", None)
+
+
+# Expressions reading row r of column k, by column kind.
+READS = {
+    "b": "bool(v{k}[r])",
+    "q": "v{k}[r]",
+    "d": "v{k}[r]",
+    "s": "str(v{k}[o{k}[r] : o{k}[r + 1]], 'utf-8')",
+    "p": "loads(v{k}[o{k}[r] : o{k}[r + 1]])",
+}
+
+
+def compile_loader(
+    columns: list[tuple[dict[str, Any], memoryview, Optional[memoryview]]]
+) -> Callable[[Any, int], None]:
+    """Compile a function setting the fields of an object from a row.
+
+    Each column comes with views of its values and, for strings and
+    pickles, of their offsets.
+    """
+    env: dict[str, Any] = {"loads": pickle.loads}
+    body = []
+    for k, (column, values, offsets) in enumerate(columns):
+        env[f"v{k}"], env[f"o{k}"] = values, offsets
+        read = READS[column["kind"]].format(k=k)
+        if column["name"] == STATE:
+            body.append(f"for f, v in {read}.items(): setattr(obj, f, v)")
+        else:
+            body.append(f"obj.{column['name']} = {read}")
+    src = "def load(obj, r):\n    " + "\n    ".join(body or ["pass"])
+    exec(src, env)
+    return env["load"]
+
+
+class FrozenGraph:
+    """Read-only graph over the buffer of a frozen graph."""
+
+    def __init__(self, buf: Any, types: Iterable[type] = ()) -> None:  # noqa: ANN401
+        """Read the graph in buf, which is kept open until close."""
+        self.buf = buf
+        self.views: list[memoryview] = []
+        self.nodes: dict[int, ProxyRef] = {}
+        self.edges: dict[int, ProxyRef] = {}
+        self.kinds: dict[Any, frozenset[int]] = {}
+        try:
+            self.read(types)
+        except Exception:
+            self.close()
+            raise
+
+    def read(self, types: Iterable[type]) -> None:
+        """Read the metadata and map the sections of the buffer."""
+        view = self.view(memoryview(self.buf))
+        meta = self.probe(view)
+        if meta["byteorder"] != sys.byteorder:
+            raise ValueError("Frozen graph was written with another byte order")
+        self.base = align(HEADER.size + HEADER.unpack_from(view)[1])
+        self.data = view
+        known = {arch_name(cls): cls for cls in types}
+        self.node_types = [self.frozen_type(t, known) for t in meta["node_types"]]
+        self.edge_types = [self.frozen_type(t, known) for t in meta["edge_types"]]
+        self.node_kinds = self.section(meta["node_kinds"])
+        self.node_rows = self.section(meta["node_rows"])
+        self.edge_kinds = self.section(meta["edge_kinds"])
+        self.edge_rows = self.section(meta["edge_rows"])
+        self.edge_ends = self.section(meta["edge_ends"])
+        self.edge_dirs = self.section(meta["edge_dirs"])
+        self.adjacency = {
+            d: tuple(self.section(s) for s in sections)
+            for d, sections in meta["adjacency"].items()
+        }
+        self.num_nodes: int = meta["nodes"]
+        self.num_edges: int = meta["edges"]
+
+    @staticmethod
+    def probe(head: bytes | memoryview) -> dict[str, Any]:
+        """Read the metadata of a frozen graph from its first bytes."""
+        magic, size = HEADER.unpack_from(head)
+        if magic != MAGIC:
+            raise ValueError("Not a frozen Jac graph")
+        return json.loads(bytes(head[HEADER.size : HEADER.size + size]))
+
+    def view(self, view: memoryview) -> memoryview:
+        """Keep track of a view of the buffer, to release it on close."""
+        self.views.append(view)
+        return view
+
+    def section(self, section: list) -> memoryview:
+        """Get a view of a section as an array of its typecode."""
+        offset, code, count = section
+        start = self.base + offset
+        size = count * array(code).itemsize
+        return self.view(self.data[start : start + size].cast(code))
+
+    def frozen_type(self, spec: dict[str, Any], known: dict[str, type]) -> FrozenType:
+        """Resolve a type of the graph and compile the loader of its columns."""
+        name = spec["name"]
+        cls = known.get(name) or arch_class(name)
+        columns = [
+            (
+                col,
+                self.section(col["values"]),
+                self.section(col["offsets"]) if "offsets" in col else None,
+            )
+            for col in spec["columns"]
+        ]
+        return FrozenType(cls, compile_loader(columns))
+
+    @property
+    def root(self) -> NodeArchitype:
+        """Get the proxy of the node the graph was frozen from."""
+        return self.node(0)
+
+    def node(self, idx: int) -> NodeArchitype:
+        """Get the proxy of a node, making it if needed."""
+        ref = self.nodes.get(idx)
+        nd = ref() if ref is not None else None
+        if nd is None:
+            kind = self.node_types[self.node_kinds[idx]]
+            nd = kind.cls.__new__(kind.cls)
+            store = kind.store
+            nd._jac_ = FrozenAnchor(
+                self, idx, store.alloc() if store is not None else -1, store
+            )
+            self.nodes[idx] = ProxyRef(nd, self.nodes, idx)
+            kind.load(nd, self.node_rows[idx])
+        return nd
+
+    def edge(self, eid: int) -> EdgeArchitype:
+        """Get the proxy of an edge, making it if needed."""
+        ref = self.edges.get(eid)
+        edg = ref() if ref is not None else None
+        if edg is None:
+            kind = self.edge_types[self.edge_kinds[eid]]
+            edg = kind.cls.__new__(kind.cls)
+            src, trg = self.edge_ends[2 * eid], self.edge_ends[2 * eid + 1]
+            dir = self.edge_dirs[eid]
+            edg._jac_ = EdgeAnchor(
+                obj=edg,
+                source=self.node(src) if src >= 0 else None,
+                target=self.node(trg) if trg >= 0 else None,
+                dir=EdgeDir(dir) if dir else None,
+            )
+            kind.load(edg, self.edge_rows[eid])
+            self.edges[eid] = ProxyRef(edg, self.edges, eid)
+        return edg
+
+    def edge_kinds_of(self, filter_type: Any) -> frozenset[int]:  # noqa: ANN401
+        """Get the ids of edge types that are subclasses of filter_type."""
+        found = self.kinds.get(filter_type)
+        if found is None:
+            found = self.kinds[filter_type] = frozenset(
+                i
+                for i, kind in enumerate(self.edge_types)
+                if issubclass(kind.cls, filter_type)
+            )
+        return found
+
+    def neighbors(
+        self,
+        idx: int,
+        dir: EdgeDir,
+        filter_type: Optional[type] = None,
+        filter_func: Optional[Callable] = None,
+    ) -> list[NodeArchitype]:
+        """Get the nodes an edge ref from node idx gives, as a live graph would."""
+        found: list[NodeArchitype] = []
+        for d in DIRS[dir]:
+            offsets, nbrs, eids = self.adjacency[d]
+            lo, hi = offsets[idx], offsets[idx + 1]
+            if lo == hi:
+                continue
+            if TraversalProfiler.enabled:
+                TraversalProfiler.scanned(hi - lo)
+            if filter_type is None and filter_func is None:
+                found.extend(map(self.node, nbrs[lo:hi]))
+                continue
+            slots: Iterable[int] = range(lo, hi)
+            if filter_type is not None:
+                keep = self.edge_kinds_of(filter_type)
+                kinds = self.edge_kinds
+                slots = [k for k in slots if kinds[eids[k]] in keep]
+            if filter_func is None:
+                found.extend(self.node(nbrs[k]) for k in slots)
+                continue
+            end = "target" if d == "out" else "source"
+            for edg in filter_func([self.edge(eids[k]) for k in slots]):
+                found.append(getattr(edg._jac_, end))
+        return found
+
+    def close(self) -> None:
+        """Release the buffer; proxies can no longer read fields after."""
+        for view in reversed(self.views):
+            view.release()
+        self.views = []
+        close = getattr(self.buf, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> FrozenGraph:
+        """Use the graph in a with block, closing it after."""
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        """Close the graph."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Get the number of nodes."""
+        return self.num_nodes
+
+
+class FrozenAnchor(ColumnAnchor):
+    """Anchor of a frozen graph node, answering edge refs from the graph.
+
+    The anchor finds its node through the graph instead of holding it, so
+    proxies are freed by reference counting as soon as they are unused.
+    """
+
+    __slots__ = ("graph", "idx", "columns")
+
+    def __init__(
+        self,
+        graph: FrozenGraph,
+        idx: int,
+        row: int = -1,
+        columns: Optional[ColumnStore] = None,
+    ) -> None:
+        """Create anchor of node idx, with its column row if columnar."""
+        self.in_edges = self.out_edges = None
+        self.jid = self.store = None
+        self.row = row
+        self.graph = graph
+        self.idx = idx
+        self.columns = columns
+
+    @property  # type: ignore[override]
+    def obj(self) -> NodeArchitype:
+        """Get the proxy of the node."""
+        return self.graph.node(self.idx)
+
+    def __del__(self) -> None:
+        """Give the column row of a columnar proxy back."""
+        if self.columns is not None and self.row >= 0:
+            self.columns.free.append(self.row)
+
+    def page_in(self) -> None:
+        """Frozen nodes have no store to page in from."""
+
+    def edge_list(self, dir: EdgeDir) -> Any:  # noqa: ANN401
+        """Frozen nodes cannot get new edges."""
+        raise TypeError("Frozen graph nodes cannot be connected")
+
+    def disconnect_node(
+        self,
+        nd: NodeArchitype,
+        dir: EdgeDir,
+        filter_type: Optional[type] = None,
+        filter_func: Optional[Callable] = None,
+    ) -> bool:
+        """Frozen nodes cannot lose edges."""
+        raise TypeError("Frozen graph nodes cannot be disconnected")
+
+    def neighbors(
+        self,
+        dir: EdgeDir,
+        filter_type: Optional[type] = None,
+        filter_func: Optional[Callable] = None,
+        unique: bool = False,
+    ) -> Iterator[NodeArchitype]:
+        """Lazily yield nodes connected to this node."""
+        found = self.graph.neighbors(self.idx, dir, filter_type, filter_func)
+        if not unique:
+            yield from found
+            return
+        seen: set[int] = set()
+        for nd in found:
+            if id(nd) not in seen:
+                seen.add(id(nd))
+                yield nd
+
+    def edges_to_nodes(
+        self, dir: EdgeDir, filter_type: Optional[type], filter_func: Optional[Callable]
+    ) -> list[NodeArchitype]:
+        """Get set of nodes connected to this node."""
+        return self.graph.neighbors(self.idx, dir, filter_type, filter_func)
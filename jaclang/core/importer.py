@@ -2,14 +2,29 @@
 import marshal
 import sys
 import types
-from os import path
+from os import environ, path
 from typing import Optional
 
 from jaclang.compiler.constant import Constants as Con
+from jaclang.compiler.passes.main.intrinsic_pass import JacIntrinsicPass, opt_tag
 from jaclang.compiler.transpiler import transpile_jac
 from jaclang.utils.log import logging
 
 
+def env_optimize() -> int:
+    """Get the optimization level set in JAC_OPTIMIZE, 0 if not an integer."""
+    value = environ.get("JAC_OPTIMIZE") or "0"
+    try:
+        return int(value)
+    except ValueError:
+        logging.warning(f"Ignoring JAC_OPTIMIZE={value!r}, not an integer.")
+        return 0
+
+
+# Optimization level Jac modules are compiled at, see JacIntrinsicPass.
+optimize = env_optimize()
+
+
 def jac_importer(
     target: str,
     base_path: str,
@@ -34,8 +49,9 @@ def jac_importer(
     gen_dir = path.join(caller_dir, Con.JAC_GEN_DIR)
     full_target = path.normpath(path.join(caller_dir, file_name))
 
-    py_file_path = path.join(gen_dir, module_name + ".py")
-    pyc_file_path = path.join(gen_dir, module_name + ".jbc")
+    gen_name = module_name + opt_tag(JacIntrinsicPass.level if optimize else 0)
+    py_file_path = path.join(gen_dir, gen_name + ".py")
+    pyc_file_path = path.join(gen_dir, gen_name + ".jbc")
     if (
         cachable
         and path.exists(py_file_path)
@@ -44,7 +60,7 @@ def jac_importer(
         with open(pyc_file_path, "rb") as f:
             codeobj = marshal.load(f)
     else:
-        if error := transpile_jac(full_target):
+        if error := transpile_jac(full_target, optimize=optimize):
             if error:
                 for e in error:
                     print(e)
@@ -0,0 +1,201 @@
+"""Bulk graph ingestion for Jac.
+
+load_nodes builds nodes from records and load_edges attaches edges given
+as (source, target, edge type, attributes) tuples, from any iterable or
+generator. Edges are created in large batches and appended to adjacency
+lists with one bulk extend per node and batch, without going through the
+connect feature. Cyclic garbage collection is paused while loading, as
+each new node and edge would otherwise count towards collections that
+rescan the whole graph. Readers turn CSV and JSON lines files into records, and
+edge_tuples turns edge records into tuples.
+
+Loading bypasses feature hooks, so plugins observing connect (such as an
+open mutation log) do not see loaded edges. Checkpoint the log after a
+load to persist it.
+"""
+from __future__ import annotations
+
+import csv
+import json
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    IO,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    TYPE_CHECKING,
+)
+
+from jaclang.compiler.constant import EdgeDir
+from jaclang.core.utils import gc_paused
+
+if TYPE_CHECKING:
+    from jaclang.core.construct import EdgeArchitype, NodeArchitype
+
+EdgeTuple = tuple[Any, Any, Any, Optional[Mapping[str, Any]]]
+
+
+@contextmanager
+def opened(source: str | IO[str]) -> Iterator[IO[str]]:
+    """Open source if it is a path, else use it as is."""
+    if isinstance(source, str):
+        with open(source, newline="") as f:
+            yield f
+    else:
+        yield source
+
+
+def read_csv(
+    source: str | IO[str],
+    converters: Optional[Mapping[str, Callable[[str], Any]]] = None,
+    **fmt: Any,  # noqa: ANN401
+) -> Iterator[dict[str, Any]]:
+    """Read records from CSV with a header row, converting named columns.
+
+    Extra keyword arguments are passed to csv.DictReader.
+    """
+    with opened(source) as f:
+        for row in csv.DictReader(f, **fmt):
+            if converters:
+                for name, conv in converters.items():
+                    if name in row:
+                        row[name] = conv(row[name])
+            yield row
+
+
+def read_jsonl(source: str | IO[str]) -> Iterator[dict[str, Any]]:
+    """Read records from JSON lines, skipping blank lines."""
+    with opened(source) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def edge_tuples(
+    records: Iterable[Mapping[str, Any]],
+    source: str = "source",
+    target: str = "target",
+    type: Optional[str] = "type",
+) -> Iterator[EdgeTuple]:
+    """Turn edge records into edge tuples, other fields becoming attributes."""
+    skip = {source, target, type}
+    for rec in records:
+        attrs = {k: v for k, v in rec.items() if k not in skip}
+        yield rec[source], rec[target], rec.get(type) if type else None, attrs
+
+
+def load_nodes(
+    records: Iterable[Mapping[str, Any]],
+    node_type: type | Mapping[str, type],
+    key: str = "id",
+    type_key: str = "type",
+    nodes: Optional[dict[Hashable, NodeArchitype]] = None,
+) -> dict[Hashable, NodeArchitype]:
+    """Create nodes from records, return them keyed by their key field.
+
+    node_type is either the architype of every node or a mapping from the
+    type_key field of records to architypes. Remaining fields are passed to
+    the architype, the key field only if the architype has a field of that
+    name. Nodes are added to nodes if given.
+    """
+    nodes = {} if nodes is None else nodes
+    with gc_paused():
+        load_records(records, node_type, key, type_key, nodes)
+    return nodes
+
+
+def load_records(
+    records: Iterable[Mapping[str, Any]],
+    node_type: type | Mapping[str, type],
+    key: str,
+    type_key: str,
+    nodes: dict[Hashable, NodeArchitype],
+) -> None:
+    """Create nodes from records into nodes."""
+    by_name = node_type if isinstance(node_type, Mapping) else None
+    keeps_key: dict[type, bool] = {}
+    for rec in records:
+        cls = by_name[rec[type_key]] if by_name is not None else node_type
+        keep = keeps_key.get(cls)  # type: ignore[call-overload]
+        if keep is None:
+            keep = keeps_key[cls] = key in getattr(cls, "__dataclass_fields__", ())
+        kwargs = {
+            k: v
+            for k, v in rec.items()
+            if (keep or k != key) and (by_name is None or k != type_key)
+        }
+        nodes[rec[key]] = cls(**kwargs)
+
+
+def load_edges(
+    edges: Iterable[EdgeTuple],
+    nodes: Optional[Mapping[Hashable, NodeArchitype]] = None,
+    edge_types: Optional[Mapping[str, type]] = None,
+    batch_size: int = 1 << 20,
+) -> int:
+    """Attach edges from source to target nodes, return the number attached.
+
+    Ends are keys of nodes if given, else nodes themselves. Edge types are
+    architypes, names in edge_types, or None for generic edges. Attributes
+    are passed to the edge architype.
+    """
+    from jaclang.core.construct import GenericEdge
+
+    kinds: dict[Any, type] = {None: GenericEdge}
+    if edge_types:
+        kinds.update(edge_types)
+    count = 0
+    batch: list[EdgeTuple] = []
+    with gc_paused():
+        for edg in edges:
+            batch.append(edg)
+            if len(batch) >= batch_size:
+                count += attach_batch(batch, nodes, kinds)
+                batch = []
+        if batch:
+            count += attach_batch(batch, nodes, kinds)
+    return count
+
+
+def attach_batch(
+    batch: list[EdgeTuple],
+    nodes: Optional[Mapping[Hashable, NodeArchitype]],
+    kinds: dict[Any, type],
+) -> int:
+    """Create edges of a batch and extend adjacency lists once per node."""
+    outs: dict[NodeArchitype, list[EdgeArchitype]] = {}
+    ins: dict[NodeArchitype, list[EdgeArchitype]] = {}
+    out_dir = EdgeDir.OUT
+    used: set[type] = set()
+    for src, trg, typ, attrs in batch:
+        if nodes is not None:
+            src, trg = nodes[src], nodes[trg]
+        cls = kinds.get(typ)
+        if cls is None:
+            if isinstance(typ, str):
+                raise KeyError(f"Unknown edge type {typ!r}")
+            cls = kinds[typ] = typ
+        used.add(cls)
+        edg = cls(**attrs) if attrs else cls()
+        anchor = edg._jac_
+        anchor.source, anchor.target, anchor.dir = src, trg, out_dir
+        out = outs.get(src)
+        if out is None:
+            outs[src] = [edg]
+        else:
+            out.append(edg)
+        inn = ins.get(trg)
+        if inn is None:
+            ins[trg] = [edg]
+        else:
+            inn.append(edg)
+    kind = next(iter(used)) if len(used) == 1 else None
+    for nd, edgs in outs.items():
+        nd._jac_.edge_list(EdgeDir.OUT).extend(edgs, kind)
+    for nd, edgs in ins.items():
+        nd._jac_.edge_list(EdgeDir.IN).extend(edgs, kind)
+    return len(batch)
@@ -0,0 +1,178 @@
+"""Parallel walker execution for Jac.
+
+spawn_parallel runs many (walker, start node) pairs across a process pool,
+over a graph published with jaclang.core.shared.publish. Each worker
+attaches to the graph once and runs the walkers it is sent. The walkers
+come back to the caller, with the graph nodes they refer to resolved to the
+caller's own proxies of them.
+
+With partitions, every node belongs to one partition and a walker only
+steps on nodes of the partition it runs in. When the head of its queue is
+owned by another partition, the walker is handed off, queue and all, to
+that partition in the next round. Rounds repeat until all walkers are
+done, so each walker visits nodes in the order a single spawn would.
+"""
+from __future__ import annotations
+
+import io
+import multiprocessing
+import pickle
+from array import array
+from collections import deque
+from typing import Any, Iterable, Optional, Sequence
+
+from jaclang.core.construct import NodeArchitype, WalkerArchitype
+from jaclang.core.frozen import FrozenAnchor, FrozenGraph
+from jaclang.core.shared import SharedGraph, attach
+
+# Largest number of walkers sent to a worker at once.
+BATCH_SIZE = 64
+
+# Graph and partitions of this process, when it is a pool worker.
+WORKER: dict[str, Any] = {}
+
+Batch = tuple[Optional[int], list[tuple[int, bytes]]]
+
+
+class GraphPickler(pickle.Pickler):
+    """Pickler writing proxies of a frozen graph as their node ids."""
+
+    def __init__(self, file: io.BytesIO, graph: FrozenGraph) -> None:
+        """Create pickler of objects referring to graph."""
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.graph = graph
+
+    def persistent_id(self, obj: Any) -> Optional[int]:  # noqa: ANN401
+        """Get the node id of a proxy of the graph."""
+        anchor = getattr(obj, "_jac_", None)
+        if type(anchor) is FrozenAnchor and anchor.graph is self.graph:
+            return anchor.idx
+        return None
+
+
+class GraphUnpickler(pickle.Unpickler):
+    """Unpickler reading node ids as proxies of a frozen graph."""
+
+    def __init__(self, file: io.BytesIO, graph: FrozenGraph) -> None:
+        """Create unpickler of objects referring to graph."""
+        super().__init__(file)
+        self.graph = graph
+
+    def persistent_load(self, pid: int) -> NodeArchitype:
+        """Get the proxy of a node id."""
+        return self.graph.node(pid)
+
+
+def dump_walker(walker: WalkerArchitype, graph: FrozenGraph) -> bytes:
+    """Pickle a walker, with its nodes as ids of graph."""
+    out = io.BytesIO()
+    GraphPickler(out, graph).dump(walker)
+    return out.getvalue()
+
+
+def load_walker(data: bytes, graph: FrozenGraph) -> WalkerArchitype:
+    """Unpickle a walker onto the proxies of graph."""
+    walker = GraphUnpickler(io.BytesIO(data), graph).load()
+    anchor = walker._jac_
+    # Ignored nodes are keyed by object id, which changes across processes.
+    anchor.ignores = {id(nd): nd for nd in anchor.ignores.values()}
+    return walker
+
+
+def init_worker(
+    name: str, types: list[type], partitions: Optional[Sequence[int]]
+) -> None:
+    """Attach a pool worker to the published graph."""
+    WORKER["graph"] = attach(name, types)
+    WORKER["partitions"] = partitions
+
+
+def run_batch(batch: Batch) -> tuple[list, list]:
+    """Run walkers of a batch in its partition, in a pool worker.
+
+    Returns the walkers that are done, by task id, and those handed off,
+    with the partition they go to.
+    """
+    part, items = batch
+    graph: FrozenGraph = WORKER["graph"]
+    parts: Optional[Sequence[int]] = WORKER["partitions"]
+
+    def owns(nd: Any) -> bool:  # noqa: ANN401
+        return parts is None or parts[nd._jac_.idx] == part
+
+    done = []
+    moved = []
+    for tid, data in items:
+        walker = load_walker(data, graph)
+        stopped = walker._jac_.resume(owns)
+        data = dump_walker(walker, graph)
+        if stopped is None:
+            done.append((tid, data))
+        else:
+            moved.append((tid, data, parts[stopped._jac_.idx]))  # type: ignore[index]
+    return done, moved
+
+
+def range_partitions(graph: FrozenGraph, parts: int) -> array:
+    """Split the nodes of graph into parts runs of consecutive node ids.
+
+    Node ids follow a breadth first walk from the root, so each run holds
+    nodes close to each other.
+    """
+    count = len(graph)
+    return array("i", (i * parts // count for i in range(count)))
+
+
+def node_id(graph: FrozenGraph, nd: NodeArchitype) -> int:
+    """Get the id of a proxy of graph."""
+    anchor = nd._jac_
+    if not isinstance(anchor, FrozenAnchor) or anchor.graph is not graph:
+        raise ValueError(f"{nd} is not a node of the graph")
+    return anchor.idx
+
+
+def spawn_parallel(
+    graph: SharedGraph,
+    tasks: Iterable[tuple[WalkerArchitype, NodeArchitype | int]],
+    partitions: Optional[Sequence[int]] = None,
+    processes: Optional[int] = None,
+    context: Optional[str] = None,
+) -> list[WalkerArchitype]:
+    """Run walkers from their start nodes of graph across a process pool.
+
+    Start nodes are proxies or ids of nodes of graph. partitions, if given,
+    maps each node id to its partition. The walkers are returned in task
+    order, as copies of the given ones after their run.
+    """
+    pending: dict[Optional[int], list[tuple[int, bytes]]] = {}
+    tasks = list(tasks)
+    for tid, (walker, start) in enumerate(tasks):
+        idx = start if isinstance(start, int) else node_id(graph, start)
+        anchor = walker._jac_
+        anchor.path = []
+        anchor.next = deque([graph.node(idx)])
+        part = partitions[idx] if partitions is not None else None
+        pending.setdefault(part, []).append((tid, dump_walker(walker, graph)))
+    results: list[Optional[bytes]] = [None] * len(tasks)
+    types = [kind.cls for kind in graph.node_types + graph.edge_types]
+    ctx = multiprocessing.get_context(context)
+    with ctx.Pool(
+        processes, initializer=init_worker, initargs=(graph.name, types, partitions)
+    ) as pool:
+        while pending:
+            batches: list[Batch] = [
+                (part, items[i : i + BATCH_SIZE])
+                for part, items in pending.items()
+                for i in range(0, len(items), BATCH_SIZE)
+            ]
+            pending = {}
+            for done, moved in pool.map(run_batch, batches, chunksize=1):
+                for tid, data in done:
+                    results[tid] = data
+                for tid, data, part in moved:
+                    pending.setdefault(part, []).append((tid, data))
+    walkers = [load_walker(data, graph) for data in results]  # type: ignore[arg-type]
+    for walker in walkers:
+        if walker._jac_.reports is not None:
+            walker._jac_.reports.close()
+    return walkers
@@ -0,0 +1,143 @@
+"""Walker traversal statistics for Jac.
+
+TraversalProfiler is off by default. While enabled, every walker spawn
+records a SpawnStats with the nodes it visited, the edges its edge refs
+scanned, call counts and wall time per ability, the frontier high-water
+mark and the size of its ignore set. The most recent spawns are kept for
+querying from Python or dumping as JSON. While disabled, spawns and edge
+refs pay one flag check.
+
+The spawns running are tracked per thread and asyncio task, so edge scans
+count against the spawn they happen in. Profiled spawns visit nodes one
+at a time, without fanning abilities out (see jaclang.core.fanout).
+"""
+from __future__ import annotations
+
+import json
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Optional, TextIO
+
+
+@dataclass(eq=False, slots=True)
+class SpawnStats:
+    """Statistics of one walker spawn."""
+
+    walker: str
+    node: str
+    nodes_visited: int = 0
+    edges_scanned: int = 0
+    frontier_peak: int = 0
+    ignored: int = 0
+    disengaged: bool = False
+    wall_time: float = 0.0
+    abilities: dict[str, list] = field(default_factory=dict)
+
+    def record(self, ability: str, elapsed: float) -> None:
+        """Add a call of ability taking elapsed seconds."""
+        entry = self.abilities.get(ability)
+        if entry is None:
+            self.abilities[ability] = [1, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get stats as plain data, abilities as {name: {calls, time}}."""
+        data = asdict(self)
+        data["abilities"] = {
+            name: {"calls": calls, "time": elapsed}
+            for name, (calls, elapsed) in self.abilities.items()
+        }
+        return data
+
+
+# Stats of the spawns running in this thread or task, innermost last.
+ACTIVE: ContextVar[tuple[SpawnStats, ...]] = ContextVar("ACTIVE", default=())
+
+
+class TraversalProfiler:
+    """Opt-in collector of walker spawn statistics."""
+
+    enabled: bool = False
+    spawns: deque[SpawnStats] = deque(maxlen=1000)
+
+    @staticmethod
+    def enable(keep: int = 1000) -> None:
+        """Start recording spawns, keeping the last keep of them."""
+        TraversalProfiler.spawns = deque(TraversalProfiler.spawns, maxlen=keep)
+        TraversalProfiler.enabled = True
+
+    @staticmethod
+    def disable() -> None:
+        """Stop recording spawns."""
+        TraversalProfiler.enabled = False
+
+    @staticmethod
+    def reset() -> None:
+        """Forget recorded spawns."""
+        TraversalProfiler.spawns.clear()
+
+    @staticmethod
+    def begin(walker: object, node: object) -> SpawnStats:
+        """Start stats of a spawn, nested spawns stack."""
+        stats = SpawnStats(
+            walker=walker.__class__.__name__, node=node.__class__.__name__
+        )
+        ACTIVE.set(ACTIVE.get() + (stats,))
+        return stats
+
+    @staticmethod
+    def end(stats: SpawnStats) -> None:
+        """Finish stats of a spawn."""
+        ACTIVE.set(tuple(i for i in ACTIVE.get() if i is not stats))
+        TraversalProfiler.spawns.append(stats)
+
+    @staticmethod
+    def scanned(count: int) -> None:
+        """Count edges scanned by an edge ref of the innermost spawn."""
+        active = ACTIVE.get()
+        if active:
+            active[-1].edges_scanned += count
+
+    @staticmethod
+    def summary() -> dict[str, dict[str, Any]]:
+        """Aggregate recorded spawns per walker type."""
+        walkers: dict[str, dict[str, Any]] = {}
+        for stats in TraversalProfiler.spawns:
+            agg = walkers.setdefault(
+                stats.walker,
+                {
+                    "spawns": 0,
+                    "nodes_visited": 0,
+                    "edges_scanned": 0,
+                    "frontier_peak": 0,
+                    "wall_time": 0.0,
+                    "abilities": {},
+                },
+            )
+            agg["spawns"] += 1
+            agg["nodes_visited"] += stats.nodes_visited
+            agg["edges_scanned"] += stats.edges_scanned
+            agg["frontier_peak"] = max(agg["frontier_peak"], stats.frontier_peak)
+            agg["wall_time"] += stats.wall_time
+            for name, (calls, elapsed) in stats.abilities.items():
+                ability = agg["abilities"].setdefault(name, {"calls": 0, "time": 0.0})
+                ability["calls"] += calls
+                ability["time"] += elapsed
+        return walkers
+
+    @staticmethod
+    def dump(out: Optional[TextIO] = None) -> str:
+        """Dump recorded spawns and their summary as JSON, to out if given."""
+        text = json.dumps(
+            {
+                "summary": TraversalProfiler.summary(),
+                "spawns": [i.to_dict() for i in TraversalProfiler.spawns],
+            },
+            indent=2,
+        )
+        if out:
+            out.write(text)
+        return text
@@ -0,0 +1,236 @@
+"""Registry of live architype instances for Jac.
+
+Node and edge architypes made with tracked=True record every instance
+created, whether constructed or restored from a store, in a registry kept
+on the class. Instances are held through weak references and leave the
+registry when collected. instances and count enumerate the live objects
+of a type and its tracked subclasses without walking the graph, and find
+looks them up by field values through hash indexes built on first use
+and kept current as fields are set.
+"""
+from __future__ import annotations
+
+import weakref
+from dataclasses import MISSING
+from itertools import count as counter
+from typing import Any, Iterator, Optional
+
+from jaclang.core.fieldwatch import watch_field
+from jaclang.core.utils import gc_paused
+
+
+class Entry(weakref.ref):
+    """Weak reference to a registered instance."""
+
+    __slots__ = ("reg", "seq", "oid")
+
+
+Group = dict[int, Entry]  # entries of instances with one value, by id
+
+
+class TypeRegistry:
+    """Live instances of one architype, in creation order.
+
+    Entries leave the registry as their instances are collected. Index
+    groups drop dead entries when read, or all at once when they make up
+    most of the entries held.
+    """
+
+    __slots__ = ("objs", "seq", "dead", "indexes")
+
+    def __init__(self) -> None:
+        """Create empty registry."""
+        self.objs: dict[int, Entry] = {}
+        self.seq = counter()
+        self.dead = 0
+        self.indexes: dict[str, Optional[dict[Any, Group]]] = {}
+
+    def drop(self, entry: Entry) -> None:
+        """Forget a collected instance."""
+        if self.objs.get(entry.oid) is entry:
+            del self.objs[entry.oid]
+        if self.indexes:
+            self.dead += 1
+            if self.dead > len(self.objs):
+                self.prune()
+
+    def prune(self) -> None:
+        """Remove dead entries from index groups."""
+        for idx in self.indexes.values():
+            for key, group in list((idx or {}).items()):
+                for oid, entry in list(group.items()):
+                    if entry() is None:
+                        del group[oid]
+                if not group:
+                    del idx[key]  # type: ignore[index]
+        self.dead = 0
+
+    def __len__(self) -> int:
+        """Get the number of live instances."""
+        return len(self.objs)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate live instances in creation order."""
+        objs = [entry() for entry in list(self.objs.values())]
+        return (obj for obj in objs if obj is not None)
+
+    def index(self, name: str) -> Optional[dict[Any, Group]]:
+        """Get entries by value of the name field, indexing them if needed.
+
+        None is returned if some value cannot be hashed.
+        """
+        if name in self.indexes:
+            return self.indexes[name]
+        idx: Optional[dict[Any, Group]] = {}
+        try:
+            with gc_paused():
+                for entry in list(self.objs.values()):
+                    obj = entry()
+                    if obj is not None:
+                        add_to(idx, getattr(obj, name, MISSING), entry)  # type: ignore[arg-type]
+        except TypeError:
+            idx = None
+        self.indexes[name] = idx
+        return idx
+
+    def lookup(self, name: str, value: Any) -> Optional[list[Any]]:  # noqa: ANN401
+        """Get instances whose name field equals value in creation order.
+
+        None is returned if the field cannot be indexed.
+        """
+        idx = self.index(name)
+        if idx is None:
+            return None
+        group = idx.get(value)
+        if not group:
+            return []
+        entries = sorted(group.values(), key=seq_of)
+        objs = [entry() for entry in entries]
+        if None in objs:
+            for entry in entries:
+                if entry() is None:
+                    del group[entry.oid]
+        return [obj for obj in objs if obj is not None]
+
+    def move(self, obj: Any, name: str, old: Any) -> None:  # noqa: ANN401
+        """Move obj within the index of name after the field was set."""
+        idx = self.indexes.get(name)
+        entry = self.objs.get(id(obj))
+        if idx is None or entry is None:
+            return
+        group = idx.get(old) if old is not MISSING else None
+        if group is not None and group.get(entry.oid) is entry:
+            del group[entry.oid]
+            if not group:
+                del idx[old]
+        try:
+            add_to(idx, getattr(obj, name), entry)
+        except TypeError:
+            self.indexes[name] = None
+
+
+def seq_of(entry: Entry) -> int:
+    """Get the creation order of an entry."""
+    return entry.seq
+
+
+def add_to(idx: dict[Any, Group], key: Any, entry: Entry) -> None:  # noqa: ANN401
+    """Add entry to the index group of key."""
+    group = idx.get(key)
+    if group is None:
+        group = idx[key] = {}
+    group[entry.oid] = entry
+
+
+def tracked_new(cls: type, *args: object, **kwargs: object) -> Any:  # noqa: ANN401
+    """Create an instance of a tracked architype and record it.
+
+    Subclasses of a tracked architype get their own registry on first use.
+    """
+    obj = object.__new__(cls)
+    reg = cls.__dict__.get("_jac_registry_")
+    if reg is None:
+        reg = cls._jac_registry_ = TypeRegistry()
+    entry = Entry(obj, dropped)
+    entry.reg = reg
+    entry.seq = next(reg.seq)
+    entry.oid = id(obj)
+    reg.objs[entry.oid] = entry
+    return obj
+
+
+def dropped(entry: Entry) -> None:
+    """Forget the collected instance of entry."""
+    entry.reg.drop(entry)
+
+
+def reindex(obj: Any, name: str, old: Any) -> None:  # noqa: ANN401
+    """Move obj within the index of its registry after name was set."""
+    reg = type(obj).__dict__.get("_jac_registry_")
+    if reg is not None and reg.indexes:
+        reg.move(obj, name, old)
+
+
+def track(cls: type) -> type:
+    """Record instances of cls and its subclasses in registries."""
+    if "_jac_registry_" not in cls.__dict__:
+        cls._jac_registry_ = TypeRegistry()
+        cls.__new__ = tracked_new  # type: ignore[assignment]
+    return cls
+
+
+def tracked(cls: type, subclasses: bool = True) -> list[tuple[type, TypeRegistry]]:
+    """Get cls and, with subclasses, the tracked ones, with their registries."""
+    found = []
+    todo = [cls]
+    while todo:
+        sub = todo.pop()
+        reg = sub.__dict__.get("_jac_registry_")
+        if reg is not None:
+            found.append((sub, reg))
+        if subclasses:
+            todo.extend(sub.__subclasses__())
+    if not found:
+        raise TypeError(f"{cls.__name__} is not tracked")
+    return found
+
+
+def registries(cls: type, subclasses: bool = True) -> list[TypeRegistry]:
+    """Get the registries of cls and, with subclasses, of those tracked."""
+    return [reg for _, reg in tracked(cls, subclasses)]
+
+
+def instances(cls: type, subclasses: bool = True) -> Iterator[Any]:
+    """Iterate live instances of a tracked architype."""
+    for reg in registries(cls, subclasses):
+        yield from reg
+
+
+def count(cls: type, subclasses: bool = True) -> int:
+    """Get the number of live instances of a tracked architype."""
+    return sum(len(reg) for reg in registries(cls, subclasses))
+
+
+def find(
+    cls: type, subclasses: bool = True, **values: Any  # noqa: ANN401
+) -> list[Any]:
+    """Get live instances whose fields equal the given values.
+
+    The first field is looked up through an index of each registry, which
+    is built on first use and kept current after. Fields are watched on
+    the class of each registry, as subclasses may redeclare them.
+    """
+    if not values:
+        return list(instances(cls, subclasses))
+    (name, value), *rest = values.items()
+    found = []
+    for owner, reg in tracked(cls, subclasses):
+        if name not in reg.indexes:
+            watch_field(owner, name, reindex)
+        group = reg.lookup(name, value)
+        if group is None:
+            group = [o for o in reg if getattr(o, name, MISSING) == value]
+        found.extend(
+            o for o in group if all(getattr(o, n, MISSING) == v for n, v in rest)
+        )
+    return found
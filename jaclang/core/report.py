@@ -0,0 +1,164 @@
+"""Report buffers of walker spawns.
+
+Values a walker reports while it runs go to the ReportBuffer of its spawn.
+A spawn uses the buffer set on the walker anchor, if still open, or starts
+a new one on its first report, and closes it when it ends. Callers read it
+as a list with values(), or iterate it, synchronously or with async for,
+to get each value as soon as it is reported. Iterators end when the spawn
+ends, so consumers in other threads or tasks stream a running walker.
+
+Buffers keep at most limit values in memory. Older values are spilled to
+a temporary file if spill is set, and dropped otherwise, with a warning
+logged when a buffer first drops one. A spawn starts its buffer with
+ReportBuffer.default_limit and default_spill: 100,000 values, then older
+ones are dropped. Spilled values are pickled with the nodes they refer
+to, so spilling is off by default; set default_spill to keep every value.
+"""
+from __future__ import annotations
+
+import asyncio
+import pickle
+import tempfile
+import threading
+from collections import deque
+from typing import Any, AsyncIterator, IO, Iterator, Optional
+
+from jaclang.utils.log import logging
+
+
+class ReportBuffer:
+    """Bounded buffer of the values reported by a walker spawn."""
+
+    # Settings of the buffers spawns start on their first report.
+    default_limit: Optional[int] = 100_000
+    default_spill: bool = False
+
+    def __init__(self, limit: Optional[int] = None, spill: bool = False) -> None:
+        """Create buffer keeping limit values in memory, spilling older ones."""
+        self.limit = limit
+        self.spill = spill
+        self.items: deque[Any] = deque()
+        self.start = 0
+        self.offsets: list[int] = []
+        self.file: Optional[IO[bytes]] = None
+        self.closed = False
+        self.cond = threading.Condition()
+        self.waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+
+    def __len__(self) -> int:
+        """Get the number of values reported so far."""
+        return self.start + len(self.items)
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of values dropped from the buffer."""
+        return self.start - len(self.offsets)
+
+    def append(self, value: Any) -> None:  # noqa: ANN401
+        """Add a reported value."""
+        with self.cond:
+            if self.closed:
+                raise ValueError("Report buffer is closed.")
+            self.items.append(value)
+            if self.limit is not None and len(self.items) > self.limit:
+                old = self.items.popleft()
+                if self.spill:
+                    self.spill_value(old)
+                elif not self.dropped:
+                    logging.warning(
+                        f"Report buffer over its limit of {self.limit} values, "
+                        "dropping the oldest. Set spill to keep them."
+                    )
+                self.start += 1
+            self.notify()
+
+    def close(self) -> None:
+        """Mark the buffer complete, ending iterators once they catch up."""
+        with self.cond:
+            self.closed = True
+            self.notify()
+
+    def notify(self) -> None:
+        """Wake up iterators waiting for values, with the lock held."""
+        self.cond.notify_all()
+        for loop, event in self.waiters:
+            loop.call_soon_threadsafe(event.set)
+        self.waiters = []
+
+    def spill_value(self, value: Any) -> None:  # noqa: ANN401
+        """Write a value out of memory to the spill file."""
+        if self.file is None:
+            self.file = tempfile.TemporaryFile(prefix="jac-report-")
+        self.file.seek(0, 2)
+        self.offsets.append(self.file.tell())
+        pickle.dump(value, self.file, pickle.HIGHEST_PROTOCOL)
+
+    def get(self, pos: int) -> tuple[int, Any]:
+        """Get the value at pos, or the first one after it still kept.
+
+        Returns the position of the value too. The lock must be held.
+        """
+        if pos < len(self.offsets):
+            self.file.seek(self.offsets[pos])  # type: ignore[union-attr]
+            return pos, pickle.load(self.file)  # type: ignore[arg-type]
+        pos = max(pos, self.start)
+        return pos, self.items[pos - self.start]
+
+    def values(self) -> list[Any]:
+        """Get the values kept so far, spilled ones included."""
+        with self.cond:
+            return [self.get(pos)[1] for pos in range(len(self.offsets))] + list(
+                self.items
+            )
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate values kept, waiting for new ones until closed."""
+        pos = 0
+        while True:
+            with self.cond:
+                while pos >= len(self) and not self.closed:
+                    self.cond.wait()
+                if pos >= len(self):
+                    return
+                pos, value = self.get(pos)
+            pos += 1
+            yield value
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        """Iterate values kept, awaiting new ones until closed."""
+        pos = 0
+        while True:
+            with self.cond:
+                ready = pos < len(self) or self.closed
+                if ready:
+                    if pos >= len(self):
+                        return
+                    pos, value = self.get(pos)
+                else:
+                    event = asyncio.Event()
+                    self.waiters.append((asyncio.get_running_loop(), event))
+            if ready:
+                pos += 1
+                yield value
+            else:
+                await event.wait()
+
+    def __reduce__(self) -> tuple:
+        """Pickle the settings and values kept, as parallel spawns do."""
+        return (restore_buffer, (self.limit, self.spill, self.values(), self.closed))
+
+    def __del__(self) -> None:
+        """Remove the spill file."""
+        if self.file is not None:
+            self.file.close()
+
+
+def restore_buffer(
+    limit: Optional[int], spill: bool, values: list[Any], closed: bool
+) -> ReportBuffer:
+    """Rebuild a pickled report buffer."""
+    buf = ReportBuffer(limit, spill)
+    for value in values:
+        buf.append(value)
+    buf.closed = closed
+    return buf
@@ -0,0 +1,87 @@
+"""Shared memory graphs for Jac worker processes.
+
+publish encodes the graph around a node as a frozen graph into a
+multiprocessing.shared_memory segment. Worker processes attach to the
+segment by name and get a read-only FrozenGraph over it: walkers spawned on
+its root read the shared arrays in place, and only the proxies of nodes in
+use are made per process. The memory of the graph is paid once, however
+many workers attach.
+
+The publishing process owns the segment and unlinks it when done. Workers
+only close their mapping and keep the segment out of resource trackers of
+their own, which would otherwise unlink it when the first of them exits.
+"""
+from __future__ import annotations
+
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterable, Optional
+
+from jaclang.core.construct import NodeArchitype
+from jaclang.core.frozen import FrozenGraph, encode_graph
+
+
+class SharedGraph(FrozenGraph):
+    """Frozen graph read from a shared memory segment."""
+
+    def __init__(
+        self,
+        shm: shared_memory.SharedMemory,
+        types: Iterable[type] = (),
+        owner: bool = False,
+    ) -> None:
+        """Read the graph in shm; owner graphs unlink it on unlink."""
+        self.shm = shm
+        self.owner = owner
+        super().__init__(shm.buf.toreadonly(), types)
+
+    @property
+    def name(self) -> str:
+        """Get the name workers attach to the segment by."""
+        return self.shm.name
+
+    def close(self) -> None:
+        """Release the views and unmap the segment from this process."""
+        super().close()
+        if self.buf is not None:
+            self.buf.release()
+            self.buf = None
+            self.shm.close()
+
+    def unlink(self) -> None:
+        """Close the graph and free the segment, if this process owns it."""
+        self.close()
+        if self.owner:
+            self.shm.unlink()
+            self.owner = False
+
+    def __exit__(self, *exc: object) -> None:
+        """Close the graph, unlinking it if owned."""
+        self.unlink()
+
+
+def publish(
+    start: NodeArchitype, name: Optional[str] = None, types: Iterable[type] = ()
+) -> SharedGraph:
+    """Copy the graph around start into a new shared memory segment."""
+    chunks = encode_graph(start)
+    shm = shared_memory.SharedMemory(name=name, create=True, size=sum(map(len, chunks)))
+    offset = 0
+    for chunk in chunks:
+        shm.buf[offset : offset + len(chunk)] = chunk
+        offset += len(chunk)
+    return SharedGraph(shm, types, owner=True)
+
+
+def attach(name: str, types: Iterable[type] = ()) -> SharedGraph:
+    """Attach to a graph published under name, read-only."""
+    try:
+        shm = shared_memory.SharedMemory(name, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        # Before Python 3.13 attaching always registers the segment. A
+        # tracker inherited from the publisher already holds it, but one
+        # started here would unlink it when this process exits.
+        inherited = getattr(resource_tracker._resource_tracker, "_fd", None)
+        shm = shared_memory.SharedMemory(name)
+        if inherited is None:
+            resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return SharedGraph(shm, types)
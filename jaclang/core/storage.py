@@ -0,0 +1,380 @@
+"""Persistent graph storage for Jac.
+
+A GraphStore pages the nodes and edges of a graph in and out of a storage
+engine. Nodes loaded from a store start out hollow: their fields are set,
+but their adjacency lists are only read when an edge ref, connect,
+disconnect or walker step touches them. At most max_loaded nodes keep their
+adjacency in memory; past that the nodes paged in longest ago are written
+back and made hollow again, so they can be freed once nothing else holds
+them. Identity maps keep one live object per stored node and edge.
+"""
+from __future__ import annotations
+
+import dataclasses
+import functools
+import pickle
+import sqlite3
+import sys
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+
+from jaclang.compiler.constant import EdgeDir
+from jaclang.core.construct import (
+    Architype,
+    EdgeAnchor,
+    EdgeArchitype,
+    NodeAnchor,
+    NodeArchitype,
+)
+
+ROOT_ID = 1
+
+AdjacencyRow = tuple[int, int, int, int, Optional[int], str, bytes]
+
+
+@functools.cache
+def arch_fields(cls: type) -> Optional[tuple[str, ...]]:
+    """Get the field names of a dataclass architype."""
+    if dataclasses.is_dataclass(cls):
+        return tuple(f.name for f in dataclasses.fields(cls))
+    return None
+
+
+def arch_state(obj: Architype) -> dict[str, Any]:
+    """Get the persisted field state of an architype."""
+    names = arch_fields(type(obj))
+    if names is not None:
+        return {name: getattr(obj, name) for name in names}
+    return dict(getattr(obj, "__dict__", {}))
+
+
+def arch_name(cls: type) -> str:
+    """Get the name an architype class is stored under."""
+    if "<locals>" in cls.__qualname__:
+        raise TypeError(f"Cannot store architype {cls.__qualname__} defined locally")
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def arch_class(name: str) -> type:
+    """Get the architype class stored under name."""
+    module, qualname = name.split(":")
+    found: Any = sys.modules[module]
+    for part in qualname.split("."):
+        found = getattr(found, part)
+    return found
+
+
+def arch_restore(name: str, data: bytes) -> Any:  # noqa: ANN401
+    """Create an architype from its stored state without running __init__."""
+    cls = arch_class(name)
+    obj = cls.__new__(cls)
+    for fld, val in pickle.loads(data).items():
+        setattr(obj, fld, val)
+    return obj
+
+
+class GraphStore(ABC):
+    """Graph storage engine base.
+
+    Engines implement the read_* and write_* primitives; paging, eviction
+    and identity tracking live here.
+    """
+
+    def __init__(self, max_loaded: int = 0) -> None:
+        """Create store, max_loaded of 0 never evicts."""
+        self.max_loaded = max_loaded
+        self.nodes: weakref.WeakValueDictionary[
+            int, NodeArchitype
+        ] = weakref.WeakValueDictionary()
+        self.edges: weakref.WeakValueDictionary[
+            int, EdgeArchitype
+        ] = weakref.WeakValueDictionary()
+        self.loaded: OrderedDict[int, NodeArchitype] = OrderedDict()
+        self.fresh: list[NodeArchitype] = []
+        self.written: set[int] = set()
+
+    @abstractmethod
+    def read_nodes(self, jids: Iterable[int]) -> dict[int, tuple[str, bytes]]:
+        """Read (arch, data) of stored nodes by id."""
+
+    @abstractmethod
+    def read_adjacency(self, jid: int) -> list[AdjacencyRow]:
+        """Read adjacency of a node in list order.
+
+        Rows are (list dir, edge id, source id, target id, edge dir, arch,
+        data).
+        """
+
+    @abstractmethod
+    def write_node(self, jid: Optional[int], arch: str, data: bytes) -> int:
+        """Insert (jid of None) or update a node, return its id."""
+
+    @abstractmethod
+    def write_edge(
+        self,
+        jid: Optional[int],
+        src: int,
+        trg: int,
+        dir: Optional[int],
+        arch: str,
+        data: bytes,
+    ) -> int:
+        """Insert (jid of None) or update an edge, return its id."""
+
+    @abstractmethod
+    def write_adjacency(self, jid: int, rows: list[tuple[int, int, int]]) -> None:
+        """Replace adjacency of a node with (list dir, pos, edge id) rows."""
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Make writes durable."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Close the engine."""
+
+    def open(self, root: NodeArchitype) -> NodeArchitype:
+        """Bind root to the stored root node, storing it if the store is empty.
+
+        Edges root already has in memory are kept after the stored ones.
+        """
+        anchor = root._jac_
+        if self.read_nodes([ROOT_ID]):
+            anchor.jid = ROOT_ID
+            anchor.store = self
+            self.nodes[ROOT_ID] = root
+        elif self.node_jid(root) != ROOT_ID:
+            raise ValueError("Root must be the first node of a store.")
+        return root
+
+    def page_in(self, nd: NodeArchitype) -> None:
+        """Load adjacency of a hollow node."""
+        anchor = nd._jac_
+        if anchor.jid is None:
+            raise ValueError("Node is not stored.")
+        anchor.store = None
+        kept = [(EdgeDir.IN, anchor.in_edges), (EdgeDir.OUT, anchor.out_edges)]
+        anchor.in_edges = anchor.out_edges = None
+        rows = self.read_adjacency(anchor.jid)
+        node_rows = self.read_nodes(
+            {
+                end
+                for _, edge_id, src, trg, *_ in rows
+                if edge_id not in self.edges
+                for end in (src, trg)
+                if end not in self.nodes
+            }
+        )
+        for list_dir, edge_id, src, trg, dir, arch, data in rows:
+            edg = self.edges.get(edge_id)
+            if edg is None:
+                edg = arch_restore(arch, data)
+                edg._jac_ = EdgeAnchor(
+                    obj=edg,
+                    source=self.node(src, node_rows),
+                    target=self.node(trg, node_rows),
+                    dir=EdgeDir(dir) if dir is not None else None,
+                    jid=edge_id,
+                )
+                self.edges[edge_id] = edg
+            anchor.edge_list(EdgeDir(list_dir)).append(edg)
+        for list_dir, edges in kept:
+            for edg in edges or ():
+                if edg not in anchor.edge_list(list_dir):
+                    anchor.edge_list(list_dir).append(edg)
+        self.track(nd)
+        self.evict()
+
+    def node(self, jid: int, node_rows: dict[int, tuple[str, bytes]]) -> NodeArchitype:
+        """Get the live object of a stored node, creating it hollow if needed."""
+        nd = self.nodes.get(jid)
+        if nd is None:
+            nd = arch_restore(*node_rows[jid])
+            # Columnar nodes already got an anchor holding their row.
+            anchor = getattr(nd, "_jac_", None) or NodeAnchor(obj=nd)
+            anchor.jid, anchor.store = jid, self
+            nd._jac_ = anchor
+            self.nodes[jid] = nd
+        return nd
+
+    def track(self, nd: NodeArchitype) -> None:
+        """Mark a node as having its adjacency in memory."""
+        self.loaded[nd._jac_.jid] = nd
+        self.loaded.move_to_end(nd._jac_.jid)
+
+    def evict(self) -> None:
+        """Page out nodes loaded longest ago until within max_loaded."""
+        while self.max_loaded and len(self.loaded) > self.max_loaded:
+            _, nd = self.loaded.popitem(last=False)
+            self.written = set()
+            self.save_node(nd)
+            self.fresh.clear()
+            anchor = nd._jac_
+            anchor.in_edges = anchor.out_edges = None
+            anchor.store = self
+
+    def node_jid(self, nd: NodeArchitype) -> int:
+        """Get the id of a node, storing it first if it is new."""
+        anchor = nd._jac_
+        if anchor.jid is None:
+            anchor.jid = self.write_node(
+                None, arch_name(type(nd)), pickle.dumps(arch_state(nd))
+            )
+            self.nodes[anchor.jid] = nd
+            self.track(nd)
+            self.fresh.append(nd)
+        return anchor.jid
+
+    def save_node(self, nd: NodeArchitype) -> None:
+        """Write fields and adjacency of a node with adjacency in memory."""
+        anchor = nd._jac_
+        jid = self.node_jid(nd)
+        self.write_node(jid, arch_name(type(nd)), pickle.dumps(arch_state(nd)))
+        rows = []
+        for list_dir, edges in (
+            (EdgeDir.IN, anchor.in_edges),
+            (EdgeDir.OUT, anchor.out_edges),
+        ):
+            for pos, edg in enumerate(edges or ()):
+                rows.append((list_dir.value, pos, self.save_edge(edg)))
+        self.write_adjacency(jid, rows)
+
+    def save_edge(self, edg: EdgeArchitype) -> int:
+        """Write an edge once per save pass, return its id."""
+        anchor = edg._jac_
+        if anchor.jid is not None and anchor.jid in self.written:
+            return anchor.jid
+        if not anchor.source or not anchor.target:
+            raise ValueError("Cannot store a detached edge.")
+        anchor.jid = self.write_edge(
+            anchor.jid,
+            self.node_jid(anchor.source),
+            self.node_jid(anchor.target),
+            anchor.dir.value if anchor.dir else None,
+            arch_name(type(edg)),
+            pickle.dumps(arch_state(edg)),
+        )
+        self.edges[anchor.jid] = edg
+        self.written.add(anchor.jid)
+        return anchor.jid
+
+    def commit(self) -> None:
+        """Write every live node and edge, then flush."""
+        self.written = set()
+        self.fresh = []
+        queue = list(self.loaded.values())
+        while queue:
+            self.save_node(queue.pop())
+            queue.extend(self.fresh)
+            self.fresh.clear()
+        for jid, nd in list(self.nodes.items()):
+            if nd._jac_.store is self:
+                self.write_node(jid, arch_name(type(nd)), pickle.dumps(arch_state(nd)))
+        self.flush()
+
+
+class SqliteGraphStore(GraphStore):
+    """Graph store kept in a SQLite database."""
+
+    schema = """
+    CREATE TABLE IF NOT EXISTS node (
+        id INTEGER PRIMARY KEY, arch TEXT NOT NULL, data BLOB NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS edge (
+        id INTEGER PRIMARY KEY,
+        src INTEGER NOT NULL,
+        trg INTEGER NOT NULL,
+        dir INTEGER,
+        arch TEXT NOT NULL,
+        data BLOB NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS adj (
+        node INTEGER NOT NULL,
+        dir INTEGER NOT NULL,
+        pos INTEGER NOT NULL,
+        edge INTEGER NOT NULL,
+        PRIMARY KEY (node, dir, pos)
+    ) WITHOUT ROWID;
+    """
+
+    def __init__(self, path: str = ":memory:", max_loaded: int = 0) -> None:
+        """Open or create the database at path."""
+        super().__init__(max_loaded)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(self.schema)
+
+    def read_nodes(self, jids: Iterable[int]) -> dict[int, tuple[str, bytes]]:
+        """Read (arch, data) of stored nodes by id."""
+        jids = list(jids)
+        found = {}
+        for i in range(0, len(jids), 900):
+            chunk = jids[i : i + 900]
+            for jid, arch, data in self.conn.execute(
+                "SELECT id, arch, data FROM node WHERE id IN "
+                f"({','.join('?' * len(chunk))})",
+                chunk,
+            ):
+                found[jid] = (arch, data)
+        return found
+
+    def read_adjacency(self, jid: int) -> list[AdjacencyRow]:
+        """Read adjacency of a node in list order."""
+        return self.conn.execute(
+            "SELECT a.dir, e.id, e.src, e.trg, e.dir, e.arch, e.data "
+            "FROM adj a JOIN edge e ON e.id = a.edge "
+            "WHERE a.node = ? ORDER BY a.dir, a.pos",
+            (jid,),
+        ).fetchall()
+
+    def write_node(self, jid: Optional[int], arch: str, data: bytes) -> int:
+        """Insert (jid of None) or update a node, return its id."""
+        if jid is None:
+            cur = self.conn.execute(
+                "INSERT INTO node (arch, data) VALUES (?, ?)", (arch, data)
+            )
+            return cur.lastrowid
+        self.conn.execute(
+            "UPDATE node SET arch = ?, data = ? WHERE id = ?", (arch, data, jid)
+        )
+        return jid
+
+    def write_edge(
+        self,
+        jid: Optional[int],
+        src: int,
+        trg: int,
+        dir: Optional[int],
+        arch: str,
+        data: bytes,
+    ) -> int:
+        """Insert (jid of None) or update an edge, return its id."""
+        if jid is None:
+            cur = self.conn.execute(
+                "INSERT INTO edge (src, trg, dir, arch, data) VALUES (?, ?, ?, ?, ?)",
+                (src, trg, dir, arch, data),
+            )
+            return cur.lastrowid
+        self.conn.execute(
+            "UPDATE edge SET src = ?, trg = ?, dir = ?, arch = ?, data = ? "
+            "WHERE id = ?",
+            (src, trg, dir, arch, data, jid),
+        )
+        return jid
+
+    def write_adjacency(self, jid: int, rows: list[tuple[int, int, int]]) -> None:
+        """Replace adjacency of a node with (list dir, pos, edge id) rows."""
+        self.conn.execute("DELETE FROM adj WHERE node = ?", (jid,))
+        self.conn.executemany(
+            "INSERT INTO adj (node, dir, pos, edge) VALUES (?, ?, ?, ?)",
+            [(jid, *row) for row in rows],
+        )
+
+    def flush(self) -> None:
+        """Commit the current transaction."""
+        self.conn.commit()
+
+    def close(self) -> None:
+        """Close the database."""
+        self.conn.close()
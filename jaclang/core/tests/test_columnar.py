@@ -0,0 +1,142 @@
+"""Tests for columnar node storage."""
+import gc
+import os
+import tempfile
+from dataclasses import field
+
+from jaclang.core import columnar
+from jaclang.core.columnar import Column, ColumnAnchor, filter_compr
+from jaclang.core.construct import EdgeDir, Root
+from jaclang.core.storage import SqliteGraphStore
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.utils.test import TestCase
+
+
+@Jac.make_node(on_entry=[], on_exit=[], columnar=True)
+class Sensor:
+    """Columnar node."""
+
+    temp: float = 0.0
+    hits: int = 0
+    live: bool = True
+    name: str = ""
+    log: list = field(default_factory=list)
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True, columnar=True)
+class Cell:
+    """Slotted columnar node."""
+
+    val: int
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+class Plain:
+    """Node with the same fields as Sensor, stored per node."""
+
+    temp: float = 0.0
+    hits: int = 0
+    live: bool = True
+    name: str = ""
+
+
+class ColumnarTests(TestCase):
+    """Test columnar node storage."""
+
+    def test_fields_in_columns(self) -> None:
+        """Scalar fields live in columns, others on the node."""
+        store = Sensor._jac_columns_
+        self.assertEqual(list(store.columns), ["temp", "hits", "live"])
+        self.assertIsInstance(vars(Sensor)["hits"], Column)
+        a, b = Sensor(temp=1.5, hits=2, name="a"), Sensor(live=False)
+        self.assertIsInstance(a._jac_, ColumnAnchor)
+        self.assertEqual(store.columns["temp"][a._jac_.row], 1.5)
+        self.assertEqual((a.temp, a.hits, a.live, a.name), (1.5, 2, True, "a"))
+        self.assertIs(b.live, False)
+        b.hits += 3
+        self.assertEqual(store.columns["hits"][b._jac_.row], 3)
+        cell = Cell(val=7)
+        self.assertEqual(cell.val, 7)
+        self.assertFalse(hasattr(cell, "__dict__"))
+
+    def test_rows_reused(self) -> None:
+        """Rows of collected nodes are given to new nodes."""
+        store = Cell._jac_columns_
+        gc.collect()
+        cells = [Cell(val=i) for i in range(10)]
+        rows, size = store.rows, len(store)
+        del cells[:5]
+        gc.collect()
+        self.assertEqual(len(store), size - 5)
+        more = [Cell(val=-1) for _ in range(5)]
+        self.assertEqual(store.rows, rows)
+        self.assertEqual([c.val for c in cells + more], [5, 6, 7, 8, 9] + [-1] * 5)
+
+    def test_compr_matches_plain(self) -> None:
+        """Filter and assign comprehensions give the same results either way."""
+        results = []
+        for cls in (Sensor, Plain):
+            nodes = [cls(temp=i / 2, hits=i % 3, name=str(i)) for i in range(12)]
+            root = Root()
+            for nd in nodes:
+                Jac.connect(root, nd, Jac.build_edge(EdgeDir.OUT, None, None))
+            kids = Jac.edge_ref(root, EdgeDir.OUT, None, None)
+            hot = Jac.filter_compr(kids, (("temp", ">=", 2.0), ("hits", "!=", 1)))
+            Jac.assign_compr(hot, (("live", "hits"), (False, 9)))
+            names = Jac.filter_compr(kids, (("name", "in", {"4", "5", "6"}),))
+            results.append(
+                (
+                    [n.name for n in hot],
+                    [(n.live, n.hits) for n in nodes],
+                    [n.name for n in names],
+                )
+            )
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0][0], ["5", "6", "8", "9", "11"])
+        mixed = [Sensor(hits=1), Plain(hits=1), Sensor(hits=2)]
+        self.assertEqual(filter_compr(mixed, (("hits", "==", 1),)), mixed[:2])
+
+    def test_batch_filter(self) -> None:
+        """Large columnar sets filter with NumPy to the same nodes."""
+        if columnar.numpy is None:
+            self.skipTest("NumPy is not installed")
+        nodes = [
+            Sensor(temp=i % 7, hits=i % 5, live=i % 2, name=str(i % 3))
+            for i in range(columnar.BATCH_MIN * 2)
+        ]
+        store = Sensor._jac_columns_
+        for conds in (
+            (("temp", ">", 2.5), ("hits", "<=", 3)),
+            (("live", "==", True), ("name", "in", {"1", "2"}), ("hits", "!=", 0)),
+            (("name", "==", "0"),),
+            (("temp", "==", -1),),
+        ):
+            names, ops, values = zip(*conds)
+            expected = columnar.compiled_filter(nodes, store, names, ops, values)
+            self.assertEqual(
+                columnar.batch_filter(nodes, store, *zip(*conds)), expected
+            )
+            self.assertEqual(filter_compr(nodes, conds), expected)
+
+    def test_stored_round_trip(self) -> None:
+        """Nodes restored from a store get rows of their own."""
+        path = os.path.join(tempfile.mkdtemp(), "graph.db")
+        store = SqliteGraphStore(path)
+        top = store.open(Root())
+        Jac.connect(
+            top,
+            Sensor(temp=3.5, hits=2, live=False, name="s"),
+            Jac.build_edge(EdgeDir.OUT, None, None),
+        )
+        store.commit()
+        store.close()
+        store = SqliteGraphStore(path)
+        top = store.open(Root())
+        (sensor,) = Jac.edge_ref(top, EdgeDir.OUT, None, None)
+        self.assertIsInstance(sensor._jac_, ColumnAnchor)
+        self.assertIs(sensor._jac_.store, store)
+        self.assertEqual(
+            (sensor.temp, sensor.hits, sensor.live, sensor.name), (3.5, 2, False, "s")
+        )
+        self.assertEqual(Jac.edge_ref(sensor, EdgeDir.IN, None, None), [top])
+        store.close()
@@ -0,0 +1,377 @@
+"""Tests for Jac core constructs."""
+import asyncio
+import inspect
+from dataclasses import field
+
+from jaclang.core.construct import (
+    AbilityDispatch,
+    EdgeDir,
+    NodeAnchor,
+    Root,
+    WalkerAnchor,
+)
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.utils.test import TestCase
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+class Person:
+    """Person node."""
+
+    name: str = ""
+
+
+@Jac.make_edge(on_entry=[], on_exit=[])
+class Knows:
+    """Knows edge."""
+
+
+@Jac.make_edge(on_entry=[], on_exit=[])
+class FriendOf(Knows):
+    """Friend edge, a special kind of knows."""
+
+
+@Jac.make_edge(on_entry=[], on_exit=[])
+class Follows:
+    """Follows edge."""
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True)
+class Sensor:
+    """Slotted sensor node."""
+
+    reading: float = 0.0
+
+
+@Jac.make_edge(on_entry=[], on_exit=[], slots=True)
+class Wire:
+    """Slotted edge."""
+
+    length: int = 1
+
+
+@Jac.make_edge(on_entry=[], on_exit=[])
+class Route:
+    """Edge with a mutable default."""
+
+    cost: int = 1
+    stops: list = field(default_factory=list)
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("step", Person)], on_exit=[])
+class Tracer:
+    """Walker recording visit order."""
+
+    seen: list = field(default_factory=list)
+
+    def step(self, here: Person) -> None:
+        """Record node and visit its children."""
+        self.seen.append(here.name)
+        nbrs = Jac.edge_ref(here, EdgeDir.OUT, None, None)
+        Jac.visit_node(self, nbrs)
+        Jac.ignore(self, nbrs)
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("step", Person)], on_exit=[])
+class AsyncTracer:
+    """Walker with an async ability, recording visit and finish order."""
+
+    seen: list = field(default_factory=list)
+    done: list = field(default_factory=list)
+    active: int = 0
+    most: int = 0
+
+    async def step(self, here: Person) -> None:
+        """Record node, wait on b nodes and visit its children."""
+        self.seen.append(here.name)
+        self.active += 1
+        self.most = max(self.most, self.active)
+        await asyncio.sleep(0.05 if here.name.startswith("b") else 0)
+        self.active -= 1
+        self.done.append(here.name)
+        Jac.visit_node(self, Jac.edge_ref(here, EdgeDir.OUT, None, None))
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("step", Person)], on_exit=[])
+class AsyncPruner:
+    """Walker with an async ability ignoring the nodes it visits."""
+
+    seen: list = field(default_factory=list)
+
+    async def step(self, here: Person) -> None:
+        """Record node, visit its children, then ignore them after a wait."""
+        self.seen.append(here.name)
+        nbrs = Jac.edge_ref(here, EdgeDir.OUT, None, None)
+        Jac.visit_node(self, nbrs)
+        await asyncio.sleep(0)
+        Jac.ignore(self, nbrs)
+
+
+@Jac.make_obj(on_entry=[], on_exit=[], slots=True)
+class Reading:
+    """Slotted object with every kind of field."""
+
+    value: float
+    unit: str = "C"
+    tags: list = field(default_factory=list)
+    seq: int = field(default=0, init=False)
+    source: str = field(default="", kw_only=True)
+
+    def __post_init__(self) -> None:
+        """Count tags of the reading."""
+        self.seq = len(self.tags)
+
+
+@Jac.make_walker(on_entry=[], on_exit=[])
+class Custom:
+    """Walker with its own constructor."""
+
+    def __init__(self, n: int) -> None:
+        """Set up from n."""
+        self.n = n * 2
+
+
+def link(src: Person, dst: Person, typ: type, dir: EdgeDir = EdgeDir.OUT) -> None:
+    """Connect two nodes with an edge of the given type."""
+    Jac.connect(src, dst, Jac.build_edge(dir, typ, None))
+
+
+class ConstructTests(TestCase):
+    """Test core constructs."""
+
+    def setUp(self) -> None:
+        """Set up test."""
+        return super().setUp()
+
+    def test_typed_edge_ref_uses_type_buckets(self) -> None:
+        """Typed edge refs only see edges of (subclasses of) the filter type."""
+        hub = Person(name="hub")
+        kids = [Person(name=str(i)) for i in range(6)]
+        for i, kid in enumerate(kids):
+            link(hub, kid, [Knows, FriendOf, Follows][i % 3])
+        out = hub._jac_.edges[EdgeDir.OUT]
+        self.assertEqual(len(out.by_type[FriendOf]), 2)
+        self.assertEqual(
+            [n.name for n in Jac.edge_ref(hub, EdgeDir.OUT, FriendOf, None)],
+            ["1", "4"],
+        )
+        self.assertEqual(
+            [n.name for n in Jac.edge_ref(hub, EdgeDir.OUT, Knows, None)],
+            ["0", "1", "3", "4"],
+        )
+        self.assertEqual(
+            [n.name for n in Jac.edge_ref(kids[2], EdgeDir.IN, Follows, None)],
+            ["hub"],
+        )
+        self.assertEqual(Jac.edge_ref(kids[2], EdgeDir.IN, Knows, None), [])
+        Jac.disconnect(hub, kids[0], EdgeDir.OUT, None, None)
+        link(hub, Person(name="6"), FriendOf)
+        link(hub, Person(name="7"), Knows)
+        self.assertEqual(
+            [n.name for n in Jac.edge_ref(hub, EdgeDir.OUT, Knows, None)],
+            ["1", "3", "4", "6", "7"],
+        )
+        out.clear()
+        self.assertEqual(Jac.edge_ref(hub, EdgeDir.OUT, Follows, None), [])
+
+    def test_disconnect_keeps_order(self) -> None:
+        """Disconnect removes edges on both ends and keeps the rest in order."""
+        hub = Person(name="hub")
+        kids = [Person(name=str(i)) for i in range(5)]
+        for i, kid in enumerate(kids):
+            link(hub, kid, FriendOf if i % 2 else Follows)
+        self.assertTrue(Jac.disconnect(hub, kids[1], EdgeDir.OUT, None, None))
+        self.assertFalse(Jac.disconnect(hub, kids[1], EdgeDir.OUT, None, None))
+        self.assertFalse(Jac.disconnect(hub, kids[2], EdgeDir.OUT, FriendOf, None))
+        self.assertEqual(len(kids[1]._jac_.edges[EdgeDir.IN]), 0)
+        self.assertEqual(
+            [n.name for n in Jac.edge_ref(hub, EdgeDir.OUT, None, None)],
+            ["0", "2", "3", "4"],
+        )
+        self.assertEqual(
+            [n.name for n in Jac.edge_ref(hub, EdgeDir.OUT, FriendOf, None)], ["3"]
+        )
+        out = hub._jac_.edges[EdgeDir.OUT]
+        self.assertEqual(out[1]._jac_.target.name, "2")
+        self.assertEqual(out[-1]._jac_.target.name, "4")
+        Jac.disconnect(hub, kids, EdgeDir.OUT, None, None)
+        self.assertEqual(len(out), 0)
+        self.assertEqual(out.by_type, {})
+        self.assertEqual(Jac.edge_ref(hub, EdgeDir.OUT, FriendOf, None), [])
+
+    def test_walker_visit_order(self) -> None:
+        """Walker frontier is first in first out and ignores are honoured."""
+        top = Person(name="a")
+        b, c, d = Person(name="b"), Person(name="c"), Person(name="d")
+        link(top, b, Knows)
+        link(top, c, Knows)
+        link(b, d, Knows)
+        link(c, d, Knows)
+        link(d, top, Knows)
+        walker = Tracer()
+        Jac.ignore(walker, top)
+        Jac.spawn_call(top, walker)
+        self.assertEqual(walker.seen, ["a", "b", "c", "d"])
+        self.assertEqual(len(walker._jac_.next), 0)
+        self.assertEqual(walker._jac_.ignores, {})
+
+    def test_spawn_async(self) -> None:
+        """Async abilities are awaited, concurrently within a frontier."""
+        top = Person(name="a")
+        kids = [Person(name=n) for n in "bcd"]
+        for kid in kids:
+            link(top, kid, Knows)
+            link(kid, Person(name=kid.name * 2), Knows)
+        order = ["a", "b", "c", "d", "bb", "cc", "dd"]
+        walker = AsyncTracer()
+        asyncio.run(Jac.spawn_async(walker, top))
+        self.assertEqual((walker.seen, walker.done, walker.most), (order, order, 1))
+        walker = AsyncTracer()
+        asyncio.run(Jac.spawn_async(top, walker, concurrency=2))
+        self.assertEqual(walker.seen, order)
+        self.assertEqual(walker.done, ["a", "c", "d", "b", "cc", "dd", "bb"])
+        self.assertEqual(walker.most, 2)
+        self.assertEqual(walker._jac_.ignores, {})
+
+    def test_spawn_async_ignores(self) -> None:
+        """Ignores made within a frontier apply in frontier order."""
+        top = Person(name="a")
+        b, c, d = Person(name="b"), Person(name="c"), Person(name="d")
+        link(top, b, Knows)
+        link(top, c, Knows)
+        link(b, d, Knows)
+        link(c, d, Knows)
+        for concurrency in (None, 2):
+            walker = AsyncPruner()
+            asyncio.run(Jac.spawn_async(top, walker, concurrency=concurrency))
+            self.assertEqual(walker.seen, ["a", "b", "c", "d"])
+            self.assertEqual(walker._jac_.ignores, {})
+
+    def test_ability_dispatch_tables(self) -> None:
+        """Dispatch tables are cached per class pair and rebuilt on new abilities."""
+        walker = Tracer()
+        Jac.spawn_call(Person(name="solo"), walker)
+        self.assertEqual(walker.seen, ["solo"])
+        table = AbilityDispatch.resolve(Tracer, Person)
+        self.assertIs(table, AbilityDispatch.resolve(Tracer, Person))
+        self.assertEqual(AbilityDispatch.resolve(Tracer, Knows), [])
+
+        def shout(self: Tracer, here: Person) -> None:
+            self.seen.append(here.name.upper())
+
+        Tracer.shout = shout
+        AbilityDispatch.add_ability(Tracer, Jac.DSFunc("shout", Person), False)
+        try:
+            walker = Tracer()
+            Jac.spawn_call(Person(name="solo"), walker)
+            self.assertEqual(walker.seen, ["solo", "SOLO"])
+        finally:
+            Tracer._jac_exit_funcs_.pop()
+            AbilityDispatch.invalidate()
+        walker = Tracer()
+        Jac.spawn_call(Person(name="solo"), walker)
+        self.assertEqual(walker.seen, ["solo"])
+        Tracer.shout = shout
+        shout_ability = Jac.DSFunc("shout", Person)
+        shout_ability.resolve(Tracer)
+        Tracer._jac_exit_funcs_.append(shout_ability)
+        try:
+            walker = Tracer()
+            Jac.spawn_call(Person(name="solo"), walker)
+            self.assertEqual(walker.seen, ["solo", "SOLO"])
+        finally:
+            Tracer._jac_exit_funcs_.remove(shout_ability)
+        self.assertEqual(AbilityDispatch.resolve(Tracer, Person), table)
+
+    def test_any_dir_edge_ref(self) -> None:
+        """Any direction edge refs see both in and out neighbours."""
+        mid = Person(name="mid")
+        left, right = Person(name="left"), Person(name="right")
+        link(left, mid, Knows)
+        link(mid, right, FriendOf)
+        link(mid, left, Follows)
+        self.assertEqual(
+            [n.name for n in Jac.edge_ref(mid, EdgeDir.ANY, None, None)],
+            ["right", "left", "left"],
+        )
+        self.assertEqual(
+            [n.name for n in mid._jac_.neighbors(EdgeDir.ANY, unique=True)],
+            ["right", "left"],
+        )
+        self.assertEqual(
+            [n.name for n in Jac.edge_ref(mid, EdgeDir.ANY, Knows, None)],
+            ["right", "left"],
+        )
+        self.assertTrue(Jac.disconnect(mid, left, EdgeDir.ANY, None, None))
+        self.assertEqual(
+            [n.name for n in Jac.edge_ref(mid, EdgeDir.ANY, None, None)], ["right"]
+        )
+
+    def test_slotted_architypes(self) -> None:
+        """Slotted architypes carry no instance dict and allocate edges lazily."""
+        a, b = Sensor(reading=1.5), Sensor()
+        self.assertFalse(hasattr(a, "__dict__"))
+        self.assertFalse(hasattr(a._jac_, "__dict__"))
+        self.assertIsNone(a._jac_.out_edges)
+        self.assertEqual(Jac.edge_ref(a, EdgeDir.OUT, None, None), [])
+        Jac.connect(a, b, Jac.build_edge(EdgeDir.OUT, Wire, (("length",), (3,))))
+        self.assertIsNone(b._jac_.out_edges)
+        edge = a._jac_.edges[EdgeDir.OUT][0]
+        self.assertIsNone(a._jac_.in_edges)
+        self.assertEqual(set(b._jac_.edges), {EdgeDir.IN, EdgeDir.OUT})
+        self.assertIsNone(b._jac_.out_edges)
+        b._jac_.edges[EdgeDir.OUT].append(Wire())
+        self.assertEqual(len(b._jac_.out_edges), 1)
+        b._jac_.edges[EdgeDir.OUT].clear()
+        self.assertFalse(hasattr(Root(), "__dict__"))
+        self.assertFalse(hasattr(edge, "__dict__"))
+        self.assertEqual(edge.length, 3)
+        self.assertEqual(Jac.edge_ref(a, EdgeDir.OUT, Wire, None), [b])
+        self.assertEqual(repr(a), "Sensor(reading=1.5)")
+
+    def test_fused_init(self) -> None:
+        """Generated constructors set fields and anchor like dataclass init."""
+        self.assertFalse(hasattr(Reading.__init__, "__wrapped__"))
+        self.assertEqual(
+            list(inspect.signature(Reading.__init__).parameters),
+            ["__jac_self", "value", "unit", "tags", "source"],
+        )
+        a, b = Reading(1.0, tags=[1, 2], source="s"), Reading(2.0)
+        self.assertFalse(hasattr(a, "__dict__"))
+        self.assertEqual(
+            (a.value, a.unit, a.tags, a.seq, a.source), (1.0, "C", [1, 2], 2, "s")
+        )
+        self.assertEqual(b.tags, [])
+        self.assertIsNot(b.tags, Reading(3.0).tags)
+        self.assertIs(a._jac_.obj, a)
+        self.assertIs(Person(name="x")._jac_.__class__, NodeAnchor)
+        with self.assertRaises(TypeError):
+            Reading(1.0, "C", [], "s")
+        walker = Custom(2)
+        self.assertEqual(walker.n, 4)
+        self.assertIsInstance(walker._jac_, WalkerAnchor)
+
+    def test_list_connect_edge_per_pair(self) -> None:
+        """Connecting lists creates one edge per pair from the edge spec."""
+        a, b, c, d = (Person(name=n) for n in "abcd")
+        spec = Jac.build_edge(EdgeDir.OUT, Route, (("cost",), (5,)))
+        Jac.connect([a, b], [c, d], spec)
+        edges = [e for n in (a, b) for e in n._jac_.edges[EdgeDir.OUT]]
+        self.assertIs(edges[0], spec)
+        self.assertEqual(len({id(e) for e in edges}), 4)
+        self.assertEqual(
+            [(e._jac_.source.name, e._jac_.target.name) for e in edges],
+            [("a", "c"), ("a", "d"), ("b", "c"), ("b", "d")],
+        )
+        self.assertEqual({e.cost for e in edges}, {5})
+        self.assertEqual(len({id(e.stops) for e in edges}), 4)
+        self.assertEqual(Jac.edge_ref(c, EdgeDir.IN, Route, None), [a, b])
+        Jac.disconnect(a, c, EdgeDir.OUT, None, None)
+        self.assertEqual(Jac.edge_ref(a, EdgeDir.OUT, None, None), [d])
+        self.assertEqual(Jac.edge_ref(b, EdgeDir.OUT, None, None), [c, d])
+        e = Person(name="e")
+        Jac.connect(e, [a, b], Jac.build_edge(EdgeDir.IN, None, None))
+        fan_in = list(e._jac_.edges[EdgeDir.OUT])
+        self.assertEqual(len(fan_in), 2)
+        self.assertEqual([x._jac_.source for x in fan_in], [a, b])
+        self.assertIs(b._jac_.in_edges[0], fan_in[1])
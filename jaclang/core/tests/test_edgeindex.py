@@ -0,0 +1,175 @@
+"""Tests for edge field indexes."""
+from jaclang.core.construct import EdgeDir, Root
+from jaclang.core.edgeindex import (
+    EdgeIndex,
+    HASH,
+    HashIndex,
+    SortedIndex,
+    index_edges,
+    ordered,
+    top_k,
+)
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.utils.test import TestCase
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True)
+class Movie:
+    """Rated node."""
+
+    title: str = ""
+
+
+@Jac.make_edge(on_entry=[], on_exit=[], slots=True)
+class Rated:
+    """Slotted edge with a sorted index on stars."""
+
+    stars: int = 0
+    tag: str = ""
+
+
+@Jac.make_edge(on_entry=[], on_exit=[])
+class Tagged:
+    """Edge with a hash index on label."""
+
+    label: object = ""
+
+
+index_edges(Rated, "stars")
+index_edges(Tagged, "label", HASH)
+
+
+class EdgeIndexTests(TestCase):
+    """Test edge field indexes."""
+
+    def setUp(self) -> None:
+        """Rate ten movies from a root, with a tagged edge to each."""
+        self.root = Root()
+        self.movies = [Movie(title=str(i)) for i in range(10)]
+        for i, mv in enumerate(self.movies):
+            rated = Jac.build_edge(EdgeDir.OUT, Rated, (("stars", "tag"), (i % 5, "x")))
+            Jac.connect(self.root, mv, rated)
+            tagged = Jac.build_edge(EdgeDir.OUT, Tagged, (("label",), ("ab"[i % 2],)))
+            Jac.connect(self.root, mv, tagged)
+        return super().setUp()
+
+    def titles(self, cls: type, *conds: tuple) -> list[str]:
+        """Get titles of movies reached through edges passing conds."""
+        found = Jac.edge_ref(self.root, EdgeDir.OUT, cls, Jac.edge_filter(conds))
+        return [mv.title for mv in found]
+
+    def test_lookup_matches_scan(self) -> None:
+        """Indexed edge refs give the nodes a scan gives, in list order."""
+        cases = [
+            (Rated, ("stars", ">=", 3)),
+            (Rated, ("stars", "<", 1), ("tag", "==", "x")),
+            (Rated, ("stars", "==", 2)),
+            (Rated, ("tag", "==", "x"), ("stars", ">", 3)),
+            (Tagged, ("label", "==", "a")),
+            (Tagged, ("label", "in", ["b", "c"])),
+        ]
+        for cls, *conds in cases:
+            expected = [
+                mv.title
+                for mv in Jac.edge_ref(
+                    self.root,
+                    EdgeDir.OUT,
+                    cls,
+                    lambda x, conds=conds: Jac.filter_compr(x, tuple(conds)),
+                )
+            ]
+            self.assertEqual(self.titles(cls, *conds), expected)
+        self.assertEqual(self.titles(Rated, ("stars", ">=", 3)), list("3489"))
+        indexes = self.root._jac_.out_edges.indexes
+        self.assertIsInstance(indexes[(Rated, "stars")], SortedIndex)
+        self.assertIsInstance(indexes[(Tagged, "label")], HashIndex)
+
+    def test_index_follows_changes(self) -> None:
+        """Indexes follow connects, disconnects and field updates."""
+        self.assertEqual(self.titles(Rated, ("stars", "==", 4)), ["4", "9"])
+        self.assertEqual(self.titles(Tagged, ("label", "==", "b")), list("13579"))
+        extra = Movie(title="x")
+        Jac.connect(
+            self.root, extra, Jac.build_edge(EdgeDir.OUT, Rated, (("stars",), (4,)))
+        )
+        Jac.disconnect(self.root, self.movies[4], EdgeDir.OUT, Rated, None)
+        self.assertEqual(self.titles(Rated, ("stars", "==", 4)), ["9", "x"])
+        for edg in self.root._jac_.out_edges:
+            if isinstance(edg, Rated) and edg._jac_.target is self.movies[0]:
+                edg.stars = 4
+            if isinstance(edg, Tagged) and edg._jac_.target is self.movies[1]:
+                edg.label = "a"
+        self.assertEqual(self.titles(Rated, ("stars", "==", 4)), ["0", "9", "x"])
+        self.assertEqual(self.titles(Rated, ("stars", "<", 1)), ["5"])
+        self.assertEqual(self.titles(Tagged, ("label", "==", "b")), list("3579"))
+        self.assertEqual(
+            Jac.edge_ref(self.movies[9], EdgeDir.IN, Rated, None), [self.root]
+        )
+
+    def test_unindexable_values(self) -> None:
+        """Fields an index cannot hold fall back to scanning."""
+        self.assertEqual(self.titles(Tagged, ("label", "==", "a")), list("02468"))
+        for edg in self.root._jac_.out_edges:
+            if isinstance(edg, Tagged) and edg._jac_.target is self.movies[0]:
+                edg.label = ["a"]
+        self.assertIsNone(self.root._jac_.out_edges.indexes[(Tagged, "label")])
+        self.assertEqual(self.titles(Tagged, ("label", "==", "a")), list("2468"))
+        with self.assertRaises(TypeError):
+            self.titles(Rated, ("stars", ">", "a"))
+
+    def test_substring_membership(self) -> None:
+        """Membership in a string tests substrings, not single characters."""
+        for edg in self.root._jac_.out_edges:
+            if isinstance(edg, Tagged) and edg._jac_.target is self.movies[0]:
+                edg.label = "ab"
+        self.assertEqual(
+            self.titles(Tagged, ("label", "in", "xab")), list("0123456789")
+        )
+        self.assertEqual(self.titles(Tagged, ("label", "in", "b")), list("13579"))
+        self.assertIsInstance(
+            self.root._jac_.out_edges.indexes[(Tagged, "label")], HashIndex
+        )
+
+    def test_moved_edges_in_list_order(self) -> None:
+        """Edges moved between buckets come back in list order."""
+        self.assertEqual(self.titles(Tagged, ("label", "==", "a")), list("02468"))
+        for label in ("b", "a"):
+            for edg in self.root._jac_.out_edges:
+                if isinstance(edg, Tagged) and edg._jac_.target is self.movies[0]:
+                    edg.label = label
+        for conds in (
+            (("label", "==", "a"),),
+            (("label", "in", ["a"]),),
+            (("label", "in", ["a", "b"]),),
+        ):
+            scan = Jac.edge_ref(
+                self.root,
+                EdgeDir.OUT,
+                Tagged,
+                lambda x, conds=conds: Jac.filter_compr(x, conds),
+            )
+            self.assertEqual(self.titles(Tagged, *conds), [mv.title for mv in scan])
+        self.assertEqual(self.titles(Tagged, ("label", "==", "a")), list("02468"))
+
+    def test_ordered(self) -> None:
+        """Sorted indexes give edges in field order and the top k."""
+        stars = [e.stars for e in ordered(self.root, Rated, "stars")]
+        self.assertEqual(stars, sorted(i % 5 for i in range(10)))
+        best = top_k(self.root, Rated, "stars", 3)
+        self.assertEqual([e._jac_.target.title for e in best], ["9", "4", "8"])
+        self.assertEqual(top_k(self.root, Rated, "stars", 0), [])
+        with self.assertRaises(ValueError):
+            ordered(self.root, Tagged, "label")
+
+    def test_index_methods_required(self) -> None:
+        """Index kinds missing lookups cannot be created."""
+
+        class AddOnly(EdgeIndex):
+            def add(self, edg: object, seq: object = None) -> None:
+                pass
+
+            def remove(self, edg: object, key: object) -> int:
+                return 0
+
+        with self.assertRaises(TypeError):
+            AddOnly(Tagged, "label")  # type: ignore[abstract]
@@ -0,0 +1,131 @@
+"""Tests for streaming graph export."""
+import io
+import json
+from xml.etree import ElementTree
+
+from jaclang.core.construct import EdgeDir, Root
+from jaclang.core.export import GraphWriter, export_graph
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.utils.test import TestCase
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+class City:
+    """Exported node."""
+
+    name: str = ""
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+class Depot:
+    """Exported node of another type."""
+
+
+@Jac.make_edge(on_entry=[], on_exit=[])
+class Road:
+    """Exported edge."""
+
+    km: int = 0
+
+
+def link(src: object, dst: object, km: int = 0) -> None:
+    """Connect two nodes with a road."""
+    Jac.connect(src, dst, Jac.build_edge(EdgeDir.OUT, Road, (("km",), (km,))))
+
+
+class ExportTests(TestCase):
+    """Test graph exporters."""
+
+    def build(self) -> Root:
+        """Build a small graph with a cycle, a self loop and an in edge."""
+        top = Root()
+        a, b, c = City(name='a "x"'), City(name="b"), City(name="c")
+        link(top, a, 1)
+        link(a, b, 2)
+        link(b, c, 3)
+        link(c, a, 4)
+        link(c, c, 5)
+        Jac.connect(Depot(), b, Jac.build_edge(EdgeDir.OUT, None, None))
+        return top
+
+    def export(self, start: object, format: str = "jsonl", **kwargs: object) -> str:
+        """Export to a string."""
+        out = io.StringIO()
+        export_graph(start, out, format, **kwargs)
+        return out.getvalue()
+
+    def test_jsonl_writes_each_edge_once(self) -> None:
+        """Every reachable node and edge is written once, nodes first."""
+        lines = [json.loads(i) for i in self.export(self.build()).splitlines()]
+        nodes = {i["node"]: i for i in lines if "node" in i}
+        edges = [i for i in lines if "source" in i]
+        self.assertEqual(len(nodes), 5)
+        self.assertEqual(nodes[1]["data"], {"name": 'a "x"'})
+        self.assertEqual(
+            sorted(e["data"]["km"] for e in edges if "data" in e), [1, 2, 3, 4, 5]
+        )
+        self.assertEqual(len(edges), 6)
+        written = set()
+        for line in lines:
+            if "node" in line:
+                written.add(line["node"])
+            else:
+                self.assertLessEqual({line["source"], line["target"]}, written)
+        names = {i["data"]["name"]: k for k, i in nodes.items() if "data" in i}
+        self.assertIn(
+            {
+                "source": names["c"],
+                "target": names['a "x"'],
+                "type": "Road",
+                "data": {"km": 4},
+            },
+            edges,
+        )
+
+    def test_dot_and_graphml(self) -> None:
+        """DOT labels are escaped and GraphML is well formed."""
+        top = self.build()
+        dot = self.export(top, "dot")
+        self.assertIn('1 [label="City(name=\'a \\"x\\"\')"];', dot)
+        self.assertIn('0 -> 1 [label="Road"];', dot)
+        self.assertTrue(dot.endswith("}"))
+        self.assertEqual(top._jac_.gen_dot(), dot)
+        tree = ElementTree.fromstring(self.export(top, "graphml"))
+        ns = {"g": "http://graphml.graphdrawing.org/xmlns"}
+        self.assertEqual(len(tree.findall("g:graph/g:node", ns)), 5)
+        self.assertEqual(len(tree.findall("g:graph/g:edge", ns)), 6)
+        with self.assertRaises(ValueError):
+            self.export(top, "svg")
+
+    def test_limits_and_filters(self) -> None:
+        """Depth, node count and type filters bound what is written."""
+        top = self.build()
+        count = export_graph(top, io.StringIO(), "dot", depth=1)
+        self.assertEqual(count, 2)
+        self.assertEqual(export_graph(top, io.StringIO(), max_nodes=3), 3)
+        self.assertEqual(export_graph(top, io.StringIO(), node_types=(Root, City)), 4)
+        self.assertEqual(export_graph(top, io.StringIO(), edge_types=(Road,)), 4)
+        lines = self.export(top, edge_types=(Road,), depth=2).splitlines()
+        self.assertEqual(len(lines), 4 + 5)
+
+    def test_deep_chain(self) -> None:
+        """Export is iterative, so depth is not bounded by recursion."""
+        top = Root()
+        prev = top
+        for i in range(5000):
+            nxt = City(name=str(i))
+            link(prev, nxt)
+            prev = nxt
+        out = io.StringIO()
+        self.assertEqual(export_graph(top, out, "dot"), 5001)
+        self.assertIn("4999 -> 5000", out.getvalue())
+
+    def test_writer_methods_required(self) -> None:
+        """Writers missing node or edge output cannot be created."""
+
+        class NodesOnly(GraphWriter):
+            def node(self, idx: int, nd: object) -> None:
+                self.out.write(f"{idx}\n")
+
+        with self.assertRaises(TypeError):
+            NodesOnly(io.StringIO())  # type: ignore[abstract]
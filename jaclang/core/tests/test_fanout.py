@@ -0,0 +1,132 @@
+"""Tests for thread pool fan-out of walker abilities."""
+import hashlib
+import threading
+from dataclasses import field
+
+from jaclang.core.construct import EdgeDir
+from jaclang.core.fanout import AbilityFanout, parallel_safe
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.utils.test import TestCase
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True)
+class Hub:
+    """Node with a payload to hash."""
+
+    name: str = ""
+    payload: bytes = b""
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True)
+class Item:
+    """Leaf node."""
+
+    name: str = ""
+
+
+@Jac.make_walker(
+    on_entry=[Jac.DSFunc("at_hub", Hub), Jac.DSFunc("at_item", Item)], on_exit=[]
+)
+class Hasher:
+    """Walker hashing hubs in parallel and listing items in order."""
+
+    digests: dict = field(default_factory=dict)
+    threads: set = field(default_factory=set)
+    items: list = field(default_factory=list)
+    stop: str = ""
+
+    @parallel_safe
+    def at_hub(self, here: Hub) -> None:
+        """Hash the payload and visit the hub's children."""
+        self.digests[here.name] = hashlib.sha256(here.payload).hexdigest()
+        self.threads.add(threading.current_thread().name)
+        if here.name == self.stop:
+            Jac.disengage(self)
+            return
+        Jac.visit_node(self, Jac.edge_ref(here, EdgeDir.OUT, None, None))
+
+    def at_item(self, here: Item) -> None:
+        """List the item."""
+        self.items.append(here.name)
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("at_hub", Hub)], on_exit=[])
+class Pruner:
+    """Walker visiting the children of hubs, then ignoring them."""
+
+    seen: list = field(default_factory=list)
+
+    @parallel_safe
+    def at_hub(self, here: Hub) -> None:
+        """Record the hub, visit its children and ignore them."""
+        self.seen.append(here.name)
+        kids = Jac.edge_ref(here, EdgeDir.OUT, None, None)
+        Jac.visit_node(self, kids)
+        Jac.ignore(self, kids)
+
+
+def build() -> Hub:
+    """Build a hub of hubs, each with items and some with hubs of their own."""
+    top = Hub(name="top")
+    for i in range(12):
+        hub = Hub(name=f"h{i}", payload=bytes([i]) * 10_000)
+        Jac.connect(top, hub, Jac.build_edge(EdgeDir.OUT, None, None))
+        kids = [Item(name=f"h{i}.{j}") for j in range(i % 3 + 1)]
+        if i % 4 == 0:
+            kids.insert(1, Hub(name=f"h{i}.hub"))
+        Jac.connect(hub, kids, Jac.build_edge(EdgeDir.OUT, None, None))
+    return top
+
+
+class FanoutTests(TestCase):
+    """Test thread pool fan-out of walker abilities."""
+
+    def tearDown(self) -> None:
+        """Tear down test."""
+        AbilityFanout.disable()
+        return super().tearDown()
+
+    def test_same_as_serial(self) -> None:
+        """Fanned out visits are merged in the order of a serial spawn."""
+        top = build()
+        serial = Hasher()
+        Jac.spawn_call(top, serial)
+        self.assertEqual(serial.threads, {"MainThread"})
+        for batch in (256, 5):
+            AbilityFanout.enable(max_workers=4, batch=batch)
+            walker = Hasher()
+            Jac.spawn_call(top, walker)
+            self.assertEqual(walker.items, serial.items)
+            self.assertEqual(walker.digests, serial.digests)
+            self.assertTrue(any(i.startswith("jac-fanout") for i in walker.threads))
+            self.assertEqual(walker._jac_.ignores, {})
+        AbilityFanout.disable()
+        self.assertIsNone(AbilityFanout.pool)
+        walker = Hasher()
+        Jac.spawn_call(top, walker)
+        self.assertEqual(walker.threads, {"MainThread"})
+
+    def test_disengage(self) -> None:
+        """Disengaging in a batch stops the walk after the batch."""
+        top = build()
+        serial = Hasher(stop="h3")
+        Jac.spawn_call(top, serial)
+        self.assertEqual(len(serial.digests), 5)
+        # One worker starts batch nodes in queue order, so later ones are
+        # skipped as a serial spawn would.
+        AbilityFanout.enable(max_workers=1)
+        walker = Hasher(stop="h3")
+        Jac.spawn_call(top, walker)
+        self.assertEqual(walker.digests, serial.digests)
+        self.assertEqual(walker.items, [])
+
+    def test_ignores_in_queue_order(self) -> None:
+        """Ignores made within a batch apply to later nodes of the batch."""
+        top, left, right, low = (Hub(name=n) for n in ("top", "a", "b", "c"))
+        for src, dst in ((top, [left, right]), (left, low), (right, low)):
+            Jac.connect(src, dst, Jac.build_edge(EdgeDir.OUT, None, None))
+        AbilityFanout.enable(max_workers=2)
+        walker = Pruner()
+        Jac.spawn_call(top, walker)
+        self.assertEqual(sorted(walker.seen), ["a", "b", "c", "top"])
+        self.assertEqual(walker._jac_.ignores, {})
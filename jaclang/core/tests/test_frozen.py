@@ -0,0 +1,126 @@
+"""Tests for frozen CSR graphs."""
+import os
+import tempfile
+from dataclasses import field
+
+from jaclang.core.construct import EdgeDir, GenericEdge, Root
+from jaclang.core.frozen import FrozenAnchor, freeze, open_frozen
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.utils.test import TestCase
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+class User:
+    """Frozen node."""
+
+    name: str = ""
+    age: int = 0
+    score: float = 0.0
+    active: bool = False
+    tags: list = field(default_factory=list)
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True, columnar=True)
+class Item:
+    """Frozen columnar node."""
+
+    price: int = 0
+
+
+@Jac.make_edge(on_entry=[], on_exit=[], slots=True)
+class Likes:
+    """Frozen edge."""
+
+    weight: int = 0
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("step", None)], on_exit=[])
+class Crawler:
+    """Walker recording the nodes it steps on."""
+
+    seen: list = field(default_factory=list)
+
+    def step(self, here: object) -> None:
+        """Record node and move on."""
+        self.seen.append(getattr(here, "name", None) or getattr(here, "price", None))
+        Jac.ignore(self, here)
+        Jac.visit_node(self, Jac.edge_ref(here, EdgeDir.OUT, None, None))
+
+
+class FrozenTests(TestCase):
+    """Test frozen graphs."""
+
+    def setUp(self) -> None:
+        """Build a small graph and freeze it."""
+        self.root = Root()
+        self.users = [
+            User(name=n, age=i, score=i / 2, active=bool(i % 2), tags=[i])
+            for i, n in enumerate(["ann", "bob", "cy"])
+        ]
+        self.items = [Item(price=p) for p in (5, 7)]
+        Jac.connect(self.root, self.users, Jac.build_edge(EdgeDir.OUT, None, None))
+        for i, item in enumerate(self.items):
+            Jac.connect(
+                self.users[0],
+                item,
+                Jac.build_edge(EdgeDir.OUT, Likes, (("weight",), (i + 1,))),
+            )
+        Jac.connect(
+            self.users[1], self.users[2], Jac.build_edge(EdgeDir.OUT, None, None)
+        )
+        self.path = os.path.join(tempfile.mkdtemp(), "graph.csr")
+        self.assertEqual(freeze(self.root, self.path), 6)
+        return super().setUp()
+
+    def test_edge_refs_match(self) -> None:
+        """Edge refs on proxies give the nodes the live graph gives."""
+        with open_frozen(self.path) as graph:
+            top = graph.root
+            self.assertIsInstance(top, Root)
+            self.assertIsInstance(top._jac_, FrozenAnchor)
+            live = [self.root, *self.users, *self.items]
+            for dir in (EdgeDir.OUT, EdgeDir.IN, EdgeDir.ANY):
+                for kind in (None, Likes, GenericEdge):
+                    for i, nd in enumerate(live):
+                        expected = Jac.edge_ref(nd, dir, kind, None)
+                        found = Jac.edge_ref(graph.node(i), dir, kind, None)
+                        self.assertEqual(
+                            [type(n) for n in found], [type(n) for n in expected]
+                        )
+            users = Jac.edge_ref(top, EdgeDir.OUT, None, None)
+            self.assertEqual([u.name for u in users], ["ann", "bob", "cy"])
+            self.assertEqual([u.age for u in users], [0, 1, 2])
+            self.assertEqual([u.score for u in users], [0.0, 0.5, 1.0])
+            self.assertEqual([u.active for u in users], [False, True, False])
+            self.assertEqual(users[2].tags, [2])
+            self.assertIs(Jac.edge_ref(top, EdgeDir.OUT, None, None)[0], users[0])
+            items = Jac.edge_ref(users[0], EdgeDir.OUT, Likes, None)
+            self.assertEqual([i.price for i in items], [5, 7])
+            heavy = Jac.edge_ref(
+                users[0], EdgeDir.OUT, Likes, Jac.edge_filter((("weight", ">", 1),))
+            )
+            self.assertEqual([i.price for i in heavy], [7])
+            self.assertEqual(Jac.edge_ref(items[1], EdgeDir.IN, None, None), [users[0]])
+
+    def test_walker(self) -> None:
+        """Walkers traverse proxies like live nodes."""
+        live = Crawler()
+        Jac.spawn_call(self.root, live)
+        with open_frozen(self.path) as graph:
+            frozen = Crawler()
+            Jac.spawn_call(graph.root, frozen)
+        self.assertEqual(frozen.seen, live.seen)
+        self.assertEqual(frozen.seen, [None, "ann", "bob", "cy", 5, 7, "cy"])
+
+    def test_read_only(self) -> None:
+        """Proxies cannot be connected or disconnected."""
+        with open_frozen(self.path) as graph:
+            top = graph.root
+            with self.assertRaises(TypeError):
+                Jac.connect(top, User(), Jac.build_edge(EdgeDir.OUT, None, None))
+            with self.assertRaises(TypeError):
+                Jac.disconnect(top, graph.node(1), EdgeDir.OUT, None, None)
+        with open(self.path, "r+b") as f:
+            f.write(b"x")
+        with self.assertRaises(ValueError):
+            open_frozen(self.path)
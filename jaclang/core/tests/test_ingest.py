@@ -0,0 +1,94 @@
+"""Tests for bulk graph ingestion."""
+import io
+
+from jaclang.core.construct import EdgeDir, GenericEdge
+from jaclang.core.ingest import (
+    edge_tuples,
+    load_edges,
+    load_nodes,
+    read_csv,
+    read_jsonl,
+)
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.utils.test import TestCase
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+class City:
+    """City node."""
+
+    name: str = ""
+    pop: int = 0
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True)
+class Port:
+    """Slotted port node keyed by its id field."""
+
+    id: int = 0
+
+
+@Jac.make_edge(on_entry=[], on_exit=[], slots=True)
+class Road:
+    """Road edge."""
+
+    km: int = 0
+
+
+@Jac.make_edge(on_entry=[], on_exit=[])
+class Ferry:
+    """Ferry edge."""
+
+
+class IngestTests(TestCase):
+    """Test bulk ingestion."""
+
+    def test_csv_load(self) -> None:
+        """Nodes and edges load from CSV like connect builds them."""
+        nodes = load_nodes(
+            read_csv(
+                io.StringIO("id,name,pop\n1,a,10\n2,b,20\n3,c,30\n"), {"pop": int}
+            ),
+            City,
+        )
+        self.assertEqual(
+            [(n.name, n.pop) for n in nodes.values()], [("a", 10), ("b", 20), ("c", 30)]
+        )
+        edges = "source,target,type,km\n1,2,road,5\n1,3,road,7\n3,1,road,1\n"
+        count = load_edges(
+            edge_tuples(read_csv(io.StringIO(edges), {"km": int})),
+            nodes,
+            {"road": Road},
+            batch_size=2,
+        )
+        self.assertEqual(count, 3)
+        a, b, c = nodes["1"], nodes["2"], nodes["3"]
+        self.assertEqual(Jac.edge_ref(a, EdgeDir.OUT, None, None), [b, c])
+        self.assertEqual(Jac.edge_ref(a, EdgeDir.IN, None, None), [c])
+        self.assertEqual(Jac.edge_ref(b, EdgeDir.IN, Road, None), [a])
+        self.assertEqual([e.km for e in a._jac_.edges[EdgeDir.OUT]], [5, 7])
+        edge = a._jac_.edges[EdgeDir.OUT][0]
+        self.assertIs(edge._jac_.source, a)
+        self.assertIs(edge._jac_.target, b)
+        self.assertTrue(Jac.disconnect(a, b, EdgeDir.OUT, None, None))
+        self.assertEqual(Jac.edge_ref(b, EdgeDir.IN, None, None), [])
+
+    def test_jsonl_mixed_types(self) -> None:
+        """Records pick node types, edges mix types and objects as ends."""
+        lines = '{"id": 1, "type": "port"}\n\n{"id": 2, "type": "city", "name": "x"}\n'
+        nodes = load_nodes(read_jsonl(io.StringIO(lines)), {"port": Port, "city": City})
+        port, city = nodes[1], nodes[2]
+        self.assertEqual((port.id, city.name), (1, "x"))
+        load_edges(
+            [
+                (port, city, Road, {"km": 2}),
+                (port, city, None, None),
+                (city, port, Ferry, {}),
+            ]
+        )
+        out = port._jac_.edges[EdgeDir.OUT]
+        self.assertEqual([e.__class__ for e in out], [Road, GenericEdge])
+        self.assertEqual(Jac.edge_ref(port, EdgeDir.OUT, Road, None), [city])
+        self.assertEqual(Jac.edge_ref(port, EdgeDir.IN, Ferry, None), [city])
+        with self.assertRaises(KeyError):
+            load_edges([(1, 2, "tram", None)], nodes)
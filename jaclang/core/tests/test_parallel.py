@@ -0,0 +1,101 @@
+"""Tests for parallel walker execution."""
+from dataclasses import field
+from typing import Optional
+
+from jaclang.core.construct import EdgeDir, Root
+from jaclang.core.parallel import range_partitions, spawn_parallel
+from jaclang.core.shared import publish
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.utils.test import TestCase
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True)
+class Stop:
+    """Node of a tour."""
+
+    name: str = ""
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("step", None)], on_exit=[])
+class Tour:
+    """Walker recording the stops it visits."""
+
+    skip: str = ""
+    names: list = field(default_factory=list)
+    last: Optional[Stop] = None
+
+    def step(self, here: object) -> None:
+        """Record the stop, skip some and move on."""
+        if isinstance(here, Stop):
+            self.names.append(here.name)
+            self.last = here
+            Jac.report(here.name)
+            if here.name == "stop":
+                Jac.disengage(self)
+                return
+        kids = Jac.edge_ref(here, EdgeDir.OUT, None, None)
+        for kid in kids:
+            if kid.name == self.skip:
+                Jac.ignore(self, kid)
+        Jac.visit_node(self, kids)
+
+
+def build() -> Root:
+    """Build a root with three chains of stops crossing each other."""
+    root = Root()
+    chains = [[Stop(name=f"{c}{i}") for i in range(6)] for c in "abc"]
+    for chain in chains:
+        Jac.connect(root, chain[0], Jac.build_edge(EdgeDir.OUT, None, None))
+        for prev, nxt in zip(chain, chain[1:]):
+            Jac.connect(prev, nxt, Jac.build_edge(EdgeDir.OUT, None, None))
+    Jac.connect(chains[0][2], chains[1][4], Jac.build_edge(EdgeDir.OUT, None, None))
+    Jac.connect(chains[2][1], chains[0][3], Jac.build_edge(EdgeDir.OUT, None, None))
+    Jac.connect(
+        chains[1][5], Stop(name="stop"), Jac.build_edge(EdgeDir.OUT, None, None)
+    )
+    return root
+
+
+class ParallelTests(TestCase):
+    """Test parallel walker execution."""
+
+    def test_matches_serial(self) -> None:
+        """Walkers end as they would spawned one by one, with any partitions."""
+        with publish(build()) as graph:
+            starts = list(range(len(graph))) + [graph.root]
+            skips = ["a3", "", "b4", "c2"]
+            expected = []
+            for i, start in enumerate(starts):
+                walker = Tour(skip=skips[i % 4])
+                nd = graph.node(start) if isinstance(start, int) else start
+                Jac.spawn_call(nd, walker)
+                expected.append((walker.names, walker.last, walker._jac_.disengaged))
+            for partitions in (
+                None,
+                range_partitions(graph, 3),
+                [i % 4 for i in range(len(graph))],
+            ):
+                found = spawn_parallel(
+                    graph,
+                    [
+                        (Tour(skip=skips[i % 4]), start)
+                        for i, start in enumerate(starts)
+                    ],
+                    partitions,
+                    processes=2,
+                    context="fork",
+                )
+                self.assertEqual(
+                    [(w.names, w.last, w._jac_.disengaged) for w in found], expected
+                )
+                self.assertIs(found[-1].last, expected[-1][1])
+                for walker in found:
+                    self.assertEqual(walker._jac_.reports.values(), walker.names)
+                    self.assertTrue(walker._jac_.reports.closed)
+            self.assertIn("stop", expected[-1][0])
+            self.assertNotIn("a3", expected[-1][0])
+
+    def test_foreign_start(self) -> None:
+        """Start nodes must be nodes of the graph."""
+        with publish(build()) as graph, self.assertRaises(ValueError):
+            spawn_parallel(graph, [(Tour(), Stop())], context="fork")
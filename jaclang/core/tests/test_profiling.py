@@ -0,0 +1,130 @@
+"""Tests for walker traversal statistics."""
+import io
+import json
+import threading
+from dataclasses import field
+
+from jaclang.core.construct import EdgeDir
+from jaclang.core.profiling import TraversalProfiler
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.utils.test import TestCase
+
+
+@Jac.make_node(on_entry=[Jac.DSFunc("greet", None)], on_exit=[])
+class Room:
+    """Profiled node."""
+
+    num: int = 0
+
+    def greet(self, visitor: object) -> None:
+        """Node ability run on every walker."""
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("step", Room)], on_exit=[])
+class Guide:
+    """Walker touring every room once."""
+
+    limit: int = 0
+    seen: list = field(default_factory=list)
+
+    def step(self, here: Room) -> None:
+        """Visit unseen rooms, stopping after limit rooms if set."""
+        self.seen.append(here.num)
+        if self.limit and len(self.seen) >= self.limit:
+            Jac.disengage(self)
+            return
+        nbrs = Jac.edge_ref(here, EdgeDir.OUT, None, None)
+        Jac.visit_node(self, nbrs)
+        Jac.ignore(self, nbrs)
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("step", Room)], on_exit=[])
+class Pacer:
+    """Walker touring every room in step with another one."""
+
+    barrier: object = None
+
+    def step(self, here: Room) -> None:
+        """Visit the rooms below and wait for the other walker."""
+        Jac.visit_node(self, Jac.edge_ref(here, EdgeDir.OUT, None, None))
+        self.barrier.wait(5)
+
+
+def house() -> Room:
+    """Build a root room with three wings of two rooms."""
+    rooms = [Room(num=i) for i in range(7)]
+    for i in range(1, 7):
+        parent = 0 if i <= 3 else i - 3
+        Jac.connect(rooms[parent], rooms[i], Jac.build_edge(EdgeDir.OUT, None, None))
+    return rooms[0]
+
+
+class ProfilingTests(TestCase):
+    """Test traversal statistics."""
+
+    def setUp(self) -> None:
+        """Set up test."""
+        TraversalProfiler.reset()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        """Tear down test."""
+        TraversalProfiler.disable()
+        TraversalProfiler.reset()
+        return super().tearDown()
+
+    def test_disabled_records_nothing(self) -> None:
+        """Spawns are not recorded unless profiling is enabled."""
+        walker = Guide()
+        Jac.spawn_call(house(), walker)
+        self.assertEqual(len(walker.seen), 7)
+        self.assertEqual(len(TraversalProfiler.spawns), 0)
+
+    def test_spawn_stats(self) -> None:
+        """Visits, edge scans, ability calls, frontier and ignores are counted."""
+        TraversalProfiler.enable()
+        walker = Guide()
+        Jac.spawn_call(house(), walker)
+        self.assertEqual(sorted(walker.seen), list(range(7)))
+        (stats,) = TraversalProfiler.spawns
+        self.assertEqual((stats.walker, stats.node), ("Guide", "Room"))
+        self.assertEqual(stats.nodes_visited, 7)
+        self.assertEqual(stats.edges_scanned, 6)
+        self.assertEqual(stats.frontier_peak, 3)
+        self.assertEqual(stats.ignored, 6)
+        self.assertFalse(stats.disengaged)
+        self.assertEqual(stats.abilities["Guide.step"][0], 7)
+        self.assertEqual(stats.abilities["Room.greet"][0], 7)
+        self.assertGreater(stats.wall_time, 0)
+
+    def test_disengage_and_dump(self) -> None:
+        """Disengaged spawns are recorded and dumped with a summary."""
+        TraversalProfiler.enable(keep=2)
+        for limit in (0, 2, 3):
+            Jac.spawn_call(house(), Guide(limit=limit))
+        self.assertEqual(len(TraversalProfiler.spawns), 2)
+        self.assertTrue(TraversalProfiler.spawns[0].disengaged)
+        out = io.StringIO()
+        data = json.loads(TraversalProfiler.dump(out))
+        self.assertEqual(json.loads(out.getvalue()), data)
+        summary = data["summary"]["Guide"]
+        self.assertEqual(summary["spawns"], 2)
+        self.assertEqual(summary["nodes_visited"], 5)
+        self.assertEqual(summary["abilities"]["Guide.step"]["calls"], 5)
+        self.assertEqual(data["spawns"][1]["abilities"]["Room.greet"]["calls"], 3)
+
+    def test_threads(self) -> None:
+        """Spawns in other threads count their own edge scans."""
+        TraversalProfiler.enable()
+        barrier = threading.Barrier(2)
+        threads = [
+            threading.Thread(
+                target=Jac.spawn_call, args=(house(), Pacer(barrier=barrier))
+            )
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([i.edges_scanned for i in TraversalProfiler.spawns], [6, 6])
@@ -0,0 +1,99 @@
+"""Tests for the registry of live architype instances."""
+import gc
+
+from jaclang.core.construct import EdgeDir, NodeArchitype, Root
+from jaclang.core.registry import count, find, instances
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.utils.test import TestCase
+
+
+@Jac.make_node(on_entry=[], on_exit=[], tracked=True)
+class City:
+    """Tracked node."""
+
+    name: str = ""
+    country: str = ""
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+class Capital(City):
+    """Node tracked through its base."""
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+class Village(City):
+    """Node tracked through its base, redeclaring a field."""
+
+    country: str = "none"
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True, tracked=True)
+class Stop:
+    """Tracked slotted node."""
+
+    line: object = 0
+
+
+@Jac.make_edge(on_entry=[], on_exit=[], tracked=True)
+class Road:
+    """Tracked edge."""
+
+    km: int = 0
+
+
+class RegistryTests(TestCase):
+    """Test the registry of live architype instances."""
+
+    def setUp(self) -> None:
+        """Collect instances left by other tests."""
+        gc.collect()
+        return super().setUp()
+
+    def test_instances(self) -> None:
+        """Instances are listed by type in creation order until collected."""
+        cities = [City(name=str(i)) for i in range(5)]
+        paris = Capital(name="paris")
+        self.assertEqual(count(City), 6)
+        self.assertEqual(count(City, subclasses=False), 5)
+        self.assertEqual(list(instances(Capital)), [paris])
+        self.assertEqual(list(instances(City, subclasses=False)), cities)
+        del cities[1:3]
+        gc.collect()
+        self.assertEqual([c.name for c in instances(City)], ["0", "3", "4", "paris"])
+        root = Root()
+        Jac.connect(root, paris, Jac.build_edge(EdgeDir.OUT, Road, (("km",), (3,))))
+        self.assertEqual([r.km for r in instances(Road)], [3])
+        with self.assertRaises(TypeError):
+            count(Root)
+
+    def test_restored(self) -> None:
+        """Instances restored without __init__ are tracked."""
+        city = City.__new__(City)
+        NodeArchitype.__init__(city)
+        object.__setattr__(city, "name", "lyon")
+        self.assertEqual(list(instances(City)), [city])
+        self.assertEqual(find(City, name="lyon"), [city])
+
+    def test_find(self) -> None:
+        """Find follows field sets and falls back to scans."""
+        cities = [City(name=str(i), country="ab"[i % 2]) for i in range(6)]
+        Capital(name="rome", country="c")
+        self.assertEqual(find(City, country="a"), cities[::2])
+        self.assertEqual(find(City, country="a", name="2"), [cities[2]])
+        self.assertEqual(find(City, country="c")[0].name, "rome")
+        self.assertEqual(find(City, subclasses=False, country="c"), [])
+        cities[0].country = "b"
+        self.assertEqual(find(City, country="a"), cities[2::2])
+        self.assertEqual(len(find(City, country="b")), 4)
+        village = Village(name="v")
+        self.assertEqual(find(City, country="none"), [village])
+        village.country = "a"
+        self.assertEqual(find(City, country="a"), cities[2::2] + [village])
+        self.assertEqual(find(City, country="none"), [])
+        stops = [Stop(line=i % 3) for i in range(6)]
+        self.assertEqual(find(Stop, line=1), [stops[1], stops[4]])
+        stops[1].line = 2
+        self.assertEqual(find(Stop, line=1), [stops[4]])
+        stops[0].line = [1]
+        self.assertEqual(find(Stop, line=[1]), [stops[0]])
+        self.assertEqual(find(Stop, line=2), [stops[1], stops[2], stops[5]])
@@ -0,0 +1,132 @@
+"""Tests for walker report buffers."""
+import asyncio
+import threading
+from dataclasses import field
+from unittest import mock
+
+from jaclang.core.construct import EdgeDir
+from jaclang.core.report import ReportBuffer
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.utils.test import TestCase
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True)
+class Step:
+    """Node of a chain."""
+
+    n: int = 0
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("step", Step)], on_exit=[])
+class Counter:
+    """Walker reporting the steps of a chain."""
+
+    gate: object = None
+
+    def step(self, here: Step) -> None:
+        """Report the step, wait at the gate after the first, and move on."""
+        Jac.report({"n": here.n})
+        if here.n == 0 and self.gate is not None:
+            self.gate.wait(5)
+        Jac.visit_node(self, Jac.edge_ref(here, EdgeDir.OUT, None, None))
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("step", Step)], on_exit=[])
+class AsyncCounter:
+    """Walker reporting the steps of a chain from an async ability."""
+
+    seen: list = field(default_factory=list)
+
+    async def step(self, here: Step) -> None:
+        """Report the step and move on once the consumer has caught up."""
+        Jac.report(here.n)
+        while len(self.seen) < here.n:
+            await asyncio.sleep(0)
+        Jac.visit_node(self, Jac.edge_ref(here, EdgeDir.OUT, None, None))
+
+
+def chain(length: int) -> Step:
+    """Build a chain of steps."""
+    steps = [Step(n=i) for i in range(length)]
+    for prev, nxt in zip(steps, steps[1:]):
+        Jac.connect(prev, nxt, Jac.build_edge(EdgeDir.OUT, None, None))
+    return steps[0]
+
+
+class ReportTests(TestCase):
+    """Test walker report buffers."""
+
+    def test_report_per_spawn(self) -> None:
+        """Reports go to a buffer per spawn, closed when the spawn ends."""
+        start = chain(5)
+        Jac.report("outside a spawn")
+        walker = Counter()
+        self.assertIs(Jac.spawn_call(start, walker), walker)
+        first = walker._jac_.reports
+        self.assertEqual(first.values(), [{"n": i} for i in range(5)])
+        self.assertEqual(list(first), first.values())
+        self.assertTrue(first.closed)
+        with self.assertRaises(ValueError):
+            first.append(1)
+        Jac.spawn_call(chain(2), walker)
+        self.assertIsNot(walker._jac_.reports, first)
+        self.assertEqual(len(walker._jac_.reports), 2)
+
+    def test_bounded(self) -> None:
+        """Values over the limit spill to disk, or are dropped."""
+        for spill, kept in ((True, list(range(10))), (False, [7, 8, 9])):
+            buf = ReportBuffer(limit=3, spill=spill)
+            for i in range(10):
+                buf.append(i)
+            buf.close()
+            self.assertEqual(len(buf.items), 3)
+            self.assertEqual(buf.values(), kept)
+            self.assertEqual(list(buf), kept)
+            self.assertEqual((len(buf), buf.dropped), (10, 10 - len(kept)))
+        self.assertIsNone(buf.file)
+
+    def test_default_bound(self) -> None:
+        """Buffers started by spawns take the default limit and spill.
+
+        Dropping values logs a warning, once per buffer.
+        """
+        self.assertIsNotNone(ReportBuffer.default_limit)
+        for spill, kept in ((False, [2, 3, 4]), (True, list(range(5)))):
+            with mock.patch.multiple(
+                ReportBuffer, default_limit=3, default_spill=spill
+            ), mock.patch("jaclang.core.report.logging.warning") as warn:
+                walker = Jac.spawn_call(chain(5), Counter())
+            self.assertEqual(warn.call_count, 0 if spill else 1)
+            buf = walker._jac_.reports
+            self.assertEqual((buf.limit, len(buf.items)), (3, 3))
+            self.assertEqual([i["n"] for i in buf.values()], kept)
+
+    def test_stream_from_thread(self) -> None:
+        """Reports are read while the walker is still running."""
+        gate = threading.Event()
+        walker = Counter(gate=gate)
+        walker._jac_.reports = buf = ReportBuffer(limit=2, spill=True)
+        thread = threading.Thread(target=Jac.spawn_call, args=(chain(6), walker))
+        thread.start()
+        found = []
+        for value in buf:
+            found.append(value["n"])
+            gate.set()
+        thread.join()
+        self.assertEqual(found, list(range(6)))
+        self.assertIs(walker._jac_.reports, buf)
+
+    def test_stream_async(self) -> None:
+        """Async spawns stream reports to async for loops."""
+        walker = AsyncCounter()
+        walker._jac_.reports = buf = ReportBuffer()
+
+        async def consume() -> None:
+            async for value in buf:
+                walker.seen.append(value)
+
+        async def main() -> None:
+            await asyncio.gather(Jac.spawn_async(chain(4), walker), consume())
+
+        asyncio.run(main())
+        self.assertEqual(walker.seen, [0, 1, 2, 3])
@@ -0,0 +1,77 @@
+"""Tests for shared memory graphs."""
+import multiprocessing
+import subprocess
+import sys
+from dataclasses import field
+
+from jaclang.core.construct import EdgeDir, Root
+from jaclang.core.shared import attach, publish
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.utils.test import TestCase
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True)
+class Town:
+    """Shared node."""
+
+    name: str = ""
+    people: int = 0
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("step", None)], on_exit=[])
+class Census:
+    """Walker counting people."""
+
+    total: int = 0
+    names: list = field(default_factory=list)
+
+    def step(self, here: object) -> None:
+        """Count towns and move on."""
+        if isinstance(here, Town):
+            self.total += here.people
+            self.names.append(here.name)
+        Jac.visit_node(self, Jac.edge_ref(here, EdgeDir.OUT, None, None))
+
+
+def census(name: str) -> tuple[int, list]:
+    """Run a census over the graph published under name."""
+    graph = attach(name)
+    walker = Census()
+    Jac.spawn_call(graph.root, walker)
+    graph.close()
+    return walker.total, walker.names
+
+
+class SharedTests(TestCase):
+    """Test shared memory graphs."""
+
+    def test_workers_attach(self) -> None:
+        """Worker processes walk a published graph."""
+        root = Root()
+        towns = [Town(name=f"t{i}", people=i) for i in range(10)]
+        Jac.connect(root, towns, Jac.build_edge(EdgeDir.OUT, None, None))
+        Jac.connect(
+            towns[0],
+            Town(name="x", people=100),
+            Jac.build_edge(EdgeDir.OUT, None, None),
+        )
+        expected = (145, [f"t{i}" for i in range(10)] + ["x"])
+        with publish(root) as graph:
+            ctx = multiprocessing.get_context("fork")
+            with ctx.Pool(2) as pool:
+                found = pool.map(census, [graph.name] * 3)
+            self.assertEqual(found, [expected] * 3)
+            self.assertEqual(census(graph.name), expected)
+            code = "import sys; from jaclang.core.tests.test_shared import census; "
+            code += "print(census(sys.argv[1])[0])"
+            out = subprocess.run(
+                [sys.executable, "-c", code, graph.name],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            self.assertEqual(out.stdout.strip(), "145")
+            self.assertEqual(census(graph.name), expected)
+            self.assertEqual(len(graph), 12)
+        with self.assertRaises(FileNotFoundError):
+            attach(graph.name)
@@ -0,0 +1,135 @@
+"""Tests for persistent graph storage."""
+import gc
+import os
+import tempfile
+from dataclasses import field
+
+from jaclang.core.construct import EdgeDir, Root
+from jaclang.core.storage import GraphStore, SqliteGraphStore
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.utils.test import TestCase
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+class Page:
+    """Stored node."""
+
+    num: int = 0
+    tags: list = field(default_factory=list)
+
+
+@Jac.make_edge(on_entry=[], on_exit=[], slots=True)
+class Next:
+    """Stored edge."""
+
+    hop: int = 0
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("step", Page)], on_exit=[])
+class Reader:
+    """Walker following the chain."""
+
+    seen: list = field(default_factory=list)
+
+    def step(self, here: Page) -> None:
+        """Record node and move on."""
+        self.seen.append(here.num)
+        Jac.visit_node(self, Jac.edge_ref(here, EdgeDir.OUT, None, None))
+
+
+class StorageTests(TestCase):
+    """Test graph stores."""
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.path = os.path.join(tempfile.mkdtemp(), "graph.db")
+        return super().setUp()
+
+    def build(self, count: int) -> None:
+        """Store a chain of count pages hanging off a root."""
+        store = SqliteGraphStore(self.path)
+        top = store.open(Root())
+        prev = top
+        for i in range(count):
+            page = Page(num=i, tags=[i])
+            Jac.connect(prev, page, Jac.build_edge(EdgeDir.OUT, Next, (("hop",), (i,))))
+            prev = page
+        Jac.connect(top, Page(num=-1), Jac.build_edge(EdgeDir.OUT, None, None))
+        store.commit()
+        store.close()
+
+    def test_round_trip_is_lazy(self) -> None:
+        """A reopened graph pages nodes in as they are touched."""
+        self.build(5)
+        store = SqliteGraphStore(self.path)
+        top = store.open(Root())
+        self.assertIsNotNone(top._jac_.store)
+        kids = Jac.edge_ref(top, EdgeDir.OUT, None, None)
+        self.assertIsNone(top._jac_.store)
+        self.assertEqual([k.num for k in kids], [0, -1])
+        self.assertEqual(kids[0].tags, [0])
+        self.assertIs(kids[0]._jac_.store, store)
+        self.assertEqual(len(store.loaded), 1)
+        self.assertEqual(Jac.edge_ref(top, EdgeDir.OUT, Next, None), [kids[0]])
+        nxt = Jac.edge_ref(kids[0], EdgeDir.OUT, None, None)[0]
+        self.assertEqual(nxt.num, 1)
+        self.assertIs(Jac.edge_ref(nxt, EdgeDir.IN, None, None)[0], kids[0])
+        self.assertEqual(kids[0]._jac_.out_edges[0].hop, 1)
+        store.close()
+
+    def test_walk_under_memory_budget(self) -> None:
+        """Walkers traverse stored graphs while cold nodes are evicted."""
+        self.build(200)
+        store = SqliteGraphStore(self.path, max_loaded=10)
+        top = store.open(Root())
+        walker = Reader()
+        Jac.spawn_call(Jac.edge_ref(top, EdgeDir.OUT, Next, None)[0], walker)
+        self.assertEqual(walker.seen, list(range(200)))
+        self.assertLessEqual(len(store.loaded), 10)
+        gc.collect()
+        self.assertLess(len(store.nodes), 50)
+        store.close()
+
+    def test_mutations_persist(self) -> None:
+        """Field writes, new edges and disconnects survive eviction and reopen."""
+        self.build(20)
+        store = SqliteGraphStore(self.path, max_loaded=3)
+        top = store.open(Root())
+        first = Jac.edge_ref(top, EdgeDir.OUT, Next, None)[0]
+        first.num = 100
+        Jac.connect(
+            first, Page(num=7, tags=["new"]), Jac.build_edge(EdgeDir.OUT, None, None)
+        )
+        Jac.disconnect(
+            top, Jac.edge_ref(top, EdgeDir.OUT, None, None)[1], EdgeDir.OUT, None, None
+        )
+        node = first
+        for _ in range(10):
+            node = Jac.edge_ref(node, EdgeDir.OUT, Next, None)[0]
+        node.tags.append("deep")
+        store.commit()
+        store.close()
+
+        store = SqliteGraphStore(self.path, max_loaded=3)
+        top = store.open(Root())
+        kids = Jac.edge_ref(top, EdgeDir.OUT, None, None)
+        self.assertEqual([k.num for k in kids], [100])
+        self.assertEqual(
+            [k.tags for k in Jac.edge_ref(kids[0], EdgeDir.OUT, None, None)],
+            [[1], ["new"]],
+        )
+        node = kids[0]
+        for _ in range(10):
+            node = Jac.edge_ref(node, EdgeDir.OUT, Next, None)[0]
+        self.assertEqual(node.tags, [10, "deep"])
+        store.close()
+
+    def test_engine_primitives_required(self) -> None:
+        """Engines missing read or write primitives cannot be created."""
+
+        class ReadOnly(GraphStore):
+            def read_nodes(self, jids: object) -> dict:
+                return {}
+
+        with self.assertRaises(TypeError):
+            ReadOnly()  # type: ignore[abstract]
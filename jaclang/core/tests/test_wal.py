@@ -0,0 +1,146 @@
+"""Tests for the write-ahead mutation log."""
+import os
+import tempfile
+
+from jaclang.core.construct import EdgeDir, Root
+from jaclang.core.wal import MutationLog, read_records
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.utils.test import TestCase
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+class Task:
+    """Logged node."""
+
+    name: str = ""
+    done: bool = False
+    owner: object = None
+
+
+@Jac.make_edge(on_entry=[], on_exit=[], slots=True)
+class Blocks:
+    """Logged edge."""
+
+    weight: int = 0
+
+
+class MutationLogTests(TestCase):
+    """Test mutation logging and recovery."""
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.path = os.path.join(tempfile.mkdtemp(), "graph.wal")
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        """Tear down test."""
+        if MutationLog.active:
+            MutationLog.active.close()
+        return super().tearDown()
+
+    def crash(self, log: MutationLog) -> None:
+        """Stop logging without a final checkpoint, as a killed process would."""
+        log.sync()
+        log.close()
+
+    def mutate(self, top: Root) -> list:
+        """Build and edit a small graph through Jac features."""
+        tasks = [Task(name=f"t{i}") for i in range(4)]
+        Jac.connect(top, tasks[:3], Jac.build_edge(EdgeDir.OUT, None, None))
+        for a, b in zip(tasks, tasks[1:]):
+            Jac.connect(
+                a, b, Jac.build_edge(EdgeDir.OUT, Blocks, (("weight",), (len(b.name),)))
+            )
+        Jac.assign_compr(tasks[:2], (("done",), (True,)))
+        tasks[3].owner = tasks[0]
+        tasks[1]._jac_.out_edges[0].weight = 9
+        Jac.disconnect(top, tasks[2], EdgeDir.OUT, None, None)
+        return tasks
+
+    def shape(self, top: Root) -> list:
+        """Describe the graph reachable from top."""
+        out = []
+        for task in Jac.edge_ref(top, EdgeDir.OUT, None, None):
+            while task:
+                edges = task._jac_.out_edges or []
+                out.append(
+                    (
+                        task.name,
+                        task.done,
+                        task.owner.name if task.owner else None,
+                        [e.weight for e in edges],
+                        len(task._jac_.in_edges or []),
+                    )
+                )
+                nxt = Jac.edge_ref(task, EdgeDir.OUT, Blocks, None)
+                task = nxt[0] if nxt else None
+        return out
+
+    def test_replay_log_tail(self) -> None:
+        """A crashed graph is rebuilt from the log alone."""
+        log = MutationLog(self.path, checkpoint_every=0)
+        top = log.open(Root())
+        self.mutate(top)
+        expected = self.shape(top)
+        self.crash(log)
+
+        log = MutationLog(self.path, checkpoint_every=0)
+        top = log.open(Root())
+        self.assertEqual(self.shape(top), expected)
+        self.assertEqual(expected[1][:4], ("t1", True, None, [9]))
+        self.assertEqual(expected[-1][2], "t0")
+        self.assertEqual(self.shape(top)[0][4], 1)
+
+    def test_replay_snapshot_and_tail(self) -> None:
+        """Checkpoints truncate the log and recovery resumes from them."""
+        log = MutationLog(self.path, checkpoint_every=5)
+        top = log.open(Root())
+        tasks = self.mutate(top)
+        self.assertLess(log.records, 5)
+        tasks[2].name = "late"
+        expected = self.shape(top)
+        self.crash(log)
+
+        log = MutationLog(self.path, checkpoint_every=5)
+        top = log.open(Root())
+        self.assertEqual(self.shape(top), expected)
+        Jac.edge_ref(top, EdgeDir.OUT, None, None)[0].name = "again"
+        expected = self.shape(top)
+        before = os.path.getsize(log.snapshot_path)
+        log.checkpoint()
+        grown = os.path.getsize(log.snapshot_path) - before
+        self.assertLess(grown, log.compacted_size / 2)
+        self.crash(log)
+
+        log = MutationLog(self.path)
+        self.assertEqual(self.shape(log.open(Root())), expected)
+
+    def test_torn_tail_is_dropped(self) -> None:
+        """Replay stops at a partly written record."""
+        log = MutationLog(self.path, checkpoint_every=0)
+        top = log.open(Root())
+        self.mutate(top)
+        expected = self.shape(top)
+        self.crash(log)
+        with open(self.path, "ab") as f:
+            f.write(b"\x40\x00\x00\x00garbage")
+
+        log = MutationLog(self.path, checkpoint_every=0)
+        top = log.open(Root())
+        self.assertEqual(self.shape(top), expected)
+        Jac.edge_ref(top, EdgeDir.OUT, None, None)[0].done = False
+        self.crash(log)
+        log = MutationLog(self.path)
+        self.assertFalse(
+            Jac.edge_ref(log.open(Root()), EdgeDir.OUT, None, None)[0].done
+        )
+
+    def test_closed_log_leaves_architypes_alone(self) -> None:
+        """Closing a log removes its hooks."""
+        log = MutationLog(self.path)
+        log.open(Root())
+        log.close()
+        self.assertNotIn("__setattr__", vars(Jac.RootType.__mro__[1]))
+        task = Task(name="x")
+        task.done = True
+        self.assertEqual(len(read_records(self.path)[0]), 1)
@@ -0,0 +1,469 @@
+"""Write-ahead mutation log for Jac graphs.
+
+A MutationLog appends every graph mutation made through connect, disconnect
+and architype field writes to a compact binary log. Checkpoints snapshot
+the whole graph and start a new log generation, so recovering a crashed
+process replays the last snapshot plus the log tail onto a fresh root.
+
+Records are framed as (length, crc32, op) followed by the op body. Node and
+edge references are log ids, field values are pickled with architypes
+replaced by their log ids. Replay stops at the first torn or corrupt record.
+"""
+from __future__ import annotations
+
+import io
+import os
+import pickle
+import struct
+import weakref
+import zlib
+from itertools import islice
+from typing import Any, Generator, Optional
+
+from jaclang.compiler.constant import EdgeDir
+from jaclang.core.construct import (
+    Architype,
+    EdgeArchitype,
+    NodeArchitype,
+)
+from jaclang.core.storage import ROOT_ID, arch_class, arch_name, arch_state
+
+import pluggy
+
+
+hookimpl = pluggy.HookimplMarker("jac")
+
+HEADER = struct.Struct("<IIB")
+ID = struct.Struct("<I")
+LINK = struct.Struct("<IIIb")
+ADJ = struct.Struct("<III")
+PLAIN = (int, float, str, bool, bytes, type(None))
+
+OP_GEN = 0
+OP_NEW = 1
+OP_STATE = 2
+OP_SET = 3
+OP_LINK = 4
+OP_UNLINK = 5
+OP_ENDS = 6
+OP_ADJ = 7
+
+
+def read_records(path: str) -> tuple[list[tuple[int, bytes]], int]:
+    """Read intact (op, body) records of a log file and the offset they end at."""
+    if not os.path.exists(path):
+        return [], 0
+    with open(path, "rb") as f:
+        data = f.read()
+    records = []
+    pos = 0
+    while pos + HEADER.size <= len(data):
+        size, crc, op = HEADER.unpack_from(data, pos)
+        body = data[pos + HEADER.size : pos + HEADER.size + size]
+        if len(body) < size or zlib.crc32(body, op) != crc:
+            break
+        records.append((op, body))
+        pos += HEADER.size + size
+    return records, pos
+
+
+def frame(op: int, body: bytes) -> bytes:
+    """Frame a record body."""
+    return HEADER.pack(len(body), zlib.crc32(body, op), op) + body
+
+
+class MutationLog:
+    """Write-ahead log of graph mutations with periodic checkpoints.
+
+    While a log is open it is registered as a plugin wrapping connect and
+    disconnect, and node and edge architypes log assignments to their
+    fields. Nodes and edges get a log id, with their full state, the first
+    time a logged mutation references them. Only one log can be open at a
+    time.
+    """
+
+    active: Optional[MutationLog] = None
+
+    def __init__(
+        self,
+        path: str,
+        checkpoint_every: int = 100_000,
+        buffer_size: int = 0,
+    ) -> None:
+        """Create log at path, with its snapshot kept at path.ckpt.
+
+        Records are handed to the OS once buffer_size bytes are pending, so
+        0 makes each mutation survive a process crash as soon as it returns.
+        A checkpoint is taken every checkpoint_every records, 0 never does.
+        """
+        self.path = path
+        self.snapshot_path = path + ".ckpt"
+        self.checkpoint_every = checkpoint_every
+        self.buffer_size = buffer_size
+        self.ids: weakref.WeakKeyDictionary[
+            Architype, int
+        ] = weakref.WeakKeyDictionary()
+        self.next_id = ROOT_ID + 1
+        self.gen = 0
+        self.records = 0
+        self.pending = bytearray()
+        self.file: Optional[io.FileIO] = None
+        self.unsaved: Optional[list[Architype]] = None
+        self.dirty: dict[int, Architype] = {}
+        self.checkpointed = self.next_id
+        self.snapshot_size = 0
+        self.compacted_size = 0
+
+    def open(self, root: NodeArchitype) -> NodeArchitype:
+        """Recover the logged graph onto root and start logging.
+
+        An empty log is started with a checkpoint of the graph root already
+        has in memory.
+        """
+        if MutationLog.active:
+            raise RuntimeError("A mutation log is already open.")
+        self.ids[root] = ROOT_ID
+        snapshot, _ = read_records(self.snapshot_path)
+        # Records after the last generation mark are an unfinished checkpoint.
+        while snapshot and snapshot[-1][0] != OP_GEN:
+            snapshot.pop()
+        self.snapshot_size = sum(HEADER.size + len(body) for _, body in snapshot)
+        self.compacted_size = self.snapshot_size
+        records, end = read_records(self.path)
+        objs: dict[int, Architype] = {ROOT_ID: root}
+        covered = self.replay(snapshot, objs)
+        self.dirty.clear()
+        self.checkpointed = self.next_id
+        if records and records[0][0] == OP_GEN:
+            self.gen = ID.unpack(records[0][1])[0]
+        if covered is None or self.gen > covered:
+            self.replay(records[1:], objs)
+            mode = "r+b" if records else "wb"
+            self.file = open(self.path, mode, buffering=0)  # noqa: SIM115
+            self.file.truncate(end)
+            self.file.seek(end)
+        else:
+            # A log no newer than the snapshot was already checkpointed.
+            self.file = open(self.path, "wb", buffering=0)  # noqa: SIM115
+            self.gen = covered + 1
+            self.write(OP_GEN, ID.pack(self.gen))
+        MutationLog.active = self
+        NodeArchitype.__setattr__ = logged_setattr  # type: ignore[assignment]
+        EdgeArchitype.__setattr__ = logged_setattr  # type: ignore[assignment]
+        from jaclang.plugin.feature import JacFeature
+
+        JacFeature.pm.register(self)
+        if not snapshot:
+            self.checkpoint(full=True)
+        return root
+
+    def close(self) -> None:
+        """Flush the log to disk and stop logging."""
+        if MutationLog.active is not self:
+            return
+        from jaclang.plugin.feature import JacFeature
+
+        JacFeature.pm.unregister(self)
+        del NodeArchitype.__setattr__
+        del EdgeArchitype.__setattr__
+        MutationLog.active = None
+        self.sync()
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def flush(self) -> None:
+        """Hand pending records to the OS."""
+        if self.pending and self.file:
+            self.file.write(self.pending)
+            self.pending.clear()
+
+    def sync(self) -> None:
+        """Make every record durable."""
+        self.flush()
+        if self.file:
+            os.fsync(self.file.fileno())
+
+    def write(self, op: int, body: bytes) -> None:
+        """Append a record."""
+        self.pending += frame(op, body)
+        self.records += 1
+        if len(self.pending) > self.buffer_size:
+            self.flush()
+
+    def settle(self) -> None:
+        """Checkpoint if enough records were written since the last one."""
+        if self.checkpoint_every and self.records >= self.checkpoint_every:
+            self.checkpoint()
+
+    def ref(self, obj: Architype) -> int:
+        """Get the log id of a node or edge, logging it first if it is new."""
+        oid = self.ids.get(obj)
+        if oid is None:
+            oid = self.ids[obj] = self.next_id
+            self.next_id += 1
+            if self.unsaved is not None:
+                self.unsaved.append(obj)
+            else:
+                self.dirty[id(obj)] = obj
+                self.write(OP_NEW, ID.pack(oid) + arch_name(type(obj)).encode())
+                self.write(OP_STATE, ID.pack(oid) + self.dumps(arch_state(obj)))
+        return oid
+
+    def persistent_id(self, obj: object) -> Optional[int]:
+        """Pickle nodes and edges inside field values by log id."""
+        if isinstance(obj, (NodeArchitype, EdgeArchitype)):
+            return self.ref(obj)
+        return None
+
+    def dumps(self, value: object) -> bytes:
+        """Pickle a field value."""
+        if type(value) in PLAIN or (
+            type(value) is dict and all(type(v) in PLAIN for v in value.values())
+        ):
+            return pickle.dumps(value)
+        buf = io.BytesIO()
+        pickler = pickle.Pickler(buf)
+        pickler.persistent_id = self.persistent_id  # type: ignore[method-assign]
+        pickler.dump(value)
+        return buf.getvalue()
+
+    def log_set(self, obj: Architype, name: str, value: object) -> None:
+        """Log a field write."""
+        oid = self.ids.get(obj)
+        if oid is not None and name != "_jac_":
+            self.dirty[id(obj)] = obj
+            self.write(
+                OP_SET,
+                ID.pack(oid) + bytes([len(name)]) + name.encode() + self.dumps(value),
+            )
+            self.settle()
+
+    def log_link(
+        self, left: NodeArchitype, right: NodeArchitype, edge: EdgeArchitype
+    ) -> None:
+        """Log an edge attached from left to right."""
+        dir = edge._jac_.dir
+        for obj in (edge, left, right):
+            self.dirty[id(obj)] = obj
+        self.write(
+            OP_LINK,
+            LINK.pack(
+                self.ref(edge),
+                self.ref(left),
+                self.ref(right),
+                dir.value if dir else -1,
+            ),
+        )
+
+    def checkpoint(self, full: bool = False) -> None:
+        """Checkpoint the graph and start a new log generation.
+
+        Checkpoints append the nodes and edges changed since the last one to
+        the snapshot. Once that has grown to twice its compacted size, or if
+        full is set, the snapshot is rewritten from the live graph instead.
+        """
+        self.flush()
+        full = full or not self.snapshot_size
+        full = full or self.snapshot_size > 2 * self.compacted_size
+        objs = list(self.ids.keys()) if full else list(self.dirty.values())
+        data = b"".join(frame(op, body) for op, body in self.snapshot(objs, full))
+        if full:
+            tmp = self.snapshot_path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.snapshot_path)
+            self.snapshot_size = self.compacted_size = len(data)
+        else:
+            with open(self.snapshot_path, "r+b") as f:
+                f.seek(self.snapshot_size)
+                f.write(data)
+                f.truncate()
+                f.flush()
+                os.fsync(f.fileno())
+            self.snapshot_size += len(data)
+        self.dirty.clear()
+        self.checkpointed = self.next_id
+        self.gen += 1
+        if self.file:
+            self.file.seek(0)
+            self.file.truncate()
+            self.write(OP_GEN, ID.pack(self.gen))
+            self.flush()
+        self.records = 0
+
+    def snapshot(self, objs: list[Architype], full: bool) -> list[tuple[int, bytes]]:
+        """Get the snapshot records of objs.
+
+        Nodes and edges objs refer to that have no log id yet are logged
+        along the way. Objects logged since the last checkpoint are created,
+        and all of objs set to their current state.
+        """
+        self.unsaved = objs
+        news, states, links = [], [], []
+        try:
+            while self.unsaved:
+                obj = self.unsaved.pop()
+                oid = self.ids[obj]
+                anchor = obj._jac_
+                if oid != ROOT_ID and (full or oid >= self.checkpointed):
+                    news.append((OP_NEW, ID.pack(oid) + arch_name(type(obj)).encode()))
+                states.append((OP_STATE, ID.pack(oid) + self.dumps(arch_state(obj))))
+                if isinstance(obj, NodeArchitype):
+                    outs = [self.ref(edg) for edg in anchor.out_edges or ()]
+                    ins = [self.ref(edg) for edg in anchor.in_edges or ()]
+                    links.append(
+                        (
+                            OP_ADJ,
+                            ADJ.pack(oid, len(outs), len(ins))
+                            + struct.pack(f"<{len(outs) + len(ins)}I", *outs, *ins),
+                        )
+                    )
+                else:
+                    links.append(
+                        (
+                            OP_ENDS,
+                            LINK.pack(
+                                oid,
+                                self.ref(anchor.source) if anchor.source else 0,
+                                self.ref(anchor.target) if anchor.target else 0,
+                                anchor.dir.value if anchor.dir else -1,
+                            ),
+                        )
+                    )
+        finally:
+            self.unsaved = None
+        return [*news, *states, *links, (OP_GEN, ID.pack(self.gen))]
+
+    def replay(
+        self, records: list[tuple[int, bytes]], objs: dict[int, Any]
+    ) -> Optional[int]:
+        """Apply records to the graph.
+
+        Objects records touch are marked as changed since the last
+        checkpoint. Returns the generation the last checkpoint covers.
+        """
+        covered = None
+
+        def load(data: bytes) -> Any:  # noqa: ANN401
+            unpickler = pickle.Unpickler(io.BytesIO(data))
+            unpickler.persistent_load = objs.__getitem__  # type: ignore
+            return unpickler.load()
+
+        for op, body in records:
+            touched: tuple[Architype, ...] = ()
+            if op == OP_NEW:
+                oid = ID.unpack_from(body)[0]
+                cls = arch_class(body[ID.size :].decode())
+                obj = cls.__new__(cls)
+                if issubclass(cls, NodeArchitype):
+                    NodeArchitype.__init__(obj)
+                else:
+                    EdgeArchitype.__init__(obj)
+                objs[oid] = obj
+                touched = (obj,)
+            elif op == OP_STATE:
+                obj = objs[ID.unpack_from(body)[0]]
+                for fld, val in load(body[ID.size :]).items():
+                    object.__setattr__(obj, fld, val)
+                touched = (obj,)
+            elif op == OP_SET:
+                obj = objs[ID.unpack_from(body)[0]]
+                size = body[ID.size]
+                name = body[ID.size + 1 : ID.size + 1 + size].decode()
+                object.__setattr__(obj, name, load(body[ID.size + 1 + size :]))
+                touched = (obj,)
+            elif op == OP_LINK:
+                edge, left, right, dir = LINK.unpack(body)
+                anchor = objs[edge]._jac_
+                anchor.dir = EdgeDir(dir) if dir >= 0 else None
+                anchor.attach(objs[left], objs[right])
+                touched = (objs[edge], objs[left], objs[right])
+            elif op == OP_UNLINK:
+                anchor = objs[ID.unpack(body)[0]]._jac_
+                touched = (anchor.obj, anchor.source, anchor.target)
+                anchor.detach()
+            elif op == OP_ENDS:
+                edge, src, trg, dir = LINK.unpack(body)
+                anchor = objs[edge]._jac_
+                anchor.source = objs[src] if src else None
+                anchor.target = objs[trg] if trg else None
+                anchor.dir = EdgeDir(dir) if dir >= 0 else None
+            elif op == OP_ADJ:
+                oid, outs, ins = ADJ.unpack_from(body)
+                edge_ids = struct.unpack_from(f"<{outs + ins}I", body, ADJ.size)
+                anchor = objs[oid]._jac_
+                anchor.out_edges = anchor.in_edges = None
+                for eid in edge_ids[:outs]:
+                    anchor.edge_list(EdgeDir.OUT).append(objs[eid])
+                for eid in edge_ids[outs:]:
+                    anchor.edge_list(EdgeDir.IN).append(objs[eid])
+            elif op == OP_GEN:
+                covered = ID.unpack(body)[0]
+            for obj in touched:
+                if obj is not None:
+                    self.dirty[id(obj)] = obj
+        for oid, obj in objs.items():
+            self.ids[obj] = oid
+            self.next_id = max(self.next_id, oid + 1)
+        return covered
+
+    @hookimpl(hookwrapper=True)
+    def connect(
+        self,
+        left: NodeArchitype | list[NodeArchitype],
+        right: NodeArchitype | list[NodeArchitype],
+        edge_spec: EdgeArchitype,
+    ) -> Generator[None, Any, None]:
+        """Log edges attached by connect.
+
+        Connect appends the edges of each left node to its out edges (also
+        for edges pointing in), so they are the ones past its prior count.
+        """
+        counts = []
+        for i in left if isinstance(left, list) else [left]:
+            i._jac_.page_in()
+            counts.append((i, len(i._jac_.out_edges or ())))
+        yield
+        for i, count in counts:
+            edges = i._jac_.out_edges
+            added = len(edges or ()) - count
+            if not edges or added <= 0:
+                continue
+            for edg in reversed(list(islice(reversed(edges.edges), added))):
+                src, trg = edg._jac_.source, edg._jac_.target
+                self.log_link(i, src if trg is i and src is not i else trg, edg)
+        self.settle()
+
+    @hookimpl(hookwrapper=True)
+    def disconnect(
+        self,
+        left: NodeArchitype | list[NodeArchitype],
+        right: NodeArchitype | list[NodeArchitype],
+        dir: EdgeDir,
+        filter_type: Optional[type],
+        filter_func: Optional[Any],
+    ) -> Generator[None, Any, None]:
+        """Log edges detached by disconnect."""
+        attached = [
+            (edg, edg._jac_.source, edg._jac_.target)
+            for nd in (left if isinstance(left, list) else [left])
+            for edges in (nd._jac_.out_edges, nd._jac_.in_edges)
+            for edg in edges or ()
+        ]
+        yield
+        for edg, src, trg in attached:
+            if edg._jac_.source is None and edg in self.ids:
+                for obj in (edg, src, trg):
+                    self.dirty[id(obj)] = obj
+                self.write(OP_UNLINK, ID.pack(self.ids[edg]))
+        self.settle()
+
+
+def logged_setattr(obj: Architype, name: str, value: object) -> None:
+    """Set an architype field, logging it to the open mutation log."""
+    object.__setattr__(obj, name, value)
+    if MutationLog.active:
+        MutationLog.active.log_set(obj, name, value)
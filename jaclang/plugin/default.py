@@ -1,12 +1,21 @@
 """Jac Language Features."""
 from __future__ import annotations
 
+import inspect
 import os
 import types
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from functools import wraps
-from typing import Any, Callable, Optional, Type
+from typing import Any, Awaitable, Callable, Optional, Type
 
+from jaclang.core.columnar import (
+    assign_compr as assign_columns,
+    filter_compr as filter_columns,
+    make_columnar,
+)
+from jaclang.core.construct import AbilityList, REPORTER
+from jaclang.core.edgeindex import EdgeFilter
+from jaclang.core.registry import track
 from jaclang.plugin.spec import (
     ArchBound,
     Architype,
@@ -16,8 +25,11 @@ from jaclang.plugin.spec import (
     EdgeDir,
     GenericEdge,
     JacTestCheck,
+    NodeAnchor,
     NodeArchitype,
+    ObjectAnchor,
     T,
+    WalkerAnchor,
     WalkerArchitype,
     jac_importer,
     root,
@@ -30,122 +42,193 @@ import pluggy
 hookimpl = pluggy.HookimplMarker("jac")
 
 
+def with_arch_base(cls: type, arch_cls: type) -> type:
+    """Rebuild cls with arch_cls as a base so it can be fully slotted.
+
+    Subclassing a plain class always brings an instance __dict__ along, so
+    slotted architypes are recreated from their namespace instead.
+    """
+    if issubclass(cls, arch_cls):
+        return cls
+    bases = tuple(b for b in cls.__bases__ if b is not object) + (arch_cls,)
+    namespace = {
+        k: v for k, v in cls.__dict__.items() if k not in ("__dict__", "__weakref__")
+    }
+    return type(cls)(cls.__name__, bases, namespace)
+
+
+def fused_init(
+    cls: type, anchor: Callable[[Any], Any]
+) -> Optional[Callable[..., None]]:
+    """Generate an __init__ setting the fields and anchor of a dataclass.
+
+    The generated function takes the parameters of the dataclass __init__
+    and attaches the anchor in the same frame. None is returned for fields
+    it cannot express, such as init-only variables.
+    """
+    flds = fields(cls)
+    params = inspect.signature(cls.__init__).parameters
+    if list(params)[1:] != [f.name for f in flds if f.init]:
+        return None
+    scope: dict[str, Any] = {"__jac_anchor": anchor, "__jac_missing": MISSING}
+    args, kw_args = [], []
+    body = ["    __jac_self._jac_ = __jac_anchor(__jac_self)"]
+    for f in flds:
+        name, dflt, fact = f.name, f"__jac_dflt_{f.name}", f"__jac_fact_{f.name}"
+        if f.default is not MISSING:
+            scope[dflt] = f.default
+            param, value = f"{name}={dflt}", name if f.init else dflt
+        elif f.default_factory is not MISSING:
+            scope[fact] = f.default_factory
+            param = f"{name}=__jac_missing"
+            value = f"{fact}() if {name} is __jac_missing else {name}"
+            value = value if f.init else f"{fact}()"
+        elif f.init:
+            param, value = name, name
+        else:
+            continue
+        if f.init:
+            (kw_args if f.kw_only else args).append(param)
+        body.append(f"    __jac_self.{name} = {value}")
+    if hasattr(cls, "__post_init__"):
+        body.append("    __jac_self.__post_init__()")
+    sig = ", ".join(["__jac_self", *args, *(["*", *kw_args] if kw_args else [])])
+    exec(f"def __init__({sig}) -> None:\n" + "\n".join(body), scope)
+    init = scope["__init__"]
+    init.__qualname__ = f"{cls.__qualname__}.__init__"
+    init.__module__ = cls.__module__
+    init.__annotations__ = {**cls.__init__.__annotations__}
+    return init
+
+
+def make_architype(
+    cls: type,
+    arch_cls: type,
+    anchor_cls: type,
+    on_entry: list[DSFunc],
+    on_exit: list[DSFunc],
+    slots: bool,
+    columnar: bool = False,
+    tracked: bool = False,
+) -> type:
+    """Turn cls into a dataclass architype of arch_cls.
+
+    Unless cls defines its own __init__, construction runs one generated
+    function setting anchor and fields instead of wrapping the dataclass
+    __init__. With columnar, scalar fields are kept in columns and nodes
+    get a ColumnAnchor. With tracked, live instances are kept in a
+    registry on the class.
+    """
+    own_init = "__init__" in cls.__dict__
+    if slots:
+        cls = with_arch_base(cls, arch_cls)
+    cls = dataclass(eq=False, slots=slots)(cls)
+    for i in on_entry + on_exit:
+        i.resolve(cls)
+    if not issubclass(cls, arch_cls):
+        cls = type(
+            cls.__name__,
+            (cls, arch_cls),
+            {"__module__": cls.__module__, "__qualname__": cls.__qualname__},
+        )
+    cls._jac_entry_funcs_ = AbilityList(on_entry)
+    cls._jac_exit_funcs_ = AbilityList(on_exit)
+    anchor: Callable[[Any], Any] = anchor_cls
+    if columnar:
+        anchor = make_columnar(cls).anchor
+    init = None if own_init else fused_init(cls, anchor)
+    if init is None:
+        inner_init = cls.__init__
+
+        @wraps(inner_init)
+        def new_init(self: ArchBound, *args: object, **kwargs: object) -> None:
+            self._jac_ = anchor(self)
+            inner_init(self, *args, **kwargs)
+
+        init = new_init
+    cls.__init__ = init
+    if tracked:
+        track(cls)
+    return cls
+
+
 class JacFeatureDefaults:
     """Jac Feature."""
 
     @staticmethod
     @hookimpl
     def make_obj(
-        on_entry: list[DSFunc], on_exit: list[DSFunc]
+        on_entry: list[DSFunc], on_exit: list[DSFunc], slots: bool
     ) -> Callable[[type], type]:
         """Create a new architype."""
 
         def decorator(cls: Type[ArchBound]) -> Type[ArchBound]:
             """Decorate class."""
-            cls = dataclass(eq=False)(cls)
-            for i in on_entry + on_exit:
-                i.resolve(cls)
-            arch_cls = Architype
-            if not issubclass(cls, arch_cls):
-                cls = type(cls.__name__, (cls, arch_cls), {})
-            cls._jac_entry_funcs_ = on_entry
-            cls._jac_exit_funcs_ = on_exit
-            inner_init = cls.__init__
-
-            @wraps(inner_init)
-            def new_init(self: ArchBound, *args: object, **kwargs: object) -> None:
-                inner_init(self, *args, **kwargs)
-                arch_cls.__init__(self)
-
-            cls.__init__ = new_init
-            return cls
+            return make_architype(
+                cls, Architype, ObjectAnchor, on_entry, on_exit, slots
+            )
 
         return decorator
 
     @staticmethod
     @hookimpl
     def make_node(
-        on_entry: list[DSFunc], on_exit: list[DSFunc]
+        on_entry: list[DSFunc],
+        on_exit: list[DSFunc],
+        slots: bool,
+        columnar: bool,
+        tracked: bool,
     ) -> Callable[[type], type]:
         """Create a obj architype."""
 
         def decorator(cls: Type[ArchBound]) -> Type[ArchBound]:
             """Decorate class."""
-            cls = dataclass(eq=False)(cls)
-            for i in on_entry + on_exit:
-                i.resolve(cls)
-            arch_cls = NodeArchitype
-            if not issubclass(cls, arch_cls):
-                cls = type(cls.__name__, (cls, arch_cls), {})
-            cls._jac_entry_funcs_ = on_entry
-            cls._jac_exit_funcs_ = on_exit
-            inner_init = cls.__init__
-
-            @wraps(inner_init)
-            def new_init(self: ArchBound, *args: object, **kwargs: object) -> None:
-                inner_init(self, *args, **kwargs)
-                arch_cls.__init__(self)
-
-            cls.__init__ = new_init
-            return cls
+            return make_architype(
+                cls,
+                NodeArchitype,
+                NodeAnchor,
+                on_entry,
+                on_exit,
+                slots,
+                columnar,
+                tracked,
+            )
 
         return decorator
 
     @staticmethod
     @hookimpl
     def make_edge(
-        on_entry: list[DSFunc], on_exit: list[DSFunc]
+        on_entry: list[DSFunc], on_exit: list[DSFunc], slots: bool, tracked: bool
     ) -> Callable[[type], type]:
         """Create a edge architype."""
 
         def decorator(cls: Type[ArchBound]) -> Type[ArchBound]:
             """Decorate class."""
-            cls = dataclass(eq=False)(cls)
-            for i in on_entry + on_exit:
-                i.resolve(cls)
-            arch_cls = EdgeArchitype
-            if not issubclass(cls, arch_cls):
-                cls = type(cls.__name__, (cls, arch_cls), {})
-            cls._jac_entry_funcs_ = on_entry
-            cls._jac_exit_funcs_ = on_exit
-            inner_init = cls.__init__
-
-            @wraps(inner_init)
-            def new_init(self: ArchBound, *args: object, **kwargs: object) -> None:
-                inner_init(self, *args, **kwargs)
-                arch_cls.__init__(self)
-
-            cls.__init__ = new_init
-            return cls
+            return make_architype(
+                cls,
+                EdgeArchitype,
+                EdgeAnchor,
+                on_entry,
+                on_exit,
+                slots,
+                tracked=tracked,
+            )
 
         return decorator
 
     @staticmethod
     @hookimpl
     def make_walker(
-        on_entry: list[DSFunc], on_exit: list[DSFunc]
+        on_entry: list[DSFunc], on_exit: list[DSFunc], slots: bool
     ) -> Callable[[type], type]:
         """Create a walker architype."""
 
         def decorator(cls: Type[ArchBound]) -> Type[ArchBound]:
             """Decorate class."""
-            cls = dataclass(eq=False)(cls)
-            for i in on_entry + on_exit:
-                i.resolve(cls)
-            arch_cls = WalkerArchitype
-            if not issubclass(cls, arch_cls):
-                cls = type(cls.__name__, (cls, arch_cls), {})
-            cls._jac_entry_funcs_ = on_entry
-            cls._jac_exit_funcs_ = on_exit
-            inner_init = cls.__init__
-
-            @wraps(inner_init)
-            def new_init(self: ArchBound, *args: object, **kwargs: object) -> None:
-                inner_init(self, *args, **kwargs)
-                arch_cls.__init__(self)
-
-            cls.__init__ = new_init
-            return cls
+            return make_architype(
+                cls, WalkerArchitype, WalkerAnchor, on_entry, on_exit, slots
+            )
 
         return decorator
 
@@ -213,13 +296,25 @@ class JacFeatureDefaults:
     @staticmethod
     @hookimpl
     def spawn_call(op1: Architype, op2: Architype) -> Architype:
-        """Jac's spawn operator feature."""
-        return op1._jac_.spawn_call(op2)
+        """Jac's spawn operator feature, returning the walker."""
+        op1._jac_.spawn_call(op2)
+        return op1 if isinstance(op1, WalkerArchitype) else op2
+
+    @staticmethod
+    @hookimpl
+    def spawn_async(
+        op1: Architype, op2: Architype, concurrency: Optional[int]
+    ) -> Awaitable[None]:
+        """Jac's async spawn feature."""
+        return op1._jac_.spawn_async(op2, concurrency)
 
     @staticmethod
     @hookimpl
     def report(expr: Any) -> Any:  # noqa: ANN401
         """Jac's report stmt feature."""
+        anchor = REPORTER.get(None)
+        if anchor is not None:
+            anchor.report(expr)
 
     @staticmethod
     @hookimpl
@@ -275,29 +370,55 @@ class JacFeatureDefaults:
     ) -> NodeArchitype | list[NodeArchitype]:
         """Jac's connect operator feature.
 
-        Note: connect needs to call assign compr with tuple in op
+        Connecting lists of nodes creates one edge per pair, edge_spec being
+        the first and replicas of it the others.
         """
-        if isinstance(left, list):
-            if isinstance(right, list):
-                for i in left:
-                    for j in right:
-                        i._jac_.connect_node(j, edge_spec)
-            else:
-                for i in left:
-                    i._jac_.connect_node(right, edge_spec)
-        else:
-            if isinstance(right, list):
-                for i in right:
-                    left._jac_.connect_node(i, edge_spec)
-            else:
-                left._jac_.connect_node(right, edge_spec)
+        lefts = left if isinstance(left, list) else [left]
+        rights = right if isinstance(right, list) else [right]
+        count = len(lefts) * len(rights)
+        if count == 1:
+            lefts[0]._jac_.connect_node(rights[0], edge_spec)
+            return left
+        edges = iter([edge_spec, *edge_spec._jac_.replicate(count - 1)])
+        for i in lefts:
+            for j in rights:
+                i._jac_.connect_node(j, next(edges))
         return left
 
     @staticmethod
     @hookimpl
-    def disconnect(op1: Optional[T], op2: T, op: Any) -> T:  # noqa: ANN401
-        """Jac's connect operator feature."""
-        return ret if (ret := op1) is not None else op2
+    def disconnect(
+        left: NodeArchitype | list[NodeArchitype],
+        right: NodeArchitype | list[NodeArchitype],
+        dir: EdgeDir,
+        filter_type: Optional[type],
+        filter_func: Optional[Callable],
+    ) -> bool:
+        """Jac's disconnect operator feature."""
+        disconnected = False
+        left = [left] if isinstance(left, NodeArchitype) else left
+        right = [right] if isinstance(right, NodeArchitype) else right
+        for i in left:
+            for j in right:
+                if i._jac_.disconnect_node(j, dir, filter_type, filter_func):
+                    disconnected = True
+        return disconnected
+
+    @staticmethod
+    @hookimpl
+    def filter_compr(
+        target: list[T], conds: tuple[tuple[str, str, Any], ...]
+    ) -> list[T]:
+        """Jac's filter comprehension feature."""
+        return filter_columns(target, conds)
+
+    @staticmethod
+    @hookimpl
+    def edge_filter(
+        conds: tuple[tuple[str, str, Any], ...]
+    ) -> Callable[[list[T]], list[T]]:
+        """Jac's edge ref filter comprehension feature."""
+        return EdgeFilter(conds, filter_columns)
 
     @staticmethod
     @hookimpl
@@ -305,10 +426,7 @@ class JacFeatureDefaults:
         target: list[T], attr_val: tuple[tuple[str], tuple[Any]]
     ) -> list[T]:
         """Jac's assign comprehension feature."""
-        for obj in target:
-            attrs, values = attr_val
-            for attr, value in zip(attrs, values):
-                setattr(obj, attr, value)
+        assign_columns(target, *attr_val)
         return target
 
     @staticmethod
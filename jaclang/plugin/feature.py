@@ -1,8 +1,9 @@
 """Jac Language Features."""
 from __future__ import annotations
 
+import inspect
 import types
-from typing import Any, Callable, Optional, Type
+from typing import Any, Awaitable, Callable, Optional, Type
 
 from jaclang.plugin.default import JacFeatureDefaults
 from jaclang.plugin.spec import (
@@ -20,45 +21,93 @@ from jaclang.plugin.spec import (
 import pluggy
 
 
+class JacPluginManager(pluggy.PluginManager):
+    """Plugin manager reporting registry changes to on_change."""
+
+    on_change: Optional[Callable[[], None]] = None
+
+    def register(self, plugin: object, name: Optional[str] = None) -> Optional[str]:
+        """Register a plugin."""
+        ret = super().register(plugin, name)
+        if self.on_change:
+            self.on_change()
+        return ret
+
+    def unregister(
+        self, plugin: Optional[object] = None, name: Optional[str] = None
+    ) -> Optional[object]:
+        """Unregister a plugin."""
+        ret = super().unregister(plugin, name)
+        if self.on_change:
+            self.on_change()
+        return ret
+
+
 class JacFeature:
-    """Jac Feature."""
+    """Jac Feature.
+
+    Features whose hook has a single implementation and no wrappers are
+    bound straight to that implementation, skipping the plugin manager, and
+    rebound whenever plugins are registered or unregistered. Features with
+    parameter defaults always go through the plugin manager.
+    """
 
     from jaclang.plugin.spec import DSFunc
 
-    pm = pluggy.PluginManager("jac")
+    pm = JacPluginManager("jac")
     pm.add_hookspecs(JacFeatureSpec)
     pm.register(JacFeatureDefaults)
+    facade: dict[str, Callable[..., Any]] = {}
 
     RootType: Type[Root] = Root
     EdgeDir: Type[EdgeDir] = EdgeDir
 
     @staticmethod
     def make_obj(
-        on_entry: list[DSFunc], on_exit: list[DSFunc]
+        on_entry: list[DSFunc], on_exit: list[DSFunc], slots: bool = False
     ) -> Callable[[type], type]:
         """Create a obj architype."""
-        return JacFeature.pm.hook.make_obj(on_entry=on_entry, on_exit=on_exit)
+        return JacFeature.pm.hook.make_obj(
+            on_entry=on_entry, on_exit=on_exit, slots=slots
+        )
 
     @staticmethod
     def make_node(
-        on_entry: list[DSFunc], on_exit: list[DSFunc]
+        on_entry: list[DSFunc],
+        on_exit: list[DSFunc],
+        slots: bool = False,
+        columnar: bool = False,
+        tracked: bool = False,
     ) -> Callable[[type], type]:
         """Create a node architype."""
-        return JacFeature.pm.hook.make_node(on_entry=on_entry, on_exit=on_exit)
+        return JacFeature.pm.hook.make_node(
+            on_entry=on_entry,
+            on_exit=on_exit,
+            slots=slots,
+            columnar=columnar,
+            tracked=tracked,
+        )
 
     @staticmethod
     def make_edge(
-        on_entry: list[DSFunc], on_exit: list[DSFunc]
+        on_entry: list[DSFunc],
+        on_exit: list[DSFunc],
+        slots: bool = False,
+        tracked: bool = False,
     ) -> Callable[[type], type]:
         """Create a edge architype."""
-        return JacFeature.pm.hook.make_edge(on_entry=on_entry, on_exit=on_exit)
+        return JacFeature.pm.hook.make_edge(
+            on_entry=on_entry, on_exit=on_exit, slots=slots, tracked=tracked
+        )
 
     @staticmethod
     def make_walker(
-        on_entry: list[DSFunc], on_exit: list[DSFunc]
+        on_entry: list[DSFunc], on_exit: list[DSFunc], slots: bool = False
     ) -> Callable[[type], type]:
         """Create a walker architype."""
-        return JacFeature.pm.hook.make_walker(on_entry=on_entry, on_exit=on_exit)
+        return JacFeature.pm.hook.make_walker(
+            on_entry=on_entry, on_exit=on_exit, slots=slots
+        )
 
     @staticmethod
     def jac_import(
@@ -100,6 +149,17 @@ class JacFeature:
         """Jac's spawn operator feature."""
         return JacFeature.pm.hook.spawn_call(op1=op1, op2=op2)
 
+    @staticmethod
+    def spawn_async(
+        op1: Architype, op2: Architype, concurrency: Optional[int] = None
+    ) -> Awaitable[None]:
+        """Jac's async spawn feature.
+
+        Awaiting the result runs the walker, awaiting its async abilities.
+        With concurrency above one, queued nodes are visited concurrently.
+        """
+        return JacFeature.pm.hook.spawn_async(op1=op1, op2=op2, concurrency=concurrency)
+
     @staticmethod
     def report(expr: Any) -> Any:  # noqa: ANN401
         """Jac's report stmt feature."""
@@ -151,9 +211,35 @@ class JacFeature:
         return JacFeature.pm.hook.connect(left=left, right=right, edge_spec=edge_spec)
 
     @staticmethod
-    def disconnect(op1: Optional[T], op2: T, op: Any) -> T:  # noqa: ANN401
-        """Jac's connect operator feature."""
-        return JacFeature.pm.hook.disconnect(op1=op1, op2=op2, op=op)
+    def disconnect(
+        left: NodeArchitype | list[NodeArchitype],
+        right: NodeArchitype | list[NodeArchitype],
+        dir: EdgeDir,
+        filter_type: Optional[type],
+        filter_func: Optional[Callable],
+    ) -> bool:
+        """Jac's disconnect operator feature."""
+        return JacFeature.pm.hook.disconnect(
+            left=left,
+            right=right,
+            dir=dir,
+            filter_type=filter_type,
+            filter_func=filter_func,
+        )
+
+    @staticmethod
+    def filter_compr(
+        target: list[T], conds: tuple[tuple[str, str, Any], ...]
+    ) -> list[T]:
+        """Jac's filter comprehension feature."""
+        return JacFeature.pm.hook.filter_compr(target=target, conds=conds)
+
+    @staticmethod
+    def edge_filter(
+        conds: tuple[tuple[str, str, Any], ...]
+    ) -> Callable[[list[T]], list[T]]:
+        """Jac's edge ref filter comprehension feature."""
+        return JacFeature.pm.hook.edge_filter(conds=conds)
 
     @staticmethod
     def assign_compr(
@@ -177,3 +263,32 @@ class JacFeature:
         return JacFeature.pm.hook.build_edge(
             edge_dir=edge_dir, conn_type=conn_type, conn_assign=conn_assign
         )
+
+    @staticmethod
+    def bind_hooks() -> None:
+        """Bind features to their hook implementation where it is the only one."""
+        for name, facade in JacFeature.facade.items():
+            impls = getattr(JacFeature.pm.hook, name).get_hookimpls()
+            direct = (
+                len(impls) == 1
+                and not impls[0].hookwrapper
+                and not getattr(impls[0], "wrapper", False)
+                and all(
+                    param.default is param.empty
+                    for param in inspect.signature(facade).parameters.values()
+                )
+            )
+            setattr(
+                JacFeature,
+                name,
+                staticmethod(impls[0].function) if direct else staticmethod(facade),
+            )
+
+
+JacFeature.facade.update(
+    (name, getattr(JacFeature, name))
+    for name in vars(JacFeatureSpec)
+    if isinstance(vars(JacFeature).get(name), staticmethod)
+)
+JacFeature.pm.on_change = JacFeature.bind_hooks
+JacFeature.bind_hooks()
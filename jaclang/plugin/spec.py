@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import types
-from typing import Any, Callable, Optional, Type, TypeVar
+from typing import Any, Awaitable, Callable, Optional, Type, TypeVar
 
 
 from jaclang.core.construct import (
@@ -56,7 +56,7 @@ class JacFeatureSpec:
     @staticmethod
     @hookspec(firstresult=True)
     def make_obj(
-        on_entry: list[DSFunc], on_exit: list[DSFunc]
+        on_entry: list[DSFunc], on_exit: list[DSFunc], slots: bool
     ) -> Callable[[type], type]:
         """Create a obj architype."""
         raise NotImplementedError
@@ -64,7 +64,11 @@ class JacFeatureSpec:
     @staticmethod
     @hookspec(firstresult=True)
     def make_node(
-        on_entry: list[DSFunc], on_exit: list[DSFunc]
+        on_entry: list[DSFunc],
+        on_exit: list[DSFunc],
+        slots: bool,
+        columnar: bool,
+        tracked: bool,
     ) -> Callable[[type], type]:
         """Create a node architype."""
         raise NotImplementedError
@@ -72,7 +76,7 @@ class JacFeatureSpec:
     @staticmethod
     @hookspec(firstresult=True)
     def make_edge(
-        on_entry: list[DSFunc], on_exit: list[DSFunc]
+        on_entry: list[DSFunc], on_exit: list[DSFunc], slots: bool, tracked: bool
     ) -> Callable[[type], type]:
         """Create a edge architype."""
         raise NotImplementedError
@@ -80,7 +84,7 @@ class JacFeatureSpec:
     @staticmethod
     @hookspec(firstresult=True)
     def make_walker(
-        on_entry: list[DSFunc], on_exit: list[DSFunc]
+        on_entry: list[DSFunc], on_exit: list[DSFunc], slots: bool
     ) -> Callable[[type], type]:
         """Create a walker architype."""
         raise NotImplementedError
@@ -129,6 +133,14 @@ class JacFeatureSpec:
         """Jac's spawn operator feature."""
         raise NotImplementedError
 
+    @staticmethod
+    @hookspec(firstresult=True)
+    def spawn_async(
+        op1: Architype, op2: Architype, concurrency: Optional[int]
+    ) -> Awaitable[None]:
+        """Jac's async spawn feature."""
+        raise NotImplementedError
+
     @staticmethod
     @hookspec(firstresult=True)
     def report(expr: Any) -> Any:  # noqa: ANN401
@@ -185,8 +197,30 @@ class JacFeatureSpec:
 
     @staticmethod
     @hookspec(firstresult=True)
-    def disconnect(op1: Optional[T], op2: T, op: Any) -> T:  # noqa: ANN401
-        """Jac's connect operator feature."""
+    def disconnect(
+        left: NodeArchitype | list[NodeArchitype],
+        right: NodeArchitype | list[NodeArchitype],
+        dir: EdgeDir,
+        filter_type: Optional[type],
+        filter_func: Optional[Callable],
+    ) -> bool:
+        """Jac's disconnect operator feature."""
+        raise NotImplementedError
+
+    @staticmethod
+    @hookspec(firstresult=True)
+    def filter_compr(
+        target: list[T], conds: tuple[tuple[str, str, Any], ...]
+    ) -> list[T]:
+        """Jac's filter comprehension feature."""
+        raise NotImplementedError
+
+    @staticmethod
+    @hookspec(firstresult=True)
+    def edge_filter(
+        conds: tuple[tuple[str, str, Any], ...]
+    ) -> Callable[[list[T]], list[T]]:
+        """Jac's edge ref filter comprehension feature."""
         raise NotImplementedError
 
     @staticmethod
@@ -6,7 +6,7 @@ import traceback
 from typing import List, Type
 
 from jaclang.cli import cli
-from jaclang.plugin.default import JacFeatureDefaults
+from jaclang.plugin.default import JacFeatureDefaults, hookimpl
 from jaclang.plugin.feature import JacFeature
 from jaclang.plugin.spec import JacFeatureSpec
 from jaclang.utils.test import TestCase
@@ -58,6 +58,27 @@ class TestFeatures(TestCase):
         for i in jac_feature_spec_methods:
             self.assertIn(i, jac_feature_methods)
 
+    def test_single_impl_hooks_bound_directly(self) -> None:
+        """Features skip the plugin manager until a second plugin hooks them."""
+        self.assertIs(JacFeature.elvis, JacFeatureDefaults.elvis)
+        self.assertIs(JacFeature.jac_import, JacFeature.facade["jac_import"])
+
+        class Override:
+            @staticmethod
+            @hookimpl
+            def elvis(op1: object, op2: object) -> object:
+                return "plugin"
+
+        JacFeature.pm.register(Override)
+        try:
+            self.assertIs(JacFeature.elvis, JacFeature.facade["elvis"])
+            self.assertEqual(JacFeature.elvis(None, 1), "plugin")
+            self.assertIs(JacFeature.edge_ref, JacFeatureDefaults.edge_ref)
+        finally:
+            JacFeature.pm.unregister(Override)
+        self.assertIs(JacFeature.elvis, JacFeatureDefaults.elvis)
+        self.assertEqual(JacFeature.elvis(None, 1), 1)
+
     def test_impl_match_error_reporting(self) -> None:
         """Basic test for error reporting."""
         captured_output = io.StringIO()
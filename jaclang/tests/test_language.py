@@ -228,3 +228,15 @@ class JacLanguageTests(TestCase):
         self.assertEqual(stdout_value.split("\n")[0], "[(3, 5), (14, 1), (5, 1)]")
         self.assertEqual(stdout_value.split("\n")[1], "10")
         self.assertEqual(stdout_value.split("\n")[2], "12")
+
+    def test_disconnect(self) -> None:
+        """Test disconnect op removes edges from both ends."""
+        construct.root._jac_.edges[construct.EdgeDir.OUT].clear()
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        jac_import("disconn", base_path=self.fixture_abs_path("./"))
+        sys.stdout = sys.__stdout__
+        stdout_value = captured_output.getvalue()
+        self.assertEqual(stdout_value.split("\n")[0], "[0, 2, 3, 4]")
+        self.assertEqual(stdout_value.split("\n")[1], "[0, 2]")
+        self.assertEqual(stdout_value.split("\n")[2], "0")
@@ -0,0 +1,60 @@
+"""Benchmark async walkers waiting on I/O per node.
+
+A walker awaits a simulated I/O call on each of the nodes under a root,
+one node at a time, then with the nodes of each frontier overlapping.
+
+Usage: python scripts/benchmarks/bench_async.py [nodes] [io_ms] [concurrency]
+"""
+import asyncio
+import sys
+import time
+
+from jaclang.core.construct import EdgeDir, Root
+from jaclang.plugin.feature import JacFeature as Jac
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True)
+class Product:
+    """Benchmark node."""
+
+    price: int = 0
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("step", None)], on_exit=[])
+class Fetcher:
+    """Walker looking up each product with a simulated I/O call."""
+
+    io_ms: float = 1.0
+    total: int = 0
+
+    async def step(self, here: object) -> None:
+        """Wait on I/O, add price and move on."""
+        if isinstance(here, Product):
+            await asyncio.sleep(self.io_ms / 1e3)
+            self.total += here.price
+        Jac.visit_node(self, Jac.edge_ref(here, EdgeDir.OUT, None, None))
+
+
+def main(num_nodes: int, io_ms: float, concurrency: int) -> None:
+    """Run the benchmark."""
+    root = Root()
+    Jac.connect(
+        root,
+        [Product(price=i) for i in range(num_nodes)],
+        Jac.build_edge(EdgeDir.OUT, None, None),
+    )
+    for label, limit in (("sequential", None), ("concurrent", concurrency)):
+        walker = Fetcher(io_ms=io_ms)
+        start = time.perf_counter()
+        asyncio.run(Jac.spawn_async(walker, root, limit))
+        took = time.perf_counter() - start
+        assert walker.total == num_nodes * (num_nodes - 1) // 2
+        print(f"{label:<11} {took * 1e3:>8.0f} ms (concurrency {limit or 1})")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 1.0,
+        int(sys.argv[3]) if len(sys.argv) > 3 else 32,
+    )
@@ -0,0 +1,74 @@
+"""Benchmark filter and assign comprehensions over plain and columnar nodes.
+
+Filtering columnar nodes runs vectorised when NumPy is installed. The
+traverse rows filter the neighbours of a hub node, like [-->](?temp > 50).
+
+Usage: python scripts/benchmarks/bench_columnar.py [nodes] [loops]
+"""
+import sys
+import time
+
+from jaclang.core.construct import EdgeDir, Root
+from jaclang.plugin.feature import JacFeature as Jac
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True)
+class Plain:
+    """Benchmark node with fields on the node."""
+
+    temp: float = 0.0
+    hits: int = 0
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True, columnar=True)
+class Columnar:
+    """Benchmark node with fields in columns."""
+
+    temp: float = 0.0
+    hits: int = 0
+
+
+def listcomp(nodes: list) -> list:
+    """Filter the way filter comprehensions compiled before the feature."""
+    return [i for i in nodes if i.temp > 50.0 if i.hits < 5]
+
+
+def main(num_nodes: int, loops: int) -> None:
+    """Run the benchmark."""
+    conds = (("temp", ">", 50.0), ("hits", "<", 5))
+    for cls in (Plain, Columnar):
+        nodes = [cls(temp=i % 100, hits=i % 10) for i in range(num_nodes)]
+        start = time.perf_counter()
+        for _ in range(loops):
+            listcomp(nodes)
+        took = time.perf_counter() - start
+        print(f"{cls.__name__:<9} listcomp  {num_nodes * loops / took:>12,.0f} nodes/s")
+        start = time.perf_counter()
+        for _ in range(loops):
+            Jac.filter_compr(nodes, conds)
+        took = time.perf_counter() - start
+        print(f"{cls.__name__:<9} filter    {num_nodes * loops / took:>12,.0f} nodes/s")
+        start = time.perf_counter()
+        for _ in range(loops):
+            Jac.assign_compr(nodes, (("hits",), (3,)))
+        took = time.perf_counter() - start
+        print(f"{cls.__name__:<9} assign    {num_nodes * loops / took:>12,.0f} nodes/s")
+        hub = Root()
+        Jac.connect(hub, nodes, Jac.build_edge(EdgeDir.OUT, None, None))
+        start = time.perf_counter()
+        for _ in range(loops):
+            listcomp(Jac.edge_ref(hub, EdgeDir.OUT, None, None))
+        took = time.perf_counter() - start
+        print(f"{cls.__name__:<9} traverse  {num_nodes * loops / took:>12,.0f} nodes/s")
+        start = time.perf_counter()
+        for _ in range(loops):
+            Jac.filter_compr(Jac.edge_ref(hub, EdgeDir.OUT, None, None), conds)
+        took = time.perf_counter() - start
+        print(f"{cls.__name__:<9}  filtered {num_nodes * loops / took:>12,.0f} nodes/s")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+    )
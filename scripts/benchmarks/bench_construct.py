@@ -0,0 +1,69 @@
+"""Benchmark architype construction throughput in nodes and edges per second.
+
+Compares the generated constructors of make_node/make_edge, plain and
+slotted, with the dataclass __init__ wrapped in an anchor-attaching closure.
+
+Usage: python scripts/benchmarks/bench_construct.py [count]
+"""
+import sys
+import timeit
+from dataclasses import dataclass
+from functools import wraps
+
+from jaclang.core.construct import EdgeArchitype, NodeArchitype
+from jaclang.plugin.feature import JacFeature as Jac
+
+
+def wrapped(cls: type, arch_cls: type) -> type:
+    """Make an architype constructed through a wrapped dataclass __init__."""
+    cls = dataclass(eq=False)(cls)
+    cls = type(cls.__name__, (cls, arch_cls), {})
+    cls._jac_entry_funcs_, cls._jac_exit_funcs_ = [], []
+    inner_init = cls.__init__
+
+    @wraps(inner_init)
+    def new_init(self: object, *args: object, **kwargs: object) -> None:
+        inner_init(self, *args, **kwargs)
+        arch_cls.__init__(self)
+
+    cls.__init__ = new_init
+    return cls
+
+
+def make_types(layout: str) -> tuple[type, type]:
+    """Create a node and an edge architype of a layout."""
+
+    class Reading:
+        value: int = 0
+        label: str = ""
+
+    class Feeds:
+        weight: float = 1.0
+
+    if layout == "wrapped":
+        return wrapped(Reading, NodeArchitype), wrapped(Feeds, EdgeArchitype)
+    slots = layout == "slotted"
+    return (
+        Jac.make_node(on_entry=[], on_exit=[], slots=slots)(Reading),
+        Jac.make_edge(on_entry=[], on_exit=[], slots=slots)(Feeds),
+    )
+
+
+def main(count: int) -> None:
+    """Run the benchmark."""
+    print(f"{'layout':>8} {'nodes/s':>12} {'edges/s':>12}")
+    for layout in ("wrapped", "fused", "slotted"):
+        node_cls, edge_cls = make_types(layout)
+        nodes = min(
+            timeit.repeat(
+                lambda c=node_cls: c(value=1, label="a"), number=count, repeat=5
+            )
+        )
+        edges = min(
+            timeit.repeat(lambda c=edge_cls: c(weight=2.0), number=count, repeat=5)
+        )
+        print(f"{layout:>8} {count / nodes:>12,.0f} {count / edges:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
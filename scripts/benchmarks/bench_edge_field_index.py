@@ -0,0 +1,81 @@
+"""Benchmark edge refs filtered on an indexed edge field against scans.
+
+Usage: python scripts/benchmarks/bench_edge_field_index.py [edges] [loops]
+"""
+import gc
+import random
+import sys
+import time
+
+from jaclang.core.construct import EdgeDir, Root
+from jaclang.core.edgeindex import index_edges, top_k
+from jaclang.plugin.feature import JacFeature as Jac
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True)
+class Item:
+    """Benchmark node."""
+
+
+@Jac.make_edge(on_entry=[], on_exit=[], slots=True)
+class Scan:
+    """Benchmark edge without index."""
+
+    stars: int = 0
+
+
+@Jac.make_edge(on_entry=[], on_exit=[], slots=True)
+class Indexed:
+    """Benchmark edge with a sorted index on stars."""
+
+    stars: int = 0
+
+
+index_edges(Indexed, "stars")
+
+
+def main(num_edges: int, loops: int) -> None:
+    """Run the benchmark."""
+    rng = random.Random(1)
+    stars = [rng.randrange(1000) for _ in range(num_edges)]
+    for cls in (Scan, Indexed):
+        hub = Root()
+        start = time.perf_counter()
+        for val in stars:
+            Jac.connect(
+                hub, Item(), Jac.build_edge(EdgeDir.OUT, cls, (("stars",), (val,)))
+            )
+        took = time.perf_counter() - start
+        print(f"{cls.__name__:<8} connect  {num_edges / took:>12,.0f} edges/s")
+        start = time.perf_counter()
+        Jac.edge_ref(hub, EdgeDir.OUT, cls, Jac.edge_filter((("stars", "==", -1),)))
+        took = time.perf_counter() - start
+        print(f"{cls.__name__:<8} first    {took * 1e3:>9.3f} ms")
+        for op, val in ((">=", 990), ("==", 500), ("<", 500)):
+            start = time.perf_counter()
+            for _ in range(loops):
+                found = Jac.edge_ref(
+                    hub, EdgeDir.OUT, cls, Jac.edge_filter((("stars", op, val),))
+                )
+            took = (time.perf_counter() - start) / loops
+            print(
+                f"{cls.__name__:<8} {op:<2} {val:<4} {took * 1e3:>9.3f} ms"
+                f" {len(found):>8} nodes"
+            )
+        start = time.perf_counter()
+        for _ in range(loops):
+            if cls is Indexed:
+                best = top_k(hub, cls, "stars", 10)
+            else:
+                best = sorted(hub._jac_.out_edges, key=lambda e: e.stars)[-10:]
+        took = (time.perf_counter() - start) / loops
+        print(f"{cls.__name__:<8} top 10  {took * 1e3:>9.3f} ms {len(best):>8} edges")
+        del hub
+        gc.collect()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+    )
@@ -0,0 +1,67 @@
+"""Benchmark typed edge refs on hub-heavy graphs.
+
+Usage: python scripts/benchmarks/bench_edge_index.py [degree ...]
+"""
+import sys
+import time
+from typing import Callable
+
+from jaclang.core.construct import EdgeDir
+from jaclang.plugin.feature import JacFeature as Jac
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+class Item:
+    """Benchmark node."""
+
+
+@Jac.make_edge(on_entry=[], on_exit=[])
+class Common:
+    """Edge type holding almost every edge of the hub."""
+
+
+@Jac.make_edge(on_entry=[], on_exit=[])
+class Rare:
+    """Edge type holding a handful of the hub's edges."""
+
+
+def build_hub(degree: int, rare: int) -> Item:
+    """Build a hub node with `degree` common and `rare` rare out edges."""
+    hub = Item()
+    for _ in range(degree):
+        Jac.connect(hub, Item(), Jac.build_edge(EdgeDir.OUT, Common, None))
+    for _ in range(rare):
+        Jac.connect(hub, Item(), Jac.build_edge(EdgeDir.OUT, Rare, None))
+    return hub
+
+
+def time_op(op: Callable[[], object], reps: int) -> float:
+    """Return average seconds per call of op."""
+    start = time.perf_counter()
+    for _ in range(reps):
+        op()
+    return (time.perf_counter() - start) / reps
+
+
+def main(degrees: list[int]) -> None:
+    """Run the benchmark."""
+    print(f"{'degree':>10} {'typed us':>12} {'scan us':>12} {'speedup':>9}")
+    for degree in degrees:
+        hub = build_hub(degree, 10)
+        out = hub._jac_.edges[EdgeDir.OUT]
+        reps = max(3, 200_000 // degree)
+        typed = time_op(
+            lambda hub=hub: Jac.edge_ref(hub, EdgeDir.OUT, Rare, None), reps
+        )
+        scan = time_op(
+            lambda out=out: [e._jac_.target for e in out if isinstance(e, Rare)],
+            reps,
+        )
+        print(
+            f"{degree:>10} {typed * 1e6:>12.2f} {scan * 1e6:>12.2f}"
+            f" {scan / typed:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main([int(i) for i in sys.argv[1:]] or [1_000, 10_000, 100_000, 500_000])
@@ -0,0 +1,58 @@
+"""Benchmark streaming graph export time and peak memory per format.
+
+Peak memory is what the export allocates on top of the graph, so it should
+grow with the frontier and node index only, not with output size.
+
+Usage: python scripts/benchmarks/bench_export.py [nodes ...]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+from jaclang.core.construct import EdgeDir
+from jaclang.core.export import FORMATS, export_graph
+from jaclang.plugin.feature import JacFeature as Jac
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+class Item:
+    """Benchmark node."""
+
+    value: int = 0
+
+
+def tree(n: int) -> Item:
+    """Build a 4-ary tree of n nodes."""
+    nodes = [Item(value=i) for i in range(n)]
+    for i in range(1, n):
+        Jac.connect(
+            nodes[(i - 1) // 4], nodes[i], Jac.build_edge(EdgeDir.OUT, None, None)
+        )
+    return nodes[0]
+
+
+def main(sizes: list[int]) -> None:
+    """Run the benchmark."""
+    print(
+        f"{'format':>8} {'nodes':>9} {'ms':>9} {'us/node':>8} {'peak kB':>8} {'B/node':>7}"
+    )
+    for size in sizes:
+        start_node = tree(size)
+        for fmt in FORMATS:
+            with open(os.devnull, "w") as out:
+                start = time.perf_counter()
+                export_graph(start_node, out, fmt)
+                elapsed = time.perf_counter() - start
+                tracemalloc.start()
+                export_graph(start_node, out, fmt)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            print(
+                f"{fmt:>8} {size:>9} {elapsed * 1e3:>9.1f}"
+                f" {elapsed / size * 1e6:>8.2f} {peak // 1024:>8} {peak // size:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(i) for i in sys.argv[1:]] or [10_000, 100_000])
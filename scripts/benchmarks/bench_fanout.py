@@ -0,0 +1,66 @@
+"""Benchmark fanning out parallel safe abilities on a thread pool.
+
+A walker visits the children of a root and hashes a payload on each of
+them, in an ability marked parallel_safe. hashlib releases the GIL on
+large inputs, so hashes of a batch run on threads overlap when there
+are cores to run them.
+
+Usage: python scripts/benchmarks/bench_fanout.py [nodes] [payload_kib] [threads]
+"""
+import hashlib
+import sys
+import time
+from dataclasses import field
+
+from jaclang.core.construct import EdgeDir, Root
+from jaclang.core.fanout import AbilityFanout, parallel_safe
+from jaclang.plugin.feature import JacFeature as Jac
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True)
+class Blob:
+    """Benchmark node."""
+
+    payload: bytes = b""
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("step", None)], on_exit=[])
+class Hasher:
+    """Walker hashing the payloads of blobs."""
+
+    digests: dict = field(default_factory=dict)
+
+    @parallel_safe
+    def step(self, here: object) -> None:
+        """Hash the payload and move on."""
+        if isinstance(here, Blob):
+            self.digests[id(here)] = hashlib.sha256(here.payload).digest()
+        Jac.visit_node(self, Jac.edge_ref(here, EdgeDir.OUT, None, None))
+
+
+def main(num_nodes: int, payload_kib: int, threads: int) -> None:
+    """Run the benchmark."""
+    root = Root()
+    Jac.connect(
+        root,
+        [Blob(payload=bytes([i % 256]) * payload_kib * 1024) for i in range(num_nodes)],
+        Jac.build_edge(EdgeDir.OUT, None, None),
+    )
+    for label, workers in (("serial", 0), ("fanned out", threads)):
+        if workers:
+            AbilityFanout.enable(max_workers=workers)
+        walker = Hasher()
+        start = time.perf_counter()
+        Jac.spawn_call(root, walker)
+        took = time.perf_counter() - start
+        AbilityFanout.disable()
+        assert len(walker.digests) == num_nodes
+        print(f"{label:<10} {took * 1e3:>8.0f} ms ({workers or 1} threads)")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 256,
+        int(sys.argv[3]) if len(sys.argv) > 3 else 4,
+    )
@@ -0,0 +1,102 @@
+"""Benchmark frozen CSR graphs against live and pickled graphs.
+
+Usage: python scripts/benchmarks/bench_frozen.py [nodes] [fanout]
+"""
+import gc
+import os
+import pickle
+import sys
+import tempfile
+import time
+from dataclasses import field
+
+from jaclang.core.construct import EdgeDir, Root
+from jaclang.core.frozen import freeze, open_frozen
+from jaclang.plugin.feature import JacFeature as Jac
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True)
+class Product:
+    """Benchmark node."""
+
+    name: str = ""
+    price: int = 0
+    rating: float = 0.0
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("step", None)], on_exit=[])
+class Summer:
+    """Walker adding up prices over the whole graph."""
+
+    total: int = 0
+    seen: int = field(default=0)
+
+    def step(self, here: object) -> None:
+        """Add price and move on."""
+        self.total += getattr(here, "price", 0)
+        self.seen += 1
+        Jac.visit_node(self, Jac.edge_ref(here, EdgeDir.OUT, None, None))
+
+
+def build(num_nodes: int, fanout: int) -> Root:
+    """Build a tree of num_nodes products, fanout children each."""
+    root = Root()
+    level = [root]
+    made = 0
+    while made < num_nodes:
+        nxt = []
+        for parent in level:
+            kids = [
+                Product(name=f"p{made + i}", price=made + i, rating=i / fanout)
+                for i in range(min(fanout, num_nodes - made))
+            ]
+            made += len(kids)
+            if kids:
+                Jac.connect(parent, kids, Jac.build_edge(EdgeDir.OUT, None, None))
+            nxt.extend(kids)
+        level = nxt
+    return root
+
+
+def timed(label: str, func, count: int = 0):  # noqa: ANN001, ANN201
+    """Run func once, print its time, return its result."""
+    start = time.perf_counter()
+    result = func()
+    took = time.perf_counter() - start
+    rate = f" {count / took:>12,.0f} nodes/s" if count else ""
+    print(f"{label:<18} {took * 1e3:>9.1f} ms{rate}")
+    return result
+
+
+def walk(root: object) -> int:
+    """Sum prices over the graph from root."""
+    walker = Summer()
+    Jac.spawn_call(root, walker)
+    return walker.total
+
+
+def main(num_nodes: int, fanout: int) -> None:
+    """Run the benchmark."""
+    root = timed("build", lambda: build(num_nodes, fanout), num_nodes)
+    path = os.path.join(tempfile.mkdtemp(), "graph.csr")
+    timed("freeze", lambda: freeze(root, path), num_nodes)
+    print(f"{'file size':<18} {os.path.getsize(path) / 2**20:>9.1f} MiB")
+    sys.setrecursionlimit(100_000)
+    data = pickle.dumps(root)
+    expected = timed("live walk", lambda: walk(root), num_nodes)
+    root = None
+    gc.collect()
+    timed("pickle load", lambda: pickle.loads(data), num_nodes)
+    gc.collect()
+    graph = timed("mmap open", lambda: open_frozen(path))
+    total = timed("frozen walk", lambda: walk(graph.root), num_nodes)
+    total = timed("frozen rewalk", lambda: walk(graph.root), num_nodes)
+    assert total == expected
+    graph.close()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 10,
+    )
@@ -0,0 +1,53 @@
+"""Benchmark per-call overhead of Jac features through pluggy and bound directly.
+
+Usage: python scripts/benchmarks/bench_hooks.py [calls]
+"""
+import sys
+import timeit
+from typing import Callable
+
+from jaclang.core.construct import EdgeDir
+from jaclang.plugin.feature import JacFeature as Jac
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+class Spot:
+    """Benchmark node."""
+
+
+@Jac.make_walker(on_entry=[], on_exit=[])
+class Idle:
+    """Walker without abilities."""
+
+
+def ops() -> dict[str, Callable[[Callable], object]]:
+    """Get a call of each feature on prepared arguments, given the feature."""
+    here, there = Spot(), Spot()
+    Jac.connect(here, there, Jac.build_edge(EdgeDir.OUT, None, None))
+    walker = Idle()
+    return {
+        "elvis": lambda f: f(None, 1),
+        "visit_node": lambda f: f(walker, there),
+        "edge_ref": lambda f: f(here, EdgeDir.OUT, None, None),
+        "connect": lambda f: f(Spot(), there, Jac.build_edge(EdgeDir.OUT, None, None)),
+        "spawn_call": lambda f: f(there, walker),
+        "build_edge": lambda f: f(EdgeDir.OUT, None, None),
+    }
+
+
+def main(calls: int) -> None:
+    """Run the benchmark."""
+    print(f"{'feature':>12} {'pluggy ns':>10} {'bound ns':>10} {'saved ns':>10}")
+    for name, call in ops().items():
+        via_pm = Jac.facade[name]
+        bound = getattr(Jac, name)
+        slow = min(timeit.repeat(lambda c=call, f=via_pm: c(f), number=calls, repeat=5))
+        fast = min(timeit.repeat(lambda c=call, f=bound: c(f), number=calls, repeat=5))
+        print(
+            f"{name:>12} {slow / calls * 1e9:>10.0f} {fast / calls * 1e9:>10.0f}"
+            f" {(slow - fast) / calls * 1e9:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,89 @@
+"""Benchmark bulk edge ingestion against connect calls.
+
+Usage: python scripts/benchmarks/bench_ingest.py [nodes] [edges]
+"""
+import gc
+import random
+import sys
+import time
+
+from jaclang.core.construct import EdgeDir
+from jaclang.core.ingest import load_edges, load_nodes
+from jaclang.plugin.feature import JacFeature as Jac
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True)
+class Account:
+    """Benchmark node."""
+
+    id: int = 0
+
+
+@Jac.make_edge(on_entry=[], on_exit=[], slots=True)
+class Pays:
+    """Benchmark edge."""
+
+    amount: int = 0
+
+
+def reset(nodes: dict) -> None:
+    """Drop all edges and collect them, so runs start from the same heap."""
+    for nd in nodes.values():
+        nd._jac_.out_edges = nd._jac_.in_edges = None
+    gc.collect()
+
+
+def main(num_nodes: int, num_edges: int) -> None:
+    """Run the benchmark."""
+    rng = random.Random(1)
+    pairs = [
+        (rng.randrange(num_nodes), rng.randrange(num_nodes)) for _ in range(num_edges)
+    ]
+    start = time.perf_counter()
+    nodes = load_nodes(({"id": i} for i in range(num_nodes)), Account)
+    took = time.perf_counter() - start
+    print(f"load_nodes  {num_nodes / took:>12,.0f} nodes/s")
+
+    start = time.perf_counter()
+    for src, trg in pairs:
+        Jac.connect(
+            nodes[src],
+            nodes[trg],
+            Jac.build_edge(EdgeDir.OUT, Pays, (("amount",), (1,))),
+        )
+    took = time.perf_counter() - start
+    print(f"connect     {num_edges / took:>12,.0f} edges/s")
+
+    reset(nodes)
+    side = int(num_edges**0.5)
+    payers, payees = list(nodes.values())[:side], list(nodes.values())[-side:]
+    start = time.perf_counter()
+    Jac.connect(payers, payees, Jac.build_edge(EdgeDir.OUT, Pays, (("amount",), (1,))))
+    took = time.perf_counter() - start
+    print(f"connect []  {side * side / took:>12,.0f} edges/s")
+
+    reset(nodes)
+    start = time.perf_counter()
+    load_edges(((s, t, Pays, {"amount": 1}) for s, t in pairs), nodes)
+    took = time.perf_counter() - start
+    print(f"load_edges  {num_edges / took:>12,.0f} edges/s")
+
+    reset(nodes)
+    start = time.perf_counter()
+    load_edges(((s, t, Pays, None) for s, t in pairs), nodes)
+    took = time.perf_counter() - start
+    print(f"  no attrs  {num_edges / took:>12,.0f} edges/s")
+
+    reset(nodes)
+    pairs.sort()
+    start = time.perf_counter()
+    load_edges(((s, t, Pays, None) for s, t in pairs), nodes)
+    took = time.perf_counter() - start
+    print(f"  sorted    {num_edges / took:>12,.0f} edges/s")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000,
+    )
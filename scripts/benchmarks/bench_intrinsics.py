@@ -0,0 +1,63 @@
+"""Benchmark Jac code compiled with and without feature lowering.
+
+Usage: python scripts/benchmarks/bench_intrinsics.py [iterations]
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+from jaclang.compiler.passes.main.schedules import py_code_gen, py_code_gen_opt
+from jaclang.compiler.transpiler import jac_str_to_pass
+
+SOURCE = """
+node spot {
+    has val: int = 0, tag: str = "";
+}
+
+walker bench {
+    has iters: int = 1;
+
+    can run with `<root> entry {
+        for i=0 to i<8 by i+=1 {
+            <here> ++> spot(val=i);
+        }
+        for n=0 to n<self.iters by n+=1 {
+            x = None ?: n;
+            kids = -->;
+            kids(* tag="t", val=x);
+        }
+    }
+}
+"""
+
+
+def run(schedule: list, iters: int) -> float:
+    """Compile the source with schedule and time one spawn of iters loops."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.jac")
+        code_gen = jac_str_to_pass(SOURCE, path, schedule=schedule)
+    scope: dict = {}
+    exec(compile(code_gen.ir.gen.py_ast, path, "exec"), scope)
+    walker = scope["bench"](iters=iters)
+    root = scope["_Jac"].get_root()
+
+    def spawn() -> None:
+        root._jac_.out_edges = None
+        root._jac_.spawn_call(walker)
+
+    return min(timeit.repeat(spawn, number=1, repeat=5))
+
+
+def main(iters: int) -> None:
+    """Run the benchmark."""
+    plain = run(py_code_gen, iters)
+    lowered = run(py_code_gen_opt, iters)
+    print(f"{'schedule':>10} {'us/loop':>10}")
+    print(f"{'default':>10} {plain / iters * 1e6:>10.2f}")
+    print(f"{'lowered':>10} {lowered / iters * 1e6:>10.2f}")
+    print(f"speedup {plain / lowered:.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,73 @@
+"""Benchmark memory used per node and per edge, plain and slotted.
+
+Usage: python scripts/benchmarks/bench_memory.py [nodes]
+"""
+import gc
+import sys
+import tracemalloc
+from typing import Callable
+
+from jaclang.core.construct import EdgeDir
+from jaclang.plugin.feature import JacFeature as Jac
+
+
+def make_types(slots: bool) -> tuple[type, type]:
+    """Create a node and an edge architype."""
+
+    class Reading:
+        value: int = 0
+        label: str = ""
+
+    class Feeds:
+        weight: float = 1.0
+
+    return (
+        Jac.make_node(on_entry=[], on_exit=[], slots=slots)(Reading),
+        Jac.make_edge(on_entry=[], on_exit=[], slots=slots)(Feeds),
+    )
+
+
+def measure(build: Callable[[], object]) -> tuple[int, object]:
+    """Return bytes allocated by build and its result."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+def main(count: int) -> None:
+    """Run the benchmark."""
+    print(f"{'layout':>8} {'bytes/node':>11} {'edge chain':>11} {'edge hub':>11}")
+    for slots in (False, True):
+        node_cls, edge_cls = make_types(slots)
+        node_bytes, nodes = measure(
+            lambda node_cls=node_cls: [node_cls(value=i) for i in range(count)]
+        )
+
+        def connect_chain(nodes: list = nodes, edge_cls: type = edge_cls) -> None:
+            for a, b in zip(nodes, nodes[1:]):
+                Jac.connect(a, b, Jac.build_edge(EdgeDir.OUT, edge_cls, None))
+
+        # First connect allocates adjacency on both ends, so charge that to
+        # the edges, as a graph with no edges never pays for it. A chain pays
+        # it once per edge, a hub only on the leaf side.
+        chain_bytes, _ = measure(connect_chain)
+        nodes = [node_cls(value=i) for i in range(count)]
+
+        def connect_hub(nodes: list = nodes, edge_cls: type = edge_cls) -> None:
+            for b in nodes[1:]:
+                Jac.connect(nodes[0], b, Jac.build_edge(EdgeDir.OUT, edge_cls, None))
+
+        hub_bytes, _ = measure(connect_hub)
+        print(
+            f"{'slotted' if slots else 'plain':>8} {node_bytes / count:>11.1f}"
+            f" {chain_bytes / (count - 1):>11.1f} {hub_bytes / (count - 1):>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
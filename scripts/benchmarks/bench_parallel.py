@@ -0,0 +1,80 @@
+"""Benchmark spawning many walkers across a process pool.
+
+Walkers sum the prices of one hub of products each, from the hub, over a
+published graph. They run one by one in this process, then across a pool
+without partitions, then across a pool with the graph split in as many
+partitions as processes, where walkers are handed off between partitions.
+
+Usage: python scripts/benchmarks/bench_parallel.py [nodes] [processes]
+"""
+import gc
+import sys
+import time
+
+from jaclang.core.construct import EdgeDir, Root
+from jaclang.core.parallel import range_partitions, spawn_parallel
+from jaclang.core.shared import publish
+from jaclang.plugin.feature import JacFeature as Jac
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True)
+class Product:
+    """Benchmark node."""
+
+    name: str = ""
+    price: int = 0
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("step", None)], on_exit=[])
+class Summer:
+    """Walker adding up prices from where it is spawned."""
+
+    total: int = 0
+
+    def step(self, here: object) -> None:
+        """Add price and move on."""
+        self.total += getattr(here, "price", 0)
+        Jac.visit_node(self, Jac.edge_ref(here, EdgeDir.OUT, None, None))
+
+
+def build(num_nodes: int) -> Root:
+    """Build a root with num_nodes / 100 hubs of 100 products each."""
+    root = Root()
+    for hub in range(0, num_nodes, 100):
+        kids = [Product(name=f"p{i}", price=i) for i in range(hub, hub + 100)]
+        Jac.connect(root, kids[0], Jac.build_edge(EdgeDir.OUT, None, None))
+        Jac.connect(kids[0], kids[1:], Jac.build_edge(EdgeDir.OUT, None, None))
+    return root
+
+
+def main(num_nodes: int, processes: int) -> None:
+    """Run the benchmark."""
+    graph = publish(build(num_nodes))
+    gc.collect()
+    hubs = list(Jac.edge_ref(graph.root, EdgeDir.OUT, None, None))
+    start = time.perf_counter()
+    serial = []
+    for hub in hubs:
+        walker = Summer()
+        Jac.spawn_call(hub, walker)
+        serial.append(walker.total)
+    print(f"{'serial':<12} {(time.perf_counter() - start) * 1e3:>8.0f} ms")
+    for label, partitions in (
+        ("pool", None),
+        ("partitioned", range_partitions(graph, processes)),
+    ):
+        start = time.perf_counter()
+        found = spawn_parallel(
+            graph, [(Summer(), hub) for hub in hubs], partitions, processes
+        )
+        took = time.perf_counter() - start
+        assert [w.total for w in found] == serial
+        print(f"{label:<12} {took * 1e3:>8.0f} ms over {processes} processes")
+    graph.unlink()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 4,
+    )
@@ -0,0 +1,89 @@
+"""Benchmark finding nodes of a type through the registry against a walk.
+
+Usage: python scripts/benchmarks/bench_registry.py [nodes] [loops]
+"""
+import gc
+import sys
+import time
+from collections import deque
+
+from jaclang.core.construct import EdgeDir, Root
+from jaclang.core.registry import count, find
+from jaclang.plugin.feature import JacFeature as Jac
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True)
+class Plain:
+    """Benchmark node without registry."""
+
+    kind: int = 0
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True, tracked=True)
+class Tracked:
+    """Benchmark node with registry."""
+
+    kind: int = 0
+
+
+def walk(root: Root, cls: type, kind: int) -> list:
+    """Find nodes of cls with the given kind breadth first from root."""
+    seen = {id(root)}
+    todo = deque([root])
+    found = []
+    while todo:
+        for edg in todo.popleft()._jac_.out_edges or ():
+            nd = edg._jac_.target
+            if id(nd) not in seen:
+                seen.add(id(nd))
+                todo.append(nd)
+                if type(nd) is cls and nd.kind == kind:
+                    found.append(nd)
+    return found
+
+
+def main(num_nodes: int, loops: int) -> None:
+    """Run the benchmark."""
+    for cls in (Plain, Tracked):
+        root = Root()
+        start = time.perf_counter()
+        nodes = [cls(kind=i % 100) for i in range(num_nodes)]
+        took = time.perf_counter() - start
+        print(f"{cls.__name__:<8} create {num_nodes / took:>12,.0f} nodes/s")
+        for i in range(0, num_nodes, 100):
+            parent = root
+            for nd in nodes[i : i + 100]:
+                Jac.connect(parent, nd, Jac.build_edge(EdgeDir.OUT, None, None))
+                parent = nd
+        start = time.perf_counter()
+        for _ in range(loops):
+            found = walk(root, cls, 7)
+        took = (time.perf_counter() - start) / loops
+        print(f"{cls.__name__:<8} walk   {took * 1e3:>9.3f} ms {len(found):>8} nodes")
+        if cls is Tracked:
+            start = time.perf_counter()
+            find(cls, kind=-1)
+            took = time.perf_counter() - start
+            print(f"{cls.__name__:<8} index  {took * 1e3:>9.3f} ms")
+            start = time.perf_counter()
+            for _ in range(loops):
+                found = find(cls, kind=7)
+            took = (time.perf_counter() - start) / loops
+            print(
+                f"{cls.__name__:<8} find   {took * 1e3:>9.3f} ms"
+                f" {len(found):>8} nodes"
+            )
+            start = time.perf_counter()
+            for _ in range(loops):
+                total = count(cls)
+            took = (time.perf_counter() - start) / loops
+            print(f"{cls.__name__:<8} count  {took * 1e3:>9.3f} ms {total:>8} nodes")
+        del root, nodes, found
+        gc.collect()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+    )
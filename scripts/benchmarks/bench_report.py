@@ -0,0 +1,90 @@
+"""Benchmark reporting from a walker.
+
+A walker visits the products under a root and reports a dict per product:
+without reporting, into an unbounded buffer, into a bounded buffer
+spilling to disk, and streamed to a consumer thread while it runs, into
+a bounded buffer dropping values the consumer falls behind on.
+
+Usage: python scripts/benchmarks/bench_report.py [nodes] [limit]
+"""
+import sys
+import threading
+import time
+from typing import Optional
+
+from jaclang.core.construct import EdgeDir, Root
+from jaclang.core.report import ReportBuffer
+from jaclang.plugin.feature import JacFeature as Jac
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True)
+class Product:
+    """Benchmark node."""
+
+    name: str = ""
+    price: int = 0
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("step", None)], on_exit=[])
+class Lister:
+    """Walker reporting products."""
+
+    reporting: bool = True
+
+    def step(self, here: object) -> None:
+        """Report the product and move on."""
+        if self.reporting and isinstance(here, Product):
+            Jac.report({"name": here.name, "price": here.price})
+        Jac.visit_node(self, Jac.edge_ref(here, EdgeDir.OUT, None, None))
+
+
+def run(root: Root, buf: Optional[ReportBuffer], reporting: bool = True) -> float:
+    """Time a spawn reporting into buf."""
+    walker = Lister(reporting=reporting)
+    walker._jac_.reports = buf
+    start = time.perf_counter()
+    Jac.spawn_call(root, walker)
+    return time.perf_counter() - start
+
+
+def main(num_nodes: int, limit: int) -> None:
+    """Run the benchmark."""
+    root = Root()
+    Jac.connect(
+        root,
+        [Product(name=f"p{i}", price=i) for i in range(num_nodes)],
+        Jac.build_edge(EdgeDir.OUT, None, None),
+    )
+    print(f"{'no reports':<12} {run(root, None, False) * 1e3:>8.0f} ms")
+    print(f"{'unbounded':<12} {run(root, None) * 1e3:>8.0f} ms")
+    spilled = ReportBuffer(limit=limit, spill=True)
+    took = run(root, spilled)
+    assert len(spilled.values()) == num_nodes
+    print(f"{'spilled':<12} {took * 1e3:>8.0f} ms (limit {limit})")
+    streamed = ReportBuffer(limit=limit)
+    count = [0, 0.0]
+
+    def consume() -> None:
+        for _ in streamed:
+            if not count[0]:
+                count[1] = time.perf_counter()
+            count[0] += 1
+
+    thread = threading.Thread(target=consume)
+    thread.start()
+    start = time.perf_counter()
+    took = run(root, streamed)
+    thread.join()
+    assert len(streamed) == num_nodes
+    print(
+        f"{'streamed':<12} {took * 1e3:>8.0f} ms,"
+        f" first value after {(count[1] - start) * 1e3:.1f} ms,"
+        f" {num_nodes - count[0]} missed by the consumer"
+    )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 1000,
+    )
@@ -0,0 +1,112 @@
+"""Benchmark worker memory with a shared graph against per-worker copies.
+
+Each worker walks the whole graph, then reports its private (anonymous)
+resident memory. Copies are rebuilt in each worker from a pickle, as a
+worker loading the graph itself would; shared workers attach to one
+published segment.
+
+Usage: python scripts/benchmarks/bench_shared.py [nodes] [workers]
+"""
+import gc
+import multiprocessing
+import pickle
+import sys
+import time
+
+from jaclang.core.construct import EdgeDir, Root
+from jaclang.core.shared import attach, publish
+from jaclang.plugin.feature import JacFeature as Jac
+
+
+@Jac.make_node(on_entry=[], on_exit=[], slots=True)
+class Product:
+    """Benchmark node."""
+
+    name: str = ""
+    price: int = 0
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("step", None)], on_exit=[])
+class Summer:
+    """Walker adding up prices over the whole graph."""
+
+    total: int = 0
+
+    def step(self, here: object) -> None:
+        """Add price and move on."""
+        self.total += getattr(here, "price", 0)
+        Jac.visit_node(self, Jac.edge_ref(here, EdgeDir.OUT, None, None))
+
+
+def build(num_nodes: int) -> Root:
+    """Build a root with num_nodes / 100 hubs of 100 products each."""
+    root = Root()
+    for hub in range(0, num_nodes, 100):
+        kids = [Product(name=f"p{i}", price=i) for i in range(hub, hub + 100)]
+        Jac.connect(root, kids[0], Jac.build_edge(EdgeDir.OUT, None, None))
+        Jac.connect(kids[0], kids[1:], Jac.build_edge(EdgeDir.OUT, None, None))
+    return root
+
+
+def private_mib() -> float:
+    """Get the private resident memory of this process in MiB."""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("RssAnon:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def copy_worker(data: bytes) -> tuple[float, float, int]:
+    """Rebuild the graph from a pickle and walk it."""
+    base = private_mib()
+    start = time.perf_counter()
+    root = pickle.loads(data)
+    walker = Summer()
+    Jac.spawn_call(root, walker)
+    return time.perf_counter() - start, private_mib() - base, walker.total
+
+
+def shared_worker(name: str) -> tuple[float, float, int]:
+    """Attach to the published graph and walk it."""
+    base = private_mib()
+    start = time.perf_counter()
+    graph = attach(name)
+    walker = Summer()
+    Jac.spawn_call(graph.root, walker)
+    took, grown = time.perf_counter() - start, private_mib() - base
+    graph.close()
+    return took, grown, walker.total
+
+
+def main(num_nodes: int, workers: int) -> None:
+    """Run the benchmark."""
+    sys.setrecursionlimit(100_000)
+    root = build(num_nodes)
+    data = pickle.dumps(root)
+    graph = publish(root)
+    root = None
+    gc.collect()
+    print(f"{'segment':<8} {graph.shm.size / 2**20:>9.1f} MiB")
+    ctx = multiprocessing.get_context("fork")
+    for label, func, arg in (
+        ("copies", copy_worker, data),
+        ("shared", shared_worker, graph.name),
+    ):
+        with ctx.Pool(workers, maxtasksperchild=1) as pool:
+            results = pool.map(func, [arg] * workers, chunksize=1)
+        assert len({total for _, _, total in results}) == 1
+        took = max(t for t, _, _ in results)
+        grown = sum(m for _, m, _ in results)
+        print(
+            f"{label:<8} {grown:>9.1f} MiB private over {workers} workers,"
+            f" slowest {took * 1e3:>7.0f} ms each"
+        )
+    graph.unlink()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 4,
+    )
@@ -0,0 +1,120 @@
+"""Benchmark walker BFS traversal over chain, tree, grid and power-law graphs.
+
+Per-node cost should stay flat as the graph grows; a frontier or ignore set
+with linear-time operations shows up as per-node cost growing with size. The
+profiled column is the same walk with traversal statistics enabled.
+
+Usage: python scripts/benchmarks/bench_traversal.py [size ...]
+"""
+import random
+import sys
+import time
+from typing import Callable
+
+from jaclang.core.construct import EdgeDir
+from jaclang.core.profiling import TraversalProfiler
+from jaclang.plugin.feature import JacFeature as Jac
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+class Vertex:
+    """Benchmark node."""
+
+
+@Jac.make_walker(on_entry=[Jac.DSFunc("step", Vertex)], on_exit=[])
+class Bfs:
+    """Walker visiting every reachable node once."""
+
+    count: int = 0
+
+    def step(self, here: Vertex) -> None:
+        """Visit unseen neighbours."""
+        self.count += 1
+        nbrs = Jac.edge_ref(here, EdgeDir.OUT, None, None)
+        Jac.visit_node(self, nbrs)
+        Jac.ignore(self, nbrs)
+
+
+def link(src: Vertex, dst: Vertex) -> None:
+    """Connect two nodes."""
+    Jac.connect(src, dst, Jac.build_edge(EdgeDir.OUT, None, None))
+
+
+def chain(n: int) -> Vertex:
+    """Build a chain of n nodes."""
+    nodes = [Vertex() for _ in range(n)]
+    for a, b in zip(nodes, nodes[1:]):
+        link(a, b)
+    return nodes[0]
+
+
+def tree(n: int) -> Vertex:
+    """Build a binary tree of n nodes."""
+    nodes = [Vertex() for _ in range(n)]
+    for i in range(1, n):
+        link(nodes[(i - 1) // 2], nodes[i])
+    return nodes[0]
+
+
+def grid(n: int) -> Vertex:
+    """Build a square grid of about n nodes with right and down edges."""
+    side = max(2, int(n**0.5))
+    nodes = [[Vertex() for _ in range(side)] for _ in range(side)]
+    for r in range(side):
+        for c in range(side):
+            if c + 1 < side:
+                link(nodes[r][c], nodes[r][c + 1])
+            if r + 1 < side:
+                link(nodes[r][c], nodes[r + 1][c])
+    return nodes[0][0]
+
+
+def power_law(n: int) -> Vertex:
+    """Build a preferential attachment graph of n nodes."""
+    rnd = random.Random(7)
+    nodes = [Vertex(), Vertex()]
+    link(nodes[0], nodes[1])
+    targets = [0, 1]
+    for i in range(2, n):
+        nd = Vertex()
+        nodes.append(nd)
+        for t in {rnd.choice(targets) for _ in range(2)}:
+            link(nodes[t], nd)
+            targets.append(t)
+        targets.append(i)
+    return nodes[0]
+
+
+def main(sizes: list[int]) -> None:
+    """Run the benchmark."""
+    shapes: dict[str, Callable[[int], Vertex]] = {
+        "chain": chain,
+        "tree": tree,
+        "grid": grid,
+        "power-law": power_law,
+    }
+    print(
+        f"{'graph':>10} {'nodes':>9} {'visited':>9} {'ms':>10} {'us/node':>9}"
+        f" {'profiled':>9}"
+    )
+    for name, build in shapes.items():
+        for size in sizes:
+            start_node = build(size)
+            walker = Bfs()
+            start = time.perf_counter()
+            Jac.spawn_call(start_node, walker)
+            elapsed = time.perf_counter() - start
+            TraversalProfiler.enable()
+            start = time.perf_counter()
+            Jac.spawn_call(start_node, Bfs())
+            profiled = time.perf_counter() - start
+            TraversalProfiler.disable()
+            print(
+                f"{name:>10} {size:>9} {walker.count:>9} {elapsed * 1e3:>10.1f}"
+                f" {elapsed / walker.count * 1e6:>9.2f}"
+                f" {profiled / walker.count * 1e6:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(i) for i in sys.argv[1:]] or [1_000, 10_000, 100_000])
@@ -0,0 +1,77 @@
+"""Benchmark graph mutation throughput with the mutation log on and off.
+
+Usage: python scripts/benchmarks/bench_wal.py [mutations ...]
+"""
+import os
+import sys
+import tempfile
+import time
+from typing import Optional
+
+from jaclang.core.construct import EdgeDir, Root
+from jaclang.core.wal import MutationLog
+from jaclang.plugin.feature import JacFeature as Jac
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+class Account:
+    """Benchmark node."""
+
+    balance: int = 0
+
+
+@Jac.make_edge(on_entry=[], on_exit=[])
+class Transfer:
+    """Benchmark edge."""
+
+    amount: int = 0
+
+
+def mutate(top: Root, count: int) -> None:
+    """Do count mutations: a third connects, the rest field writes."""
+    accounts = [Account() for _ in range(count // 3)]
+    for acc in accounts:
+        Jac.connect(
+            top, acc, Jac.build_edge(EdgeDir.OUT, Transfer, (("amount",), (1,)))
+        )
+    for i, acc in enumerate(accounts):
+        acc.balance = i
+        Jac.assign_compr([acc], (("balance",), (i + 1,)))
+
+
+def run(count: int, log: Optional[MutationLog]) -> float:
+    """Time count mutations, logged if log is given."""
+    top = log.open(Root()) if log else Root()
+    start = time.perf_counter()
+    mutate(top, count)
+    if log:
+        log.sync()
+    elapsed = time.perf_counter() - start
+    if log:
+        log.close()
+    return elapsed
+
+
+def main(sizes: list[int]) -> None:
+    """Run the benchmark."""
+    modes: dict[str, dict[str, int]] = {
+        "write-through": {"buffer_size": 0, "checkpoint_every": 0},
+        "64k buffer": {"buffer_size": 1 << 16, "checkpoint_every": 0},
+        "checkpointed": {"buffer_size": 1 << 16, "checkpoint_every": 50_000},
+    }
+    print(f"{'mode':>14} {'mutations':>10} {'ms':>9} {'kops/s':>8} {'log kB':>8}")
+    for size in sizes:
+        base = run(size, None)
+        print(f"{'off':>14} {size:>10} {base * 1e3:>9.1f} {size / base / 1e3:>8.1f}")
+        for name, opts in modes.items():
+            path = os.path.join(tempfile.mkdtemp(), "bench.wal")
+            elapsed = run(size, MutationLog(path, **opts))
+            size_kb = (os.path.getsize(path) + os.path.getsize(path + ".ckpt")) // 1024
+            print(
+                f"{name:>14} {size:>10} {elapsed * 1e3:>9.1f}"
+                f" {size / elapsed / 1e3:>8.1f} {size_kb:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(i) for i in sys.argv[1:]] or [30_000, 300_000])